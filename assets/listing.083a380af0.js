@@ -0,0 +1,2 @@
+// فهرس المنتجات المختصر للشبكة - مولّد تلقائياً من generate_products.py
+const productIndex = {"shard_size":100,"shards":["8dc1f073e5","4c03f01ff3","596c17a5e7","128f349477","f9ce1c640f","39cdd57366","40efe18efa"],"image_prefixes":["https://media.taager.com/360x360/"],"rows":[[1,"عرض منشار كهربائى ببطارية + مفك براغى 48 قطعه شحن",92000,72000,[0,"2e4c6f23-cc2a-4139-bbb5-8fa91cdaea7f.png"],null],[2,"\"هاند بلندر 4 في 1 ضمان 6 أشهر \"",89000,69000,[0,"dee5f838-d840-4983-9fa5-067b23ad063e.png"],null],[3,"كشاف  بباور بانك الحديث",85000,65000,[0,"3b2ec220-b6cf-486d-8c5e-e61086bd3f1c.png"],null],[4,"مينى سكوتر",194500,174500,[0,"3091fd21-eca1-4327-afbc-5c0843e09f49.jpg"],null],[5,"تابلت اير تاب U 25 Pro مزود بكيبورد وماوس مساحة 1 تيرا 10 بوصة",144000,124000,[0,"f045ecd5-e57c-48f1-90d9-7d57c5e8aef9.jpg"],null],[6,"عرض حقيبة الجيم المغناطيسية + زجاجة مياة استانلس مع حامل موبيل مغناطيسى",93000,73000,[0,"fddf1ea3-5ef1-40c1-841c-ed6566301aef.jpg"],null],[7,"كشاف طاقة شمسية 9 لمبة  Solar Sensor Light",80000,60000,[0,"a3351bc3-49c5-4497-8123-a3b7a5f1f85b.png"],null],[8,"عرض خرطوم مياه قابل للتمدد Magic Hose  + الفرشاة الدوارة لتنظيف جميع الاسطح",82000,62000,[0,"8ae93e5a-adf9-4fec-b23c-181062aace7f.jpg"],null],[9,"هاند بلندر 5  في 1 Sokany ضمان عام",89000,69000,[0,"e9f36bd2-ea4f-4880-87d1-73d6429d8bc4.jpg"],null],[10,"محضرة قهوة  كهربائية + كوب ستيل 2 في 1",87000,67000,[0,"3d78ad0a-44d3-409e-b49e-4ee98402edbe.jpg"],null],[11,"تابلت اير تاب AirTab PUBG Tablet PG02 بزود بكيبورد وماوس مساحة 1 تيرا 10 بوصة",161000,141000,[0,"e4c67942-2642-49c6-bd4d-3e3f545c41bb.png"],null],[12,"مكنسة جاف و رطب القوية Hitachi 45 لتر",119000,99000,[0,"f2c1d63b-d96e-4794-b19d-7873c5ae2775.jpg"],null],[13,"كرسى هزاز للاطفال",130000,110000,[0,"90ecb4df-9158-4e27-94d6-bace63bbd09a.png"],null],[14,"عرض وسادة سيارة للرقبة واسفل الظهر + منظم لمقعد السيارة الخلفي مع حامل اكواب وصندوق مناديل",91000,71000,[0,"07a74066-197e-4e3f-950f-45c569baef5a.jpg"],null],[15,"عرض ماكينة KEMEI كيمي 5 في 1 + ماكينة حلاقة الظهر الترند",99000,79000,[0,"401610bf-2088-4122-9893-3cb873df63f2.jpg"],null],[16,"عرض ممسحة كهربائية قابلة لاعادة الشحن + قطعتين ستارة مغناطيسية عازلة للحشرات",96000,76000,[0,"bab8dbd8-1165-4c9f-b5e3-180101d9c5d7.jpg"],null],[17,"عرض الأربطة المرنة للتمارين الرياضية بقوة 11 كجم + جهاز تمارين الملاكمة الموسيقى",112000,92000,[0,"beb0e9bc-28a0-4111-8dc1-63fa8f308524.png"],null],[18,"فرشاة تدليك و مساج الراس",91000,71000,[0,"c7b599bd-85b9-4954-9e6b-8e8bdcf0292f.png"],null],[19,"تابلت 17 air",122000,102000,[0,"aef86227-bd35-4e97-b008-69dac9bebaf3.jpg"],null],[20,"سيارة كهربائية جو كارت للاطفال الجديثة",140000,120000,[0,"14438e4b-339b-477e-bdf1-051630885bb6.png"],null],[21,"الفرشاة الدوارة الاصلية ENZO",98000,78000,[0,"4435467d-2c41-4479-a7ed-15e91923c694.jpg"],null],[22,"موقد 4 عيون بستاند",126000,106000,[0,"67ec1850-07f6-4b3c-be34-dfd5f3af5078.jpg"],null],[23,"كرسي استراحة هزاز",143000,123000,[0,"b529d4d9-c730-4611-aa0a-9dd60b59e170.png"],null],[24,"\" عرض خلاط Silver Crest الالماني + طاحونة + محضرة طعام 3 لتر + عصارة فواكهه تعمل بالشحن  \"",103500,83500,[0,"51357d02-7d9d-49a9-8722-52501039852a.png"],null],[25,"محضرة طعام 3 لتر",85000,65000,[0,"138eae05-4ed2-4c26-ba11-14b030fe8a46.jpg"],null],[26,"الة صنع الايس كريم (الموطة) ضمان 6 أشهر",85500,65500,[0,"331782aa-45fa-49a2-af12-43555ef65f6c.png"],null],[27,"ماكينة غزل البنات",85500,65500,[0,"ae224593-ec1f-4186-8c8d-9f6c7a4fabe5.png"],null],[28,"Air Tab T808 Pro Ram 16GB Rom 1TB تابلت",125000,105000,[0,"c6bade96-336e-4697-9284-a7dca4c81a96.png"],null],[29,"Air Tab U09 Pro Ram 16GB Rom 1TB تابلت",130000,110000,[0,"ae2cd71e-3d6c-4056-9697-ec1e182ffcbf.png"],null],[30,"مبرد محمول بباور بانك 3 في 1",86000,66000,[0,"93d90bce-ee60-41ac-af9c-874e4e2d41b7.png"],null],[31,"استاند استحمام للاطفال",99000,79000,[0,"57de51a9-fc5a-4c6f-a4c0-e3a183fe5e61.png"],null],[32,"منظم لمقعد السيارة الخلفي مع حامل اكواب وصندوق مناديل",85000,65000,[0,"1e516b87-122e-4650-82a1-4f00db7dc2bd.png"],null],[33,"مسند يد مع حامل اكواب لون بيج",79000,59000,[0,"8f84d735-1564-4b74-a3e4-ad23de4671f2.jpg"],null],[34,"مسند يد مع حامل اكواب لون اسود",78000,58000,[0,"5683e4fe-7f30-4e41-91b7-fdbb6a7db6fa.jpg"],null],[35,"قفازات العلاج الطبيعي (ايسر)",158000,138000,[0,"8e87d241-779e-41ce-baaa-5a8468c67fc0.png"],null],[36,"قفازات العلاج الطبيعي (ايمن)",158000,138000,[0,"56d2163a-f419-4ba7-9140-3ff4dd638075.jpg"],null],[37,"عرض قطعتين فلتر  مياة سهل التركيب",78000,58000,[0,"5f89bb8b-db20-4ef2-a2f6-14495c19c48e.png"],null],[38,"عرض الة صنع الايس كريم (الموطة) + شريط الألمنيوم اللاصق المقاوم للماء والحرارة (هدية)",87000,67000,[0,"f343d9f4-fd56-4f8b-bef5-085a4ea473ad.png"],null],[39,"عرض معالج شروخ الزجاج + مزيل خدوش السيارات الامريكى الحديث",73000,53000,[0,"4e9dc995-1475-49f1-b787-a9065efa20f0.jpeg"],null],[40,"ماكينة صنع Ice Cream بضمان عام",110000,90000,[0,"ee03507c-4c1f-42dc-a788-f49e7393401e.png"],null],[41,"كشاف طاقة شمسية للحائط",84000,64000,[0,"b9052702-7de1-4fec-8afc-c03e94f4890d.jpg"],null],[42,"مكييف هواء منزلي صحراوي 10 لتر ضمان 6 أشهر",124500,104500,[0,"ebe63b27-b929-4c6a-a267-59567236d4f8.jpg"],null],[43,"ماكينة قص وتشذيب صوف الغنم والسجاد",113500,93500,[0,"7002379d-84b6-4906-be1a-09d403584534.jpg"],null],[44,"محول كهرباء ذكى يعمل بالشحن مع 2 بطارية",98500,78500,[0,"fd663306-db60-410d-8d06-8df07c1113a6.png"],null],[45,"قلم الميكروبيلدنج الثابت",70000,50000,[0,"06982096-7a69-4550-9ce5-6cc33780201e.jpg"],null],[46,"مبردة هواء عمودية",100000,80000,[0,"3b3dc9ea-c9aa-4a17-a6ab-98ef8f0e1d6b.jpeg"],null],[47,"زجاجة مياة استانلس مع حامل موبيل مغناطيسى",82000,62000,[0,"3b6bc04b-31cb-4191-a895-32f6e11860b8.jpg"],null],[48,"Air Tab A19 Ram 16GB Rom 1TB تابلت",130000,110000,[0,"bf4e208a-5d97-4c1b-b8ae-7d483d32b133.png"],null],[49,"Air Tab U08 Pro Ram 16GB Rom 1TB تابلت",131000,111000,[0,"ef6b1fbb-e83a-4bdc-b599-5c4622591071.jpg"],null],[50,"مكييف صحراوي 25 لتر ضمان 6 أشهر",149500,129500,[0,"c67012ea-89d5-4939-854a-57df7e0d1ce3.png"],null],[51,"مسدس اللحام",120000,100000,[0,"ab54cc4d-5d6b-468f-826d-0af6de1f51e7.jpg"],null],[52,"زيت نمو اللحية",79000,59000,[0,"07e9c813-cca1-479f-84e2-1d5c6dba9013.jpg"],null],[53,"مكييف صحراوي 10 لتر Solar Air Conditioning",152000,132000,[0,"6b3ba243-4f8d-4474-91dc-f70065c6dcd9.jpg"],null],[54,"مسدس تعقيم محمول",92000,72000,[0,"94ce4501-3f6e-45f9-b362-be57b61f82e8.png"],null],[55,"\"ممسحة كهربائية قابلة لاعادة الشحن\"",97000,77000,[0,"e5f85620-1988-4337-8a5c-8bf1aa04c12a.png"],null],[56,"• ثلاجه سيارة محمولة",91000,71000,[0,"49f99f7b-00da-42ea-9a89-8af41b23dbd8.png"],null],[57,"ماكينة صنع ايس كريم الحديثة Soft Ice Cream",128000,108000,[0,"8d6ae4a2-7d7a-445b-96ae-9f09516f54e0.jpg"],null],[58,"مكنسة ولمامة 2 في 1 الترند",95000,75000,[0,"678cc7fe-99dd-4d8f-852d-97891e4b2318.png"],null],[59,"\"لعبة بيكل بول\"",114000,94000,[0,"c528d427-f573-4b60-b6c6-1d5cb1cc58ab.jpg"],null],[60,"كشاف فحص LED بالأشعة فوق البنفسجية",93000,73000,[0,"4e3bb5ae-80d4-422f-a93d-7d93b1073e8b.jpg"],null],[61,"كاميرة مراقبة 360 درجة  تعمل بالطاقة الشمسية مزودة بشريحة",119000,99000,[0,"8295c5d3-2efd-47b9-8770-cbefd8beddbf.png"],null],[62,"حقيبة الجيم المغناطيسية",87000,67000,[0,"7f5890f0-73ab-4305-8deb-c0a881e0d2d5.png"],null],[63,"مبردة صغيره محمولة Turbo Fan",86000,66000,[0,"62e32666-8a87-40f0-a95f-4f61257a7820.png"],null],[64,"قفل باب ذكي Smart Lock",128000,108000,[0,"3263690a-820e-4e24-81ab-bb02241a1d79.png"],null],[65,"دوش محمول مع مضخة",93000,73000,[0,"1976b69e-cb6a-4ae0-8291-8d198fa85c41.png"],null],[66,"صانعة الثلج للسياره و المنزل",135000,115000,[0,"f3a495b5-1004-4aa8-bc91-4880196893d7.jpg"],null],[67,"بانكة تعمل بالطاقة الشمسية",100000,80000,[0,"d1226ad1-a25e-4a82-9944-80fc21503a5c.png"],null],[68,"• جهاز تمارين الملاكمة الموسيقى الحديث",79000,59000,[0,"767a24e8-2e17-4e7a-8635-780580ea073e.png"],null],[69,"عكاز ب كشاف 2 في 1",90000,70000,[0,"90f4fd60-a081-48c7-8d33-b911ae53df98.jpg"],null],[70,"جهاز تصحيح الظهر و الرقبة",78500,58500,[0,"0730f512-98d2-4dc8-97b1-344833509ea6.jpg"],null],[71,"• خيوط الكولاجين",74000,54000,[0,"188ebd8e-c909-462f-8d87-96a53064c5cc.png"],null],[72,"دمية ستيتش",83500,63500,[0,"77b243d4-3252-4613-8a42-d038e1e7c0c1.jpg"],null],[73,"مبردة هواء عمودية بريموت كنترول DENX  ضمان 6 أشهر",96000,76000,[0,"f0b2d6d0-a029-4eee-9932-23a0fded63f6.jpeg"],null],[74,"رشاش الفقاعات الكهربائى 64  فتحة",85500,65500,[0,"10857fb9-fde6-492e-84ea-e5c4ee8f8942.png"],null],[75,"ديسبنسر كهربائي محمول",91000,71000,[0,"25dff8a8-d6c3-472b-bd66-ad63efa7c306.jpg"],null],[76,"سبراي تبريد متعدد الاستخدامات",75000,55000,[0,"e67f43a8-c654-4199-be5f-88dd20f2a2ab.jpg"],null],[77,"Labubu",87000,67000,[0,"6ec79465-5de3-4b22-b260-dbf40ddf8d42.png"],null],[78,"عرض عبوتين لاصقات ازالة آلام المفاصل",83500,63500,[0,"0a66284e-5d2f-4ca9-be57-4e88379da5c8.png"],null],[79,"عرض 10 لاصقات لازالة آلام المفاصل",74000,54000,[0,"d0cbfbd5-3ee9-4c6c-b76e-0bc4dae96ea3.png"],null],[80,"عرض LED Smart Sound Control + ليزر الحفلات Star Shower",86000,66000,[0,"73f2ea21-c1a6-410b-ac89-996d9f01157a.png"],null],[81,"الجهاز الذكى متعدد الاستخدام للسيارة 5 فى 1",190000,170000,[0,"2099c621-22e7-4586-89f6-6558b2d6cbad.jpg"],null],[82,"ماكينة الحلاقة و التنعيم المحمولة المقاومة للماء",86000,66000,[0,"cceb177f-e0ce-4bd1-b911-354cb8849e81.jpg"],null],[83,"• ثلاجة محمولة متنقلة 4 لتر للسيارة و المنزل",92000,72000,[0,"d78d2ee8-22e8-4fec-9ee9-194da73909e4.png"],null],[84,"عدة الشحن المتكاملة 8 قى 1",165000,145000,[0,"3d8a68a5-829c-4595-9fe9-1d90832c893b.png"],null],[85,"حامل للهاتف لتتبع الوجه 360 درجة",88000,68000,[0,"1d838b3d-91d8-44c2-b0a1-200e1177fc4c.jpg"],null],[86,"مبرد موبايل  ماجنتيك MEMO CX06",82000,62000,[0,"c070a6a1-73b2-4bdc-85a7-c8695b204e08.jpg"],null],[87,"سيارة كهربائية للاطفال الحديثة",125000,105000,[0,"b9d8d0a4-ceb5-47cd-91c7-a0137e20fe26.png"],null],[88,"Botox face serum",77750,57750,[0,"7364a806-e61d-4382-bbe9-51c1058af96e.png"],null],[89,"عرض  ( صانعة الثلج الفورية 2 لتر + بانكة متحركة تعمل بالشحن هدية )",158000,138000,[0,"fcbceb79-112c-4c72-9022-8a7a1af918d1.png"],null],[90,"حامل موبيل متحرك 360 درجة",77000,57000,[0,"c8595550-d494-4b63-9068-1f01ae596c34.jpg"],null],[91,"مسبح عائلى قابل للنفخ + منفاخ",115000,95000,[0,"6b35a329-2966-48ed-8616-ed3f2664ada8.jpg"],null],[92,"منفاخ يدوى",77000,57000,[0,"85f27ad4-e7a6-4aa3-b719-5d0bea82cabf.jpg"],null],[93,"مسبح عائلى قابل للنفخ",117500,97500,[0,"56dd2b64-b5c9-42b2-8307-e92486c53e75.png"],null],[94,"عرض مكنسة روبوت Smart Home + بانكه متحركه تعمل بالشحن",91000,71000,[0,"6df4dc48-21c9-4347-a182-c1f828f2c261.jpg"],null],[95,"عرض موقد الشواء 3 ادوار متعدد الوظائف + جدر الضغط 2 في 1",127000,107000,[0,"20188d9c-79fe-4f28-933f-e6210a600fc9.png"],null],[96,"عرض جهاز صانع الداطلي يعمل بالشحن + ماكينة صنع البيتيفور",112000,92000,[0,"e50739ad-5258-4404-b955-cf9270f4b225.png"],null],[97,"عرض( فرشاة فرد الشعر التريند + زيت اكليل الجبل )",84000,64000,[0,"69e218fa-bf52-4cbb-90be-66aeafda7694.jpg"],null],[98,"اداة تحسين التنفس اثناء النوم",82500,62500,[0,"e3e0ba64-4304-4432-857a-6cd9f12a7811.png"],null],[99,"ثلاجة محمولة متنقلة 8 لتر للسيارة و المنزل DENX ضمان 6 أشهر",102000,82000,[0,"8de52029-fdb3-4b35-a901-e7566200573a.png"],null],[100,"طارد الهواء النفاث للتنظيف والتجفيف الحديث",85500,65500,[0,"0fe3e935-1c46-4c8a-9d48-7a974c56a388.jpg"],null],[101,"عرض قنفة نفخ ترند + مضخة هواء محمولة صغيرة  للشفط و النفخ DLC",96000,76000,[0,"59fd0af8-918f-43b5-b604-540ef7d4ce95.png"],null],[102,"• مقص كهربائي يعمل بالبطارية",100000,80000,[0,"a5baae0e-59b7-4cc8-a0d2-7bc91a9f7b48.png"],null],[103,"عرض BARDEFU  6 IN 1 خلاط + صانعة الثلج الفورية",193000,173000,[0,"3e57dd8a-d821-459d-9c06-d1fe9f3a5aa4.png"],null],[104,"BARDEFU  6 IN 1 خلاط + عصارة فواكهه تعمل بالشحن",120000,100000,[0,"8e397a18-d2bf-4d13-8553-37a77b6d4777.png"],null],[105,"مكنسة روبوت Smart Home ضمان 6 أشهر",85000,65000,[0,"09dc5d16-828d-4bf9-9786-cccf0833dd38.png"],null],[106,"تابلت ايرتاب A08 بذاكرة 1 تيرا",128000,108000,[0,"ea13bb71-cf21-4935-a28a-b3744cf5ab86.jpg"],null],[107,"قدر بديل الطباخ الكهربائي ضمان 6 أشهر",101000,81000,[0,"7e3da76a-5e5f-4c16-8a04-e728c31d9e0e.jpg"],null],[108,"عصا الدرامز الهوائي",109000,89000,[0,"ecd4ca35-3587-4711-9356-5fb11b4d3ad6.jpg"],null],[109,"الدرامز المحمول الحديث",111000,91000,[0,"504b3e37-4bc4-4043-8aa0-72ef2545b68b.jpg"],null],[110,"بيانو مزود بمايك",87000,67000,[0,"c3257e70-5084-45a5-9261-8b89f6bfe02a.jpg"],null],[111,"جهاز مساج حراري 3 في 1 للركبة و الكتف و الساعد",90500,70500,[0,"86f85634-afa1-4208-b75b-b1cb954be7d1.jpg"],null],[112,"ماكينة حلاقة KEMEI 1910 الاصلية",81000,61000,[0,"856dc290-0881-4a8b-8bbf-710ee19f4902.png"],null],[113,"الفرشاة الدوارة الاصلية",83500,63500,[0,"c6e840c0-ce7d-4b0b-be11-e6e5489da691.png"],null],[114,"عرض 2 قطعة خيوط الكولاجين",81000,61000,[0,"79395aea-abe7-48f5-95ea-8607d37b037e.jpg"],null],[115,"الأربطة المرنة للتمارين الرياضية بقوة 11 كجم",82000,62000,[0,"6fef7a05-df6d-4f39-b6d7-ad73710173ac.jpg"],null],[116,"ضمان 6 أشهر ماكينة صنع Ice Cream Silver Crest",107000,87000,[0,"985345e0-9e02-4c62-ac4e-603628f62c02.jpg"],null],[117,"\"عرض 2 قطعة   Neo hair lotion 120m لوشن نيو هيرلتجديد الشعر التالف 120 مل\"",74500,54500,[0,"ed7ab9d7-8916-40b4-babc-870b9cbd5389.jpg"],null],[118,"ستاند ملابس زوجي",82000,62000,[0,"122aa592-f295-416c-812b-bdbfa9621606.jpg"],null],[119,"مقبس كهربائي ذكي يعمل مع اليكسا و جوجل هوم",85000,65000,[0,"daa9e0be-2577-4bde-aa9f-927287e70e8c.png"],null],[120,"لعبة نط الحبل بريموت للكبار و الاطفال",82000,62000,[0,"a53cbc1d-4ada-4287-bb95-4c1365f7764c.png"],null],[121,"عرض 3 قطعة شامبو ساكورا",82000,62000,[0,"c64717e0-12f7-4e1a-ac2e-4e1e7940b96d.png"],null],[122,"عرض 2 قطعة شامبو ساكورا",80000,60000,[0,"dcc40f2a-2222-4098-8ed7-557016f228dc.jpg"],null],[123,"عرض قطعتين وسادة سيارة للرقبة واسفل الظهر",95000,75000,[0,"50ceb7d6-efbe-4d41-8e8f-82a11b759c07.jpg"],null],[124,"عرض 2 قطعة  Children Nebulizer",77000,57000,[0,"06800d9d-604e-4c5d-9049-8e999358045b.png"],null],[125,"عرض( فرشاة مساج الراس 2 في 1 + زيت اكليل الجبل )",93500,73500,[0,"d5fedd6c-ad79-4675-a698-32c685dbb4bb.png"],null],[126,"• صاعق حشرات بقاعدة قابل لأعادة الشحن",78000,58000,[0,"637a14bc-acd0-4027-86df-cb5295674a56.jpg"],null],[127,"• Mini Portable Air Cooler مبرد محمول",97000,77000,[0,"3f48c58f-100d-428f-8093-a2059bc13252.png"],null],[128,"\"مكييف هواء سبليت و تدفئة 2 في 1 الحديث Silver Crest \"",94000,74000,[0,"5f21f1f1-1a1d-4266-8bc3-fea2efb011ae.jpg"],null],[129,"عرض قطعتين كرسي محمول قابل للطي",87500,67500,[0,"4dda8210-28f2-4f26-a6db-80cff27bf5bc.png"],null],[130,"عرض قطعتين مروحة ببطارية",105000,85000,[0,"ec6400a6-923b-49fc-a0e9-c4b1c8a91eeb.png"],null],[131,"• مروحة ببطارية",88500,68500,[0,"c3c61000-fb1b-4a28-9b9b-6fa5843ab239.png"],null],[132,"مضخة هواء محمولة صغيرة  للشفط و النفخ  LC",77000,57000,[0,"67c1010a-231b-4b8d-8189-1d2fce88e78a.png"],null],[133,"• كشاف Super Bright ببطارية ليثيوم",85000,65000,[0,"f5ecfd24-f731-4d3f-8e22-44e4e1c24395.png"],null],[134,"• جدر ضغط 2 في 1",93000,73000,[0,"cdf2e052-9a1d-4226-b75e-d49a1c77c41a.png"],null],[135,"• rosemary hair care",78500,58500,[0,"c5525239-8d9a-48a1-b0de-598a981c8a20.png"],null],[136,"شفاط سحري Inline Fan Electric + انبوبة المونيوم لتركيب الشفاط ضمان 6 أشهر",98000,78000,[0,"69299f10-5c57-44d7-b8e3-3877f98c2248.png"],null],[137,"• خيمة اطفال",77000,57000,[0,"bcb75713-c4f5-4bde-a2e1-2db2572cdd34.jpg"],null],[138,"عرض مقص كهربائي يعمل بالبطارية + منشار كهربائى",114000,94000,[0,"58c06cb6-9bd5-4e1b-a2c6-285e3e8266c0.png"],null],[139,"• مضخة حليب لاسلكية للرضاعة الطبيعية",93500,73500,[0,"29152ff3-ad70-4d94-b958-012c00691a5f.png"],null],[140,"• منفاخ الهواء الخارق",95000,75000,[0,"deeed73f-72f0-41e8-bd71-c58f215a041b.png"],null],[141,"• الداعم السحرى التلسكوبى",74000,54000,[0,"2007a3f7-1294-41dd-bdeb-efee8b79c720.png"],null],[142,"عرض قطعتين مسن سكاكين اللكتروني",79000,59000,[0,"4ec86185-a3c0-45fc-ba92-891f77a5d96f.png"],null],[143,"• مكنسة روبوت  App Control",107000,87000,[0,"ca0dd2df-f975-4861-a2d1-321f9f56c911.jpg"],null],[144,"• جهاز تعقيم و أذابة اللحوم 4 في 1",85000,65000,[0,"95a44d39-44a1-497d-9fbd-109866d59dc9.png"],null],[145,"• مساحة ببخاخ الترند",82000,62000,[0,"a6ddef93-3494-435f-97fb-72e81f4ea312.png"],null],[146,"• ماكينة لحام امريكية 950 امبير DeWALT",112000,92000,[0,"7bacdc89-efbd-4d00-852c-86f182232318.png"],null],[147,"عرض قطعتين ستارة مغناطيسية عازلة للحشرات",73000,53000,[0,"0b717600-6f5f-4b8a-bfac-687cd1460af1.png"],null],[148,"عرض قطعتين بانكه سقف بمصباح LED",89000,69000,[0,"66764a0a-90a2-43aa-b2ee-a747eed122cd.png"],null],[149,"عرض قطعتين بانكه متحركه تعمل بالشحن",90000,70000,[0,"17721c4b-d4b7-463c-b7d0-02c6d951db31.png"],null],[150,"• جهاز غلق الاكياس و حفظ الطعام Vacuum",73000,53000,[0,"988ecd59-e809-47c8-b7ac-c578e7ef5c7c.png"],null],[151,"• قطاعة الخضروات الحديثة Veggie Slicer",76000,56000,[0,"fe558b39-875e-4c0a-b24d-a3e5404ccf6d.png"],null],[152,"• خاتم التسبيح الذكي",79000,59000,[0,"5e5b5306-ead6-4d19-8cd0-df7b787d8cc1.png"],null],[153,"• خاتم التسبيح الذكي",84000,64000,[0,"0ef7efe4-d989-49ed-9a57-0a879a0b9d7d.jpg"],null],[154,"• خاتم التسبيح الذكي",79000,59000,[0,"8560aa65-2146-4e21-9177-58ee54e331a0.png"],null],[155,"• شفاط مخاط للاطفال يعمل بالشحن",82000,62000,[0,"e07c9277-680e-44df-86f3-00da5974eae2.jpg"],null],[156,"• مبخرة الكترونية",80000,60000,[0,"acdb80a5-cc0b-4d53-bd87-11d3457fbd84.png"],null],[157,"ستارة فروع مضيئة",75000,55000,[0,"988fe678-8e20-4c7f-adb2-65e68e5b65b1.jpg"],null],[158,"• شاحن سيارة 4 فى 1",83000,63000,[0,"9c4c8e63-c128-400c-80c2-851104bb805a.png"],null],[159,"• اداة تحويل الدريل لمنشار",74000,54000,[0,"3192e2f1-12d9-4f46-a791-89e0f73dc028.jpg"],null],[160,"• جهاز صانع قناع العيون و الوجه",74250,54250,[0,"8b8b8462-b97a-4786-a98c-6fd639d2a10f.png"],null],[161,"• ماكينة حلاقة كيمي 1910",76250,56250,[0,"bdf433b8-5d5c-4989-9d50-188aafc4feb2.jpg"],null],[162,"• مفرش تخم بوهيمي (5 قطع ) 10 مقاعد لون رمادي غامق",111000,91000,[0,"e50c06ba-8757-4deb-b911-968a9596d91b.png"],null],[163,"• مفرش تخم بوهيمي (5 قطع ) 10 مقاعد لون رمادي فاتح",111000,91000,[0,"2886b7f9-3cd9-4aa5-8402-7b530b440325.png"],null],[164,"• مفرش تخم بوهيمي (5 قطع ) 10 مقاعد لون بني",111000,91000,[0,"cd370e2c-96f2-4d4d-bd78-1712aadb14f7.png"],null],[165,"• كوسرة المانية تعمل بالشحن",89000,69000,[0,"63f41656-68f6-4c33-b486-6e8f6e1aea20.png"],null],[166,"• سمارت ليد USB",78000,58000,[0,"cd3b42af-00a7-4a46-892c-fa734c3ba3a4.png"],null],[167,"جهاز صانع الداطلي يعمل بالشحن JANO ضمان 6 أشهر",108000,88000,[0,"70035eb4-525d-4133-ab5a-273924febb86.png"],null],[168,"• كيبورد و ماوس وايرليس",81000,61000,[0,"7450693f-1dc3-455e-9655-fa29ab073ae0.png"],null],[169,"الطاحونة القوية Silver Crest ضمان 6 أشهر",92000,72000,[0,"85d6cf82-5f6d-4559-bcfe-09f6c5283464.png"],null],[170,"عرض كوري القهوة السريعة + قطاعه الخضروات الامنه  4*1",79500,59500,[0,"2a4c9193-73d6-4bd4-be82-80d8c9846c35.png"],null],[171,"• ماكينة حلاقة الظهر الترند",76000,56000,[0,"5012ed42-85ed-45f4-a66f-4593eb3a15ed.png"],null],[172,"• هاتف نوكيا 105  بشريحتين",79000,59000,[0,"2b3ae73a-5b99-4ac8-8ba0-579ab73fe854.png"],null],[173,"• هاتف نوكيا 6310 بشريحتين",86000,66000,[0,"5decf651-ce0a-4a8b-8cbd-b36cbd598105.png"],null],[174,"• مصفاة وعجان 3 في 1",78000,58000,[0,"01858456-7371-4074-a5e5-9fcfef004cb1.png"],null],[175,"• محول طاقة للسيارة",74000,54000,[0,"b2f5f3c6-1924-462f-a940-d642d3a28fcd.png"],null],[176,"• تابلت A20",107000,87000,[0,"8774a64c-b4cc-40f1-8b97-97fc26664860.jpg"],null],[177,"• كرسي هاند باج محمول",81000,61000,[0,"4adc9a65-4c66-441d-bbb9-c0c9ac9424ac.png"],null],[178,"• مساحة زجاج شحن وايرليس الترند",105000,85000,[0,"552b04cf-8ae3-433e-9a43-4a5809bce014.png"],null],[179,"• منظم ملابس زاوية",79000,59000,[0,"09ed0860-1b25-47e9-8d59-29548b410d79.png"],null],[180,"• مكواة لحام كهربائية",82000,62000,[0,"f927297a-7bf0-4720-aa2c-208fe254b0c2.png"],null],[181,"هاند بلندر 4 في 1 ضمان 6 أشهر",89000,69000,[0,"80feee89-a41e-4616-be1d-0d656c47274f.png"],null],[182,"عرض ( wireless hair straghtner + زيت اكليل الجبل)",85000,65000,[0,"3d88868b-877d-4a68-a67d-1c99c7084020.jpg"],null],[183,"• مساعد دوشك نفرين طبي + 2 كيس خدادية + شرشف رصاصي",123000,103000,[0,"60de3036-9c6e-41bb-9c8d-a722890c141a.jpg"],null],[184,"• مساعد دوشك نفرين طبي + 2 كيس خدادية + شرشف ابيض",123000,103000,[0,"28329425-73f2-455d-aeba-061af1dc0cf6.jpg"],null],[185,"• مساعد دوشك نفرين طبي + 2 كيس خدادية + شرشف بيج",123000,103000,[0,"ce4f7104-dd12-40cc-89a7-51103cbb7d8b.jpg"],null],[186,"BARDEFU 6 IN 1 خلاط ضمان 6 أشهر",105000,85000,[0,"10dbda4b-4dfe-4e6e-be23-92b01c9ae589.png"],null],[187,"• ماكينة KEMEI كيمي 5 في 1",92500,72500,[0,"4d68d8ac-8a3b-498f-8614-bc80ca1a5ac9.png"],null],[188,"• Smart watch with airpods",105000,85000,[0,"20db6ae3-d34c-45e4-9805-90be4d2d8c52.png"],null],[189,"طباخ تاتش Silver Crest ضمان 6 أشهر",87000,67000,[0,"d3f3a700-c7e5-4c6e-950a-072d14e4b8fe.png"],null],[190,"• ماكينة صنع البيتيفور",72000,52000,[0,"844962c6-a8d7-4b9e-915a-7a27de32a187.png"],null],[191,"عصارة برتقان كهربائية RAF ضمان 6 أشهر",93500,73500,[0,"7988774f-7112-4db8-b394-0bfe1bf3f440.jpg"],null],[192,"عرض 2 قطعة زجاجة و منظم دواء 2 في 1",81000,61000,[0,"54e97f47-1e8a-4939-bc16-50b3675daa88.png"],null],[193,"عرض 3 قطع زجاجة و منظم دواء 2 في 1",84000,64000,[0,"71fe2492-fb95-4c6d-8524-34c73a09b874.png"],null],[194,"عرض 3 فوطه مايكروفايبر للمنزل و السيارة   35 سم * 27 سم",70550,50550,[0,"d9beca0e-73aa-468a-bec2-c00d9383c59d.jpg"],null],[195,"• مساحة زجاج مغناطيسية مزودجة",75000,55000,[0,"cf9bd81a-5747-4631-ba6c-614bd6717119.jpg"],null],[196,"عصارة بالطرد المركزي للفواكهة الكاملة Silver Crest ضمان 6 أشهر",93000,73000,[0,"df595227-3e02-4bd1-86d6-10e6e1de40a0.png"],null],[197,"• كشاف سينسور يعمل بالطاقة الشمسية",76000,56000,[0,"cb9d4d32-2bc9-4a43-8229-b15285606957.png"],null],[198,"• المبخرة الالكترونية مع القرأن الكريم",83000,63000,[0,"0a93e432-23db-427c-84d4-98c14acb9ab8.jpg"],null],[199,"• مسدس الغسيل لسيارة بالفوم ب 2 بطارية",92000,72000,[0,"44bf76a0-5c43-4323-a6a1-2b41efeec647.png"],null],[200,"• Children Nebulizer",80000,60000,[0,"e0d1bcc6-fe6d-41c1-98c5-e3992517a30f.png"],null],[201,"• سجادة صلاة بمسند للظهر",79000,59000,[0,"ddc1d2ee-735c-49a8-8408-2dfa2367704f.png"],null],[202,"جهاز تنظيف بالبخار RAF ضمان 6 أشهر",95000,75000,[0,"07a1af20-eb18-4e89-b9bd-6e0de02f44cf.png"],null],[203,"• Game TV Stick 8K",98000,78000,[0,"251e304d-2dd6-47d8-9759-f7fd31904ca5.png"],null],[204,"عرض قطعتين ماكينة التنعيم الصغيرة",81500,61500,[0,"fd9a2442-7047-4a09-93f3-6f8d687a08e7.png"],null],[205,"• مسدس رش الدوكو يعمل بالشحن",111000,91000,[0,"380d6dba-aac2-4f1b-8214-4c7e907a3e37.png"],null],[206,"• جهاز المساج السداسي",84000,64000,[0,"2bd4cf47-ab58-4f43-ba8e-ded9ed4b4e87.jpg"],null],[207,"عرض 3 قطع جهاز طارد الحشرات Pest Reject بضمان",83000,63000,[0,"6ce54128-2845-4d3c-b29c-a6ea3de8d181.jpeg"],null],[208,"المكنسة الحديثة 3 في 1 RAF ضمان 6 أشهر",92000,72000,[0,"c2842579-37b5-412f-935f-12c25f706577.png"],null],[209,"عصارة بالطرد المركزي الكامل للفواكهه RAF ضمان 6أشهر",96000,76000,[0,"2a839194-3865-46d8-93b2-cce322da105e.jpg"],null],[210,"• عربة اطفال قابلة للطى و تصلح للطائرات",94500,74500,[0,"cae660c8-832b-4329-8e16-786dd6dff1cc.png"],null],[211,"• وسادة سيارة للرقبة واسفل الظهر",79000,59000,[0,"4aaa761d-6273-4821-bb27-ec78c5bfea9b.png"],null],[212,"• Rechargeable LED and Lighter 2 in 1",76000,56000,[0,"c69d4823-77dd-421d-b775-07662ddddf80.png"],null],[213,"• سيرم للوجه اصلي beauty of joseon",90500,70500,[0,"a8d66546-07c2-4106-984f-d33ad482df68.png"],null],[214,"• زجاجة و منظم دواء 2 في  1",74000,54000,[0,"4fd15ad1-82cb-48a1-8eed-0a04a4f6d047.png"],null],[215,"• طقم 2 قطعة موكيت فائق الامتصاص",73000,53000,[0,"65600819-043d-44da-a697-7d68f47850bf.jpg"],null],[216,"عرض 3 قطع شريط الألمنيوم اللاصق المقاوم للماء والحرارة 5 متر",74000,54000,[0,"a4b1e60c-23ef-4a0d-8dc3-2ad611f3dfa4.png"],null],[217,"عرض قطعتين شريط الألمنيوم اللاصق المقاوم للماء والحرارة 5 متر",72000,52000,[0,"b996b193-555e-4c3a-af14-2592712ebc06.png"],null],[218,"• مفك 48 قطعة يعمل بالشحن",75000,55000,[0,"9fa4bedf-2147-4492-8911-f5f6b57a3154.jpg"],null],[219,"• الهاتف الأصغر فى العالم بشريحتين",79000,59000,[0,"38bda0cf-f9df-45f0-9e21-0583b2510c20.png"],null],[220,"• دريل يابانى 48 فولت 28 قطعة ببطاريتين",92000,72000,[0,"922f4626-9af4-4be0-affc-691f43ac4abc.png"],null],[221,"• ليزر الحفلات Star Shower",77000,57000,[0,"5c4a4519-4825-49b7-b78b-c57c9310a969.png"],null],[222,"• عرض (شامبو ساكورا الياباني + بلسم ساكورا الياباني)",77000,57000,[0,"70e39389-e471-4d5c-a341-3ee54dd37128.png"],null],[223,"• بلسم ساكورا الياباني",73500,53500,[0,"ec37dc1f-20d1-48cf-bb83-3865bf2b98c7.png"],null],[224,"• مجفف احذية",73000,53000,[0,"f9c4c503-ced8-467b-8d13-150b2bf9e043.png"],null],[225,"• كرسي القمر",92000,72000,[0,"92d62144-5d9a-42c2-8d4e-b2ecf0068b80.jpg"],null],[226,"• Game Tv And Projector",126000,106000,[0,"d1e6df0f-4693-430b-9104-b587b0916b49.png"],null],[227,"• مجموعة ساكورا اليابانية للعناية بالبشرة و الجسم",81000,61000,[0,"a7f16c46-0784-4231-9ea2-7f71efa61037.png"],null],[228,"• اقوى سفنجة تنظيف زجاج للسيارات",72000,52000,[0,"a52b279c-011d-4ff0-af77-39e5633ee783.jpg"],null],[229,"• الاسنان الاصطناعية",73500,53500,[0,"2abfbe8b-0c19-4f6e-bed2-fb0b44f3478e.png"],null],[230,"• سبيكر نشرة الاضاءه الجديد",78000,58000,[0,"8245af98-acd4-4575-b2eb-fc14d71b7269.png"],null],[231,"• سبيكر ب 2 مايك",81000,61000,[0,"ad2c1401-e8db-4866-a8eb-6a189882353f.jpg"],null],[232,"• نشرة و منبه و السبيكر التريند",86000,66000,[0,"2725c73a-a36c-454a-abe4-dbe28ccf3d77.png"],null],[233,"• جنطة شنيور دريل ببطاريتين 120 قطعة",104000,84000,[0,"192e61e2-91ce-4d59-8078-8640216901e4.jpg"],null],[234,"• i19 pro هاتف",88000,68000,[0,"bbb4a28a-50c8-4874-93d3-7467f74668cd.png"],null],[235,"• عجلة البطن الرياضية بشاشة ديجيتال",80000,60000,[0,"eac121cc-b3b9-47bc-95d0-7198c658cd03.jpg"],null],[236,"عرض قطعتين جهاز ازالة الصوف ماركة",77000,57000,[0,"96b906a6-108b-4d5b-ab28-81829e99f704.jpg"],null],[237,"• جنطه فاشون ضد السرقة",79500,59500,[0,"bee5c79c-c7a3-4901-9ca1-7e8d4b9c8ffa.png"],null],[238,"• مبخرة الشعر التريند",79250,59250,[0,"e0078af5-29d2-433f-aed3-d1b771f09345.jpeg"],null],[239,"عرض 6 قطع ( مكينه للمناطق الحساسه كيمي للرجال KEMEI Body Hair Trimmer KM-3208)",121000,101000,[0,"d77a9d32-c151-4b2e-b92c-d22aa75d4d56.jpeg"],null],[240,"عرض 3 قطع (مكينه للمناطق الحساسه كيمي للرجال KEMEI Body Hair Trimmer KM-3208)",95000,75000,[0,"54907604-0883-4963-84d1-03fad431eb4f.jpeg"],null],[241,"عرض قطعتين (مكينه للمناطق الحساسه كيمي للرجال KEMEI Body Hair Trimmer KM-3208)",85000,65000,[0,"e09fbf9f-4acf-4adf-ab22-24672bff27d1.jpeg"],null],[242,"شفاط سحري Inline Fan Electric ضمان 6 أشهر",92000,72000,[0,"48903966-273d-4de9-90e4-c3ecf45ff306.png"],null],[243,"• قلم لحام بالغاز",80000,60000,[0,"6cc0e0ee-e7d9-4ced-bdf8-9e2e17c3246e.png"],null],[244,"• مقياس ديجيتال",79000,59000,[0,"d5f6e11a-a00a-4f96-a6c0-078deaa6845b.png"],null],[245,"• اسبراي بديل الكوى",74000,54000,[0,"697aa700-4117-444d-bc0c-7b79fe4f8a74.png"],null],[246,"• مسدس مساج تاتش",81500,61500,[0,"65c70f6d-62eb-468c-9186-8c7e5198f930.png"],null],[247,"• مصباح USB",76000,56000,[0,"406c9c53-bc00-4ce2-8d9e-de33b1d08370.png"],null],[248,"• فرشاة لازالة تقصييف الشعر",92000,72000,[0,"f218a4fb-31c6-4219-b1f1-38a5b3adfe48.jpg"],null],[249,"• وحدة تحكم لعبة سباق السيارات",90500,70500,[0,"a2c186eb-69bd-4d86-aee4-b24e05b8c0fc.png"],null],[250,"• قلم ازالة الشامة بالبلازما",79500,59500,[0,"7912a048-9bf2-45f1-a619-fc9057ac1bfd.png"],null],[251,"• اوتي بخارية 4 في 1",84000,64000,[0,"524f6449-7e86-4b2b-a9ce-6ff12aa46e4e.png"],null],[252,"• صوبة اللهب 3D",82000,62000,[0,"2994ac80-2e81-4080-a281-40e40ef2ab69.png"],null],[253,"• صوبة كهربائية 180 درجة",88000,68000,[0,"51e68ddb-9c60-4da9-a7d0-0944f207d831.png"],null],[254,"• ماكينة صنع الفشار Healthy Popcorn",82000,62000,[0,"3e0b229e-fd17-4fff-8979-c41b7bc0a190.jpg"],null],[255,"• ماكينة ازالة الشعر ال yes",75500,55500,[0,"2d207025-1b7d-410b-bfc7-652cfd7b6208.jpeg"],null],[256,"• سبيكر جوجل الترند",79000,59000,[0,"0682ea33-0ce4-4735-9efa-63db7a097824.png"],null],[257,"(Retinol eye cream + Retinol face serum) عرض قطعتين طقم الريتينول",84000,64000,[0,"4d4eaaa7-fa1b-4ce9-ac56-f45e356aa9b3.png"],null],[258,"• شريط الألمنيوم اللاصق المقاوم للماء والحرارة",70000,50000,[0,"0e0b6115-b97d-4095-b264-e367592706ae.png"],null],[259,"• قطاعة ماندولين 6 في 1",75000,55000,[0,"5ce9a329-8c90-4b9e-925f-aa9f46ebb278.png"],null],[260,"• بودر سبراى لتحديد شعر الوجه",72000,52000,[0,"3868ecc1-7af0-421c-b978-c82e7b547419.png"],null],[261,"• مكنسة تنظيف منزلي Acarid Remover",82000,62000,[0,"9dcd6795-95f9-4124-bc20-22435b72c9d4.png"],null],[262,"\"عرض ( عجلة البطن الرياضية بشاشة ديجيتال+ مشد نحت الخصر للنساء والرجال)\"",88500,68500,[0,"ee84121a-e474-498f-b436-42106f625347.png"],null],[263,"• جهاز صانع الكليجة",101000,81000,[0,"5f0d09d1-6f96-490c-8823-f4c4086b3d4a.png"],null],[264,"• مجموعة تاتو الحواجب",70000,50000,[0,"41668848-f319-48bf-9f16-fe124db5ec9f.jpg"],null],[265,"• فورمون جولدن لور",79500,59500,[0,"8729ab2b-a547-4fb8-ab4c-7fe3a0546c2d.png"],null],[266,"• جهاز تمارين الملاكمة الموسيقى",97000,77000,[0,"0a91a52b-b49c-43be-a0fc-4de46a132fd7.png"],null],[267,"• شامبو صبغ الشعر اللون الاسود Orabella",71500,51500,[0,"6d0cc77e-46c6-4cff-bb13-73dd17b85fb5.png"],null],[268,"عرض قطعتين منظف سبليت فوم",87000,67000,[0,"82385733-2e03-43e9-9b12-b0d330ca87ea.png"],null],[269,"عرض مساحة مثلث سهلة العصر +  معجون البلاط",77500,57500,[0,"bdcc5907-298a-4b0e-b92c-b5e03889f26e.png"],null],[270,"• شامبو ساكورا الياباني",72000,52000,[0,"d81ef08a-ebc2-4d91-ba74-0ab5a351b923.png"],null],[271,"عرض 4 قطع جهاز طارد الحشرات Pest Reject",94000,74000,[0,"7fce3524-ae78-42ab-a37d-7df71bb76db7.jpg"],null],[272,"موقد الغاز المتنقل 2 في 1 DLC ضمان 6 أشهر",103000,83000,[0,"248fcbba-35b9-4637-8f89-cb4687e65d61.jpg"],null],[273,"• صانعة البطاطا الحلزونية",80000,60000,[0,"581be0e3-9242-4943-b3fb-6a5635866605.png"],null],[274,"صانعة الثلج الفورية 2 لتر CYBER ضمان 6 أشهر",152000,132000,[0,"aeaedf77-22ff-48da-a818-ff226fce475e.png"],null],[275,"عرض قطعتين مصيدة الحشرات الامنة",85000,65000,[0,"c337a70f-d769-42f1-850e-39d3cdbc6cd7.jpg"],null],[276,"عرض مكنسة روبوت الحديثة  + بانكه متحركه تعمل بالشحن",90000,70000,[0,"202d3c8d-2663-4cd7-b156-f281e5c9ff2c.png"],null],[277,"• نظارة قيادة السيارة بسماعة بلوتوث",74000,54000,[0,"d30726bc-e876-459f-b2d9-e2374651435e.png"],null],[278,"• مصيدة الحشرات الامنة",72000,52000,[0,"c632ba23-2636-4f78-801b-761124b05ef1.png"],null],[279,"• خرطوم مياه قابل للتمدد Magic Hose",73000,53000,[0,"23ed2848-512c-4859-9d19-5072569641e9.jpg"],null],[280,"عرض قطعتين عجلة البطن الرياضية بشاشة ديجيتال",95000,75000,[0,"7410211d-92ac-428a-8f7c-f78489dd9162.png"],null],[281,"• كماشة متعددة الاستخدامات",86000,66000,[0,"c0212a05-0631-4115-b4be-84f81d6272fb.png"],null],[282,"• اللانش بوكس الكهربائي",77000,57000,[0,"9878cf01-c49b-44f7-8895-d9ff1554d6e4.png"],null],[283,"• باسيكل تمارين رياضيه بشاشة ديجيتال",105000,85000,[0,"555a45c2-1d4f-4d33-9092-ebd137b28b36.png"],null],[284,"عرض قطعتين زيت أكليل الجبل",78000,58000,[0,"fdff58ec-e5bf-4f42-91e7-970eef24ebfe.jpeg"],null],[285,"• Crystal Coating",74000,54000,[0,"9af941e0-eb3c-49ef-9f5a-f98d191aed22.png"],null],[286,"• كرسي محمول قابل للطي",76000,56000,[0,"d4db89f4-27b5-46ef-8379-ae27e2233a51.png"],null],[287,"• فلتر تنقية المياه SWS",72000,52000,[0,"52336508-8b20-419b-9993-679b6c040ce5.jpg"],null],[288,"Yellow Peeling Oil عرض قطعتين",73000,53000,[0,"a8d9a2ff-4f8c-4571-a509-f3cbc147c0a8.png"],null],[289,"عرض قطعتين فلتر تنقية المياه SWS",79000,59000,[0,"11cfc1ce-5a3f-4cc4-b128-387a293ae5e1.jpg"],null],[290,"• جهاز ستيبر الرياضى بشاشة ديجيتال",108000,88000,[0,"c41a1da6-088b-48df-a3d5-13053ed9c29b.png"],null],[291,"• Cosrx snail cream 100 G",77250,57250,[0,"7547dd6b-e4b5-4220-ae88-31cb6137766f.png"],null],[292,"• جهاز ليزر lPL",98500,78500,[0,"6148c6ce-b94d-46d4-8c58-65aac575cc82.png"],null],[293,"• جهاز ازاله الحشرات من الشعر",79000,59000,[0,"70a71814-4bc3-4ebc-b872-3200abf0a9c7.jpeg"],null],[294,"عرض قطعتين  Sexy intense perfume",84500,64500,[0,"f5724c70-04c4-4f4e-8350-b0342dce8ea2.png"],null],[295,"• مكنسة روبوت الحديثة",82000,62000,[0,"15108fa3-da72-4300-8fc3-7c55b442e673.png"],null],[296,"• eye cream",69500,49500,[0,"cd7abc5b-a9bb-4f1a-af9a-39cc3a1807e4.png"],null],[297,"• Sexy intense perfume",79000,59000,[0,"54258ff0-d027-4c16-88bf-78e355911364.png"],null],[298,"عرض قطعتين شامبو صبغ الشعر باللون الاسود",75000,55000,[0,"4f0bcd77-15b1-4924-8337-04ef70e462af.png"],null],[299,"عرض قطعتين موزع هواء السبلت",90000,70000,[0,"2db24364-cebc-4be0-a9b1-c0d56126c885.jpg"],null],[300,"عرض قطعتين مزيل خدوش السيارات الامريكى الحديث",76000,56000,[0,"5bc4fde7-4f00-466d-9833-1219d93f9392.png"],null],[301,"• ادوات التصليح المتعددة",86000,66000,[0,"5643e0f5-94dd-435e-b2fd-1f663f40a108.jpg"],null],[302,"عرض قطعتين الفرشاة الدوارة لتنظيف جميع الاسطح",77500,57500,[0,"7695a501-dde8-487d-bb7f-f0b72865c4cb.png"],null],[303,"عرض قطعتين جهاز طارد الحشرات Pest Reject بضمان",79000,59000,[0,"ad80c755-d8b6-4c54-90ce-9ec0ec9d2280.png"],null],[304,"• فرشاة فرد الشعر التريند",84000,64000,[0,"b29aec39-280a-4015-8c39-452308fa48b3.png"],null],[305,"• Yellow Peeling Oil",73000,53000,[0,"bf5c82c9-daec-4999-ab9c-a8104c754697.png"],null],[306,"• Retinol face serum",73000,53000,[0,"301331db-cff3-49fa-9caf-71b05de72551.png"],null],[307,"• Retinol eye serum",79000,59000,[0,"c79e4aac-7c6a-4456-a667-9bf0a8a6886f.png"],null],[308,"• Retinol eye cream",77500,57500,[0,"dc4fc8e0-b6f4-440a-8b19-805e826141c5.png"],null],[309,"• Retinol face cream",71000,51000,[0,"0d633e9f-c6e1-4969-9a4a-dae414d26b77.jpeg"],null],[310,"• حمام كريم Fino الاصلي",85750,65750,[0,"70521b3c-9e54-486a-bda0-bb4c9f6d1256.png"],null],[311,"• خزانة احذية و ستاند 3 في 1",83000,63000,[0,"43e5c1ea-776b-4fc8-8ab6-38f669b30cb1.png"],null],[312,"• كنتور ملابس 2 ضلفة",79000,59000,[0,"f833e7c6-ad28-411d-b8f0-c2a0e8d1d368.png"],null],[313,"جهاز طارد الحشرات Pest Reject بضمان",77000,57000,[0,"f48ef8e7-1b43-4474-aa1b-74200aff0014.png"],null],[314,"• رف للسنك الترند",94000,74000,[0,"0f7caf1d-40ef-439d-ad5a-a957170d37c5.png"],null],[315,"• عرض 4 قطع استيكر المرايا",95000,75000,[0,"513560b4-d9c3-4772-a698-33bd423bbc23.png"],null],[316,"• عرض (Cosrx snail cream 100 G + Cosrx snail serum 100 ML)",83250,63250,[0,"a0b4e8aa-cb38-4b3f-848d-d52cb8b1c05f.png"],null],[317,"• سبيكر 6*1",105000,85000,[0,"8b54fe87-0470-4388-9ff4-d77e11f574be.png"],null],[318,"• راوتر محمول 5G",97000,77000,[0,"04c5d6f8-1447-4f9d-925b-d287f41b6641.png"],null],[319,"\"بخاخ رذاذ للترطيب ١٠ متر بـ ١٠ فتحات للرش Mist Cooling\"",76000,56000,[0,"6b37c907-cb03-437b-befe-45326fbf74b1.png"],null],[320,"• بلاور يعمل بالشحن",93000,73000,[0,"b827b3a3-cde3-484d-b0b2-edb670098ce2.jpg"],null],[321,"• Cosrx snail serum 100 ML",76000,56000,[0,"ba2e8769-56b2-426e-890f-b961ca7407a3.jpg"],null],[322,"• بلسم اكليل الجبل Mille",75000,55000,[0,"59537a5b-6c58-46ca-adcf-48c8da38c78e.png"],null],[323,"• شامبو اكليل الجبل Mille",78000,58000,[0,"d3d0620a-f588-4125-9f0a-800b72744ac9.png"],null],[324,"• مبرد الهواء المحمول USB",83000,63000,[0,"6d8752e1-cc0b-4425-b224-53cb1fa1281b.jpg"],null],[325,"• طقم واقي شمس + 50SPF",78500,58500,[0,"665a1ece-4151-4b63-95b2-cded0774c4f1.png"],null],[326,"• ايباد تعليمى للاطفال",73000,53000,[0,"33ede6b9-ce8b-4244-8890-19d5e7e2ae3c.png"],null],[327,"• دش عالي الضغط الحديث",71000,51000,[0,"0d454e54-5048-47c2-a9fc-6c9e94e1a903.png"],null],[328,"موقد الشواء 3 ادوار متعدد الوظائف بضمان",101000,81000,[0,"20158e95-e1dc-4923-8f4b-d4d5de9fb93f.png"],null],[329,"• LED Smart Sound Control",78000,58000,[0,"2826885e-c74f-4358-b881-a8f2a59cae8d.png"],null],[330,"• حامل موبيل 360 درجة",70500,50500,[0,"ac704d1f-8448-458a-a39a-2afb3c725371.png"],null],[331,"• موزع هواء السبلت",78000,58000,[0,"c33f3141-1735-4c50-8e4f-234492f8c670.png"],null],[332,"• عرض واقي شمس و مرطب Kaliya",80000,60000,[0,"9a5b9e5d-152c-4239-b318-0f5f39f58835.png"],null],[333,"• عرض قطعتين فوطه مايكروفايبر للمنزل و السيارة   35 سم * 27 سم",71000,51000,[0,"6a054537-6eef-4f33-a630-fd94923e860c.jpg"],null],[334,"• سيروم تصغير الانف",75500,55500,[0,"fd85382d-74b7-4a1b-9570-36eb780c3789.png"],null],[335,"بانكه متحركه تعمل بالشحن 180ْ Foldable Fan ضمان 6 أشهر",80500,60500,[0,"69955b70-c44c-4197-a16c-52d13b9742e7.png"],"بانكه-متحركه-تعمل-بالشحن-180ْ-Foldable-Fan-ضمان-6-أشهر"],[336,"• شنطة وسريرللبيبي",77000,57000,[0,"09cd7f22-16eb-4fa4-8ddc-c275f0b0daf4.png"],null],[337,"• جهاز مساج البطن",75000,55000,[0,"6a9ab603-91f5-4f0e-bb18-bf3c176b5784.jpg"],null],[338,"• Airpods android",87000,67000,[0,"95cd3e3e-d522-42be-bdbf-461c1763f816.png"],null],[339,"• مشد الظهر",78000,58000,[0,"5ec78c5a-7046-4fae-a39b-1c3d8cc9d769.png"],null],[340,"• نفاضه الكترونية ممتصة للادخنة",74750,54750,[0,"99a82008-967b-4fd2-966f-53ba73593132.png"],null],[341,"• صانع الأسموثي",80500,60500,[0,"cad98382-bc58-4318-a874-5c4cc3204501.png"],null],[342,"• منظف سبليت فوم",76500,56500,[0,"4aff6b91-8918-4145-a795-b86be0743c2b.png"],null],[343,"• رول شفاف حامي للاسطح مقاوم للماء",73000,53000,[0,"e33023b0-5968-4ef4-9e3c-3e1c69b207d6.png"],null],[344,"• حامل الموبايل المغناطيسي",78000,58000,[0,"70262001-a186-44ce-8892-d34209ace8f9.png"],null],[345,"• بانكة USB Mini Fan",72000,52000,[0,"ca84cb18-fa06-4d43-bfbf-8c7e7a058b92.png"],null],[346,"• مفتاح لاصلاح الاطارات",74000,54000,[0,"450455fb-bbb5-436b-845c-cb96455eeb70.png"],null],[347,"• مخدة النوم المريحة للرقبة",79500,59500,[0,"bb785388-b240-4ac4-a04d-9e48a7550432.png"],null],[348,"• مزيل خدوش السيارات الامريكى الحديث",73000,53000,[0,"ab105b57-9102-4096-870b-0a6c7017ebb8.png"],null],[349,"• مسدس و فرشاه تنظيف السيارة",80000,60000,[0,"57e9b91b-991b-41f6-baab-f6df6bb10bdc.png"],null],[350,"• قنفة نفخ ترند",88000,68000,[0,"e188b642-1a40-4172-911a-9f3a541e39de.png"],null],[351,"• P9 Wireless Headphone",73000,53000,[0,"12d29ec7-265e-426d-ab27-b7f2f40d8afb.png"],null],[352,"• الطاحونة التربو",83000,63000,[0,"baaafe85-2931-449c-8d3c-cf34a8513bb6.png"],null],[353,"• فرشاة الشعر بشاشة ديجيتال وايرليس",81000,61000,[0,"ef8c0320-1259-437a-98fa-ced5a5363cc1.png"],null],[354,"• wireless hair straghtner",78500,58500,[0,"965624a2-cbd5-47ef-b5db-26b99b9a4b72.png"],null],[355,"• فرشاة تصفييف الشعر",88000,68000,[0,"68371d57-98f9-46ac-bf2b-64b593456d12.png"],null],[356,"• ناموسية شبكة قابلة للطي مفرد",77500,57500,[0,"20105d43-d53e-4cde-92d0-d709d1085400.jpg"],null],[357,"• شامبو صبغ الشعر باللون الاسود",78000,58000,[0,"4272e1aa-3d34-48c7-9235-2e86d943b286.jpg"],null],[358,"• مروحة تبريد السيارة بالطاقة الشمسية",85000,65000,[0,"d34327fb-744e-4c98-aac1-a5803ce13b73.jpg"],null],[359,"• مظلة سيارة لحجب الشمس",76000,56000,[0,"8a925fe0-261f-47d7-be57-8b81391dbcc0.jpg"],null],[360,"بانكه سقف بمصباح LED ضمان 6 أشهر",80000,60000,[0,"1c44e11c-11c8-46a4-85c1-51067b894e60.png"],null],[361,"• Filp P20 mini موبيل",92500,72500,[0,"0da5c16b-b4a9-4a4e-91f3-403a2ceea3e5.png"],null],[362,"• لعبة السلطعون العجيب",77000,57000,[0,"5b81e096-de8f-4eca-a5dd-0d9dfd437701.jpg"],null],[363,"• طقم الريتينول - روتينك الجديد لعلاج مشاكل البشرة",94500,74500,[0,"aaaa55c4-d75b-429e-b166-4b8c38df1324.jpg"],null],[364,"• عرض 3 قطع مانع الاتربة و الغبار",78000,58000,[0,"090a58e8-e7b6-4905-8f42-4a3b32e3a7b5.png"],null],[365,"• معالج شروخ الزجاج",72500,52500,[0,"b1b78ccb-35a3-4fe1-b975-a3684eedccd7.PNG"],null],[366,"• كاميرا تصوير للاطفال",82000,62000,[0,"7f5f0fe9-82fc-4689-9b59-6e3f285257c1.png"],null],[367,"• منشار كهربائى",87000,67000,[0,"c7c13d30-e261-4b06-964e-7700cf0ee23b.png"],null],[368,"• عرض قطعتين  معجون البلاط",76000,56000,[0,"36cc5b7d-7877-45ae-86cc-584a85832b6b.png"],null],[369,"• ملمع السيارة العجيب  - Spray Coating Agent",80500,60500,[0,"42a25ea1-5da8-4fb9-965c-390cec852076.png"],null],[370,"خلاط Silver Crest الالماني + طاحونة ضمان 6 أشهر",95000,75000,[0,"ff0a99da-745e-4130-be08-daa8fa71c282.jpg"],null],[371,"• جهاز شفط الدهون من الوجه بشاشة ديجيتال",75000,55000,[0,"143f2639-5d61-42bf-9142-ae5418421c33.jpeg"],null],[372,"• بوتى بسلم للاطفال",80000,60000,[0,"7ab1a647-bc01-471b-b13e-6008bccd0b2c.png"],null],[373,"• بروجكتور USB",102000,82000,[0,"a07b0fdf-4748-435a-bd3f-d834b4bceb6a.png"],null],[374,"• الفرشاة الدوارة لتنظيف جميع الاسطح",72000,52000,[0,"25936acf-7682-47a0-97c8-b2469aadf39c.jpg"],null],[375,"• شفاط هواء متنقل",98000,78000,[0,"0ac90f5c-8759-4abf-81f0-f432cec2f7cf.png"],null],[376,"• ستارة مغناطيسية عازلة للحشرات",74000,54000,[0,"fb695ed5-75ba-4a7a-a4b9-fcd03db527da.png"],null],[377,"• طاوة كريب كهرباء",80000,60000,[0,"40aa1031-a0e3-40f7-bf9d-647c743d5280.png"],null],[378,"• ماكينة صنع الباستا",141000,121000,[0,"62562c2a-77b1-4204-a031-1dc669f87c28.png"],null],[379,"• مسدس المسامير الحديث",82000,62000,[0,"a9181dff-5ac3-40a8-b52a-fb9251fb40df.jpeg"],null],[380,"• تابلوه السيارة LED",75000,55000,[0,"f9371ce8-e10d-4916-a145-fe9effd94a6e.png"],null],[381,"• مسن سكاكين اللكتروني",72000,52000,[0,"c4159cd9-0e1d-4f91-8220-5a84b8fd915a.png"],null],[382,"• حينرال ايبوكسي (عازل متعدد الاستخدامات)",77000,57000,[0,"e5e3e672-cec3-4e2d-a1a9-c8cc21f50451.png"],null],[383,"• مكينه للمناطق الحساسه كيمي للرجال KEMEI Body Hair Trimmer KM-3208",85000,65000,[0,"fcde649f-5fe2-4d64-abc5-94577b24c679.png"],null],[384,"• ميزان لوزن الجسم بالبلوتوث",73500,53500,[0,"88276535-8423-4cc0-8d34-df0c720d7938.jpg"],null],[385,"قطاعة الخضروات الحديثة",75000,55000,[0,"9c6069ae-5fbf-4ca8-bf57-87590631a922.jpg"],null],[386,"• حنفيه مياه للتوفير بسينسور",90000,70000,[0,"12a6749b-e5b4-44fa-abb2-2a1f84b0a087.jpg"],null],[387,"• Moc Allure دفتر الكامل",86000,66000,[0,"2f2bbc4f-61ef-4912-8bad-007e0276c440.png"],null],[388,"• IKT STICK wax stick",78000,58000,[0,"f3caf705-364d-441a-bf30-20a6b62d0a45.jpg"],null],[389,"• باور بانك لاسلكي بشاشة",88000,68000,[0,"b93c7853-596b-416a-9a90-dc6035da5e25.png"],null],[390,"• كريم اساس سائل سانيسا",73500,53500,[0,"742f9453-0b41-473d-a32b-6ac3c6a25f51.png"],null],[391,"• مساحة مثلث سهلة العصر",75000,55000,[0,"033a66b9-40f1-4ca1-821f-32e51a8e40c7.jpg"],null],[392,"•  معجون البلاط",74000,54000,[0,"ab4e179f-3565-4812-aaec-5d0f222c18ee.png"],null],[393,"• لعبة تنمية المهارات العصا مغناطيسية 42 قطعة",77500,57500,[0,"3a1a4f47-5126-43b3-a29c-0cffc7a0a24f.png"],null],[394,"• زيت أكليل الجبل",72000,52000,[0,"75245d4f-ab74-493f-8259-da08440ccd5b.png"],null],[395,"• جهاز المساج الحديث متعدد الاستخدام",76000,56000,[0,"2a2d668c-fe03-4ba1-b1ec-802f056216af.jpg"],null],[396,"• مشد ظهر مغناطيسي بدعامة",81000,61000,[0,"2e2fabd3-ec3b-432e-8528-30cce64272ca.jpg"],null],[397,"• مكنسة منزلية كهربائية",101000,81000,[0,"750ac2c6-0a6b-4c30-9f0f-2cc9ba1ef5cd.jpg"],null],[398,"• مشد نحت الخصر للنساء والرجال",75500,55500,[0,"448bbb97-3eb4-482b-9d3e-e01997e9870a.png"],null],[399,"خلاط شحن محمول ضمان 6 أشهر",77000,57000,[0,"a8905fbc-6513-4191-be63-e64137e5bbc3.png"],null],[400,"• اباجورة رائد الفضاء بالبلوتوث",87000,67000,[0,"b03098bd-50a0-4e6b-82a8-c9d6d6c68562.png"],null],[401,"• فلتر مياة سهل التركيب",74500,54500,[0,"e3c564b5-622a-4fc6-8609-ff325945179b.jpg"],null],[402,"غسالة مكس توب بضمان",86000,66000,[0,"a5043850-5e98-4ffc-9a05-ee1d4ab135b6.png"],null],[403,"• جهاز ازالة الصوف ماركة",72019,52019,[0,"834dc7ed-5f44-44c8-b0e3-2a7f12cc933d.jpg"],null],[404,"• صوبه منضدية مودكس",85000,65000,[0,"b31819ec-1480-4e66-aab7-e62dce6decec.png"],null],[405,"عصارة فواكهه تعمل بالشحن بضمان",74000,54000,[0,"3ac8881d-225e-48f6-80cb-5065d05505bf.jpg"],null],[406,"• حقيبة الطوارئ المتكاملة",166000,146000,[0,"90825ca3-9655-4b1f-8985-911e25c2de12.jpg"],null],[407,"• قلم الترجمه الفوري",115000,95000,[0,"1373828a-6388-45aa-9410-b3c91ed9702e.jpg"],null],[408,"• اضاءة النشرة الداخلية للسيارة بريموت كونترول",82000,62000,[0,"c23d29d2-d821-4f3a-9303-f26f12c8313f.png"],null],[409,"• اللاصق التركي السحري",75000,55000,[0,"57024026-8e9e-4041-9b0d-bcc891c576f7.jpg"],null],[410,"• مشد اعصاب الكف",74000,54000,[0,"9f46e7a5-3a84-4b28-9e7e-f074ab694cc7.jpg"],null],[411,"• اداة تصوير 360 درجة",81000,61000,[0,"6f8a9219-0c51-41c0-86d8-3adfbe2d20f5.jpg"],null],[412,"Neo hair lotion 120m لوشن نيو هيرلتجديد الشعر التالف 120 مل",74000,54000,[0,"40d45d4b-4a6f-474a-bd30-a7ef15cfb1eb.jpg"],null],[413,"مساج القدم - Foot Massager",74500,54500,[0,"d33f216a-9cf0-46ad-bc88-c0e9335a9b52.jpg"],null],[414,"ماكينة الخياطة الحديثة SM ضمان 6 أشهر",78000,58000,[0,"996028df-6983-49e5-8c16-1344dfea8931.png"],null],[415,"جهاز مساج الرقبة الحراري",74000,64000,[0,"5a9d95ae-8267-4d26-bfd6-ead939df1b9b.png"],null],[416,"عرض جهاز المساج السداسي + جهاز مساج الركبة",91000,81000,[0,"6556e100-957b-4e1e-929c-eaa2e53f2205.jpg"],null],[417,"عرض ماكينة KEMEI كيمي 5 في 1 + ماكينة حلاقة الظهر الترند",89000,79000,[0,"401610bf-2088-4122-9893-3cb873df63f2.jpg"],null],[418,"فرشاة تدليك و مساج الراس",81000,71000,[0,"c7b599bd-85b9-4954-9e6b-8e8bdcf0292f.png"],null],[419,"الفرشاة الدوارة الاصلية ENZO",88000,78000,[0,"4435467d-2c41-4479-a7ed-15e91923c694.jpg"],null],[420,"عرض (بلسم ساكورا الياباني + شامبو ساكورا الياباني + زيت اكليل الجبل Mille)",69000,59000,[0,"6d0111ff-a98a-4280-a7af-e00a63b5721e.jpg"],null],[421,"قفازات العلاج الطبيعي (ايسر)",148000,138000,[0,"8e87d241-779e-41ce-baaa-5a8468c67fc0.png"],null],[422,"قفازات العلاج الطبيعي (ايمن)",148000,138000,[0,"56d2163a-f419-4ba7-9140-3ff4dd638075.jpg"],null],[423,"قلم الميكروبيلدنج الثابت",60000,50000,[0,"06982096-7a69-4550-9ce5-6cc33780201e.jpg"],null],[424,"زيت نمو اللحية",69000,59000,[0,"07e9c813-cca1-479f-84e2-1d5c6dba9013.jpg"],null],[425,"عكاز ب كشاف 2 في 1",80000,70000,[0,"90f4fd60-a081-48c7-8d33-b911ae53df98.jpg"],null],[426,"جهاز تصحيح الظهر و الرقبة",68500,58500,[0,"0730f512-98d2-4dc8-97b1-344833509ea6.jpg"],null],[427,"خيوط الكولاجين",64000,54000,[0,"188ebd8e-c909-462f-8d87-96a53064c5cc.png"],null],[428,"عرض (جهاز مساج حراري 3 في 1 للركبة و الكتف و الساعد + PEELING OIL هدية )",82000,72000,[0,"68790990-d93c-4952-9900-2edcdf0c2f7e.jpg"],null],[429,"عرض عبوتين لاصقات ازالة آلام المفاصل",73500,63500,[0,"0a66284e-5d2f-4ca9-be57-4e88379da5c8.png"],null],[430,"عرض 10 لاصقات لازالة آلام المفاصل",64000,54000,[0,"d0cbfbd5-3ee9-4c6c-b76e-0bc4dae96ea3.png"],null],[431,"ماكينة الحلاقة و التنعيم المحمولة المقاومة للماء",76000,66000,[0,"cceb177f-e0ce-4bd1-b911-354cb8849e81.jpg"],null],[432,"Botox face serum",67750,57750,[0,"7364a806-e61d-4382-bbe9-51c1058af96e.png"],null],[433,"بودرة لتعطير الجسم",75000,65000,[0,"fdcddc0e-4cb3-42a1-9332-065ab8d44666.jpg"],null],[434,"عرض( فرشاة فرد الشعر التريند + زيت اكليل الجبل )",74000,64000,[0,"69e218fa-bf52-4cbb-90be-66aeafda7694.jpg"],null],[435,"جهاز تبييض الاسنان بالتقنية الحديثة",80500,70500,[0,"a41cf6b6-460a-4134-aba3-a9a298017466.png"],null],[436,"اداة تحسين التنفس اثناء النوم",72500,62500,[0,"e3e0ba64-4304-4432-857a-6cd9f12a7811.png"],null],[437,"جهاز مساج حراري 3 في 1 للركبة و الكتف و الساعد",80500,70500,[0,"86f85634-afa1-4208-b75b-b1cb954be7d1.jpg"],null],[438,"ماكينة حلاقة KEMEI 1910 الاصلية",71000,61000,[0,"856dc290-0881-4a8b-8bbf-710ee19f4902.png"],null],[439,"الفرشاة الدوارة الاصلية",73500,63500,[0,"c6e840c0-ce7d-4b0b-be11-e6e5489da691.png"],null],[440,"مقبس كهربائي ذكي يعمل مع اليكسا و جوجل هوم",75000,65000,[0,"daa9e0be-2577-4bde-aa9f-927287e70e8c.png"],null],[441,"خاتم التسبيح الذكي",69000,59000,[0,"5e5b5306-ead6-4d19-8cd0-df7b787d8cc1.png"],null],[442,"خاتم التسبيح الذكي",69000,59000,[0,"8560aa65-2146-4e21-9177-58ee54e331a0.png"],null],[443,"خاتم التسبيح الذكي",74000,64000,[0,"0ef7efe4-d989-49ed-9a57-0a879a0b9d7d.jpg"],null],[444,"كيبورد و ماوس وايرليس",71000,61000,[0,"7450693f-1dc3-455e-9655-fa29ab073ae0.png"],null],[445,"هاتف نوكيا 105 بشريحتين",69000,59000,[0,"2b3ae73a-5b99-4ac8-8ba0-579ab73fe854.png"],null],[446,"هاتف نوكيا 6310 بشريحتين",76000,66000,[0,"5decf651-ce0a-4a8b-8cbd-b36cbd598105.png"],null],[447,"تابلت A20",97000,87000,[0,"8774a64c-b4cc-40f1-8b97-97fc26664860.jpg"],null],[448,"Smart watch with airpods",95000,85000,[0,"20db6ae3-d34c-45e4-9805-90be4d2d8c52.png"],null],[449,"Game TV Stick 8K",88000,78000,[0,"251e304d-2dd6-47d8-9759-f7fd31904ca5.png"],null],[450,"الهاتف الأصغر فى العالم بشريحتين",69000,59000,[0,"38bda0cf-f9df-45f0-9e21-0583b2510c20.png"],null],[451,"Game Tv And Projector",116000,106000,[0,"d1e6df0f-4693-430b-9104-b587b0916b49.png"],null],[452,"سبيكر نشرة الاضاءه الجديد",68000,58000,[0,"8245af98-acd4-4575-b2eb-fc14d71b7269.png"],null],[453,"سبيكر ب 2 مايك",71000,61000,[0,"ad2c1401-e8db-4866-a8eb-6a189882353f.jpg"],null],[454,"نشرة و منبه و السبيكر التريند",76000,66000,[0,"2725c73a-a36c-454a-abe4-dbe28ccf3d77.png"],null],[455,"i19 pro هاتف",78000,68000,[0,"bbb4a28a-50c8-4874-93d3-7467f74668cd.png"],null],[456,"جنطه فاشون ضد السرقة",69500,59500,[0,"bee5c79c-c7a3-4901-9ca1-7e8d4b9c8ffa.png"],null],[457,"سبيكر جوجل الترند",69000,59000,[0,"0682ea33-0ce4-4735-9efa-63db7a097824.png"],null],[458,"سبيكر 6*1",95000,85000,[0,"8b54fe87-0470-4388-9ff4-d77e11f574be.png"],null],[459,"راوتر محمول 5G",87000,77000,[0,"04c5d6f8-1447-4f9d-925b-d287f41b6641.png"],null],[460,"Airpods android",77000,67000,[0,"95cd3e3e-d522-42be-bdbf-461c1763f816.png"],null],[461,"P9 Wireless Headphone",63000,53000,[0,"12d29ec7-265e-426d-ab27-b7f2f40d8afb.png"],null],[462,"Filp P20 mini موبيل",82500,72500,[0,"0da5c16b-b4a9-4a4e-91f3-403a2ceea3e5.png"],null],[463,"بروجكتور USB",92000,82000,[0,"a07b0fdf-4748-435a-bd3f-d834b4bceb6a.png"],null],[464,"باور بانك لاسلكي بشاشة",78000,68000,[0,"b93c7853-596b-416a-9a90-dc6035da5e25.png"],null],[465,"اداة تصوير 360 درجة",71000,61000,[0,"6f8a9219-0c51-41c0-86d8-3adfbe2d20f5.jpg"],null],[466,"صوبة منضدية مودكس",80000,65000,null,null],[467,"جهاز إزالة الوبر عالي الجودة",67019,52019,null,null],[468,"غسالة \"Max Top\" بضمان",81000,66000,null,null],[469,"فلتر مياه سهل التركيب",69500,54500,null,null],[470,"خلاط محمول يعمل بالشحن",72000,57000,null,null],[471,"مكنسة منزلية كهربائية",96000,81000,null,null],[472,"معجون البلاط",69000,54000,null,null],[473,"مساحة مثلث للزوايا",70000,55000,null,null],[474,"حنفية مياه للحفاظ على الماء بحساس",85000,70000,null,null],[475,"قطاعة خضروات حديثة",70000,55000,null,null],[476,"مسن سكاكين إلكتروني",67000,52000,null,null],[477,"ماكينة صنع الباستا",136000,121000,null,null],[478,"طاوة كريب كهربائية",75000,60000,null,null],[479,"ستارة باب مغناطيسية عازلة للحشرات",69000,54000,null,null],[480,"شفاط هواء متنقل",93000,78000,null,null],[481,"الفرشاة الدوارة لتنظيف جميع الأسطح",67000,52000,null,null],[482,"خلاط Silver Crest الألماني + طاحونة بضمان 6 أشهر",90000,75000,null,null],[483,"عرض قطعتين من معجون البلاط",71000,56000,null,null],[484,"عرض 3 قطع مانع للغبار والأتربة",73000,58000,null,null],[485,"مروحة سقف بمصباح LED ضمان 6 أشهر",75000,60000,null,null],[486,"ناموسية شبكية قابلة للطي مفرد",72500,57500,null,null],[487,"الطاحونة التربو",78000,63000,null,null],[488,"كرسي نفخ ترند",83000,68000,null,null],[489,"مروحة USB Mini Fan",67000,52000,null,null],[490,"لفافة شفافة حامية للأسطح مقاومة للماء",68000,53000,null,null],[491,"منظف سبليت رغوي",71500,56500,null,null],[492,"صانع عصائر السموثي",75500,60500,null,null],[493,"مروحة شحن محمولة قابلة للطي 180ْ ضمان 6 أشهر",75500,60500,null,"مروحة-شحن-محمولة-قابلة-للطي-180ْ-ضمان-6-أشهر"],[494,"موزع هواء للسبليت",73000,58000,null,null],[495,"لمبة LED ذكية تتحكم بالصوت",73000,58000,null,null],[496,"موقد شواء 3 طوابق متعدد الوظائف بضمان",96000,81000,null,null],[497,"دش عالي الضغط الحديث",66000,51000,null,null],[498,"مبرد الهواء المحمول USB",78000,63000,null,null],[499,"بخاخ رذاذ للترطيب ١٠ متر بـ ١٠ فتحات للرش",71000,56000,null,null],[500,"عرض 4 قطع ملصقات المرايا",90000,75000,null,null],[501,"رف للحوض الترند",89000,74000,null,null],[502,"جهاز طارد الحشرات Pest Reject بضمان",72000,57000,null,null],[503,"خزانة ملابس ببابين",74000,59000,null,null],[504,"خزانة أحذية وستاند 3 في 1",78000,63000,null,null],[505,"عرض قطعتين جهاز طارد الحشرات Pest Reject بضمان",74000,59000,null,null],[506,"عرض قطعتين الفرشاة الدوارة لتنظيف جميع الأسطح",72500,57500,null,null],[507,"عرض قطعتين موزع هواء للسبليت",85000,70000,null,null],[508,"مكنسة روبوت ذكية",77000,62000,null,null],[509,"عرض قطعتين فلتر تنقية المياه SWS",74000,59000,null,null],[510,"فلتر تنقية المياه SWS",67000,52000,null,null],[511,"كرسي محمول قابل للطي",71000,56000,null,null],[512,"جهاز قياس أسطوانة الغاز",69000,54000,null,null],[513,"صندوق طعام كهربائي",72000,57000,null,null],[514,"خرطوم مياه قابل للتمدد Magic Hose",68000,53000,null,null],[515,"مصيدة الحشرات الآمنة",67000,52000,null,null],[516,"عرض مكنسة روبوت + مروحة شحن محمولة",85000,70000,null,null],[517,"عرض قطعتين مصيدة الحشرات الآمنة",80000,65000,null,null],[518,"صانعة الثلج الفورية 2 لتر CYBER ضمان 6 أشهر",147000,132000,null,null],[519,"صانعة البطاطا الحلزونية",75000,60000,null,null],[520,"موقد غاز متنقل 2 في 1 DLC ضمان 6 أشهر",98000,83000,null,null],[521,"عرض 4 قطع جهاز طارد الحشرات Pest Reject",89000,74000,null,null],[522,"عرض قطعتين جهاز قياس أسطوانة الغاز",69000,54000,null,null],[523,"عرض مساحة مثلث + معجون بلاط",72500,57500,null,null],[524,"عرض قطعتين منظف سبليت رغوي",82000,67000,null,null],[525,"جهاز صانع الكليجة",96000,81000,null,null],[526,"مكنسة تنظيف منزلي Acarid Remover",77000,62000,null,null],[527,"قطاعة ماندولين 6 في 1",70000,55000,null,null],[528,"شريط ألمنيوم لاصق مقاوم للماء والحرارة",65000,50000,null,null],[529,"ماكينة صنع الفشار Healthy Popcorn",77000,62000,null,null],[530,"صوبة كهربائية 180 درجة",83000,68000,null,null],[531,"صوبة اللهب 3D",77000,62000,null,null],[532,"مكواة بخارية محمولة 4 في 1",79000,64000,null,null],[533,"مصباح USB",71000,56000,null,null],[534,"بخاخ معقم للملابس",69000,54000,null,null],[535,"شفاط هواء Inline Fan Electric ضمان 6 أشهر",87000,72000,null,null],[536,"عرض قطعتين جهاز إزالة الوبر",72000,57000,null,null],[537,"كرسي القمر المعلق",87000,72000,null,null],[538,"مجفف أحذية",68000,53000,null,null],[539,"جهاز ليزر الحفلات Star Shower",72000,57000,null,null],[540,"عرض قطعتين شريط ألمنيوم لاصق",67000,52000,null,null],[541,"عرض 3 قطع شريط ألمنيوم لاصق",69000,54000,null,null],[542,"طقم 2 قطعة موكيت فائق الامتصاص",68000,53000,null,null],[543,"Rechargeable LED and Lighter 2 in 1",71000,56000,null,null],[544,"عصارة بالطرد المركزي RAF ضمان 6 أشهر",91000,76000,null,null],[545,"مكنسة 3 في 1 RAF ضمان 6 أشهر",87000,72000,null,null],[546,"عرض 3 قطع جهاز طارد الحشرات Pest Reject بضمان",78000,63000,null,null],[547,"جهاز تنظيف بالبخار RAF ضمان 6 أشهر",90000,75000,null,null],[548,"سجادة صلاة بمسند للظهر",74000,59000,null,null],[549,"مبخرة إلكترونية مع القرآن الكريم",78000,63000,null,null],[550,"كشاف حساس بالطاقة الشمسية",71000,56000,null,null],[551,"عصارة بالطرد المركزي للفواكه الكاملة Silver Crest",88000,73000,null,null],[552,"مسحة زجاج مزدوجة مغناطيسية",70000,55000,null,null],[553,"عصارة برتقال كهربائية RAF ضمان 6 أشهر",88500,73500,null,null],[554,"ماكينة صنع البيتيفور",67000,52000,null,null],[555,"طباخ باللمس Silver Crest ضمان 6 أشهر",82000,67000,null,null],[556,"خلاط BARDEFU 6 في 1 ضمان 6 أشهر",100000,85000,null,null],[557,"طقم رعاية طبي (مساعد دووش + 2 كيس فواطم + شرشف بيج)",118000,103000,null,null],[558,"طقم رعاية طبي (مساعد دووش + 2 كيس فواطم + شرشف أبيض)",118000,103000,null,null],[559,"طقم رعاية طبي (مساعد دووش + 2 كيس فواطم + شرشف رمادي)",118000,103000,null,null],[560,"خلاط يدوي 4 في 1 ضمان 6 أشهر",84000,69000,null,null],[561,"منظم ملابس للزاوية",74000,59000,null,null],[562,"مسحة زجاج بشحن لاسلكي",100000,85000,null,null],[563,"كرسي محمول للشنطة",76000,61000,null,null],[564,"مصفاة وعجان 3 في 1",73000,58000,null,null],[565,"عرض مجموعة تحضير قهوة + قطاعة خضروات آمنة",74500,59500,null,null],[566,"الطاحونة القوية Silver Crest ضمان 6 أشهر",87000,72000,null,null],[567,"صانع الوافل المحمول JANO ضمان 6 أشهر",103000,88000,null,null],[568,"لمبة ذكية USB",73000,58000,null,null],[569,"مفرش طاولة بوهيمي (5 قطع) 10 مقاعد لون بني",106000,91000,null,null],[570,"مفرش طاولة بوهيمي (5 قطع) 10 مقاعد لون رمادي فاتح",106000,91000,null,null],[571,"مفرش طاولة بوهيمي (5 قطع) 10 مقاعد لون رمادي غامق",106000,91000,null,null],[572,"ستارة فروع مضيئة",70000,55000,null,null],[573,"مبخرة إلكترونية",75000,60000,null,null],[574,"قطاعة خضروات Veggie Slicer",71000,56000,null,null],[575,"جهاز غلق أكياس بالتفريغ",68000,53000,null,null],[576,"عرض قطعتين مروحة شحن محمولة",85000,70000,null,null],[577,"عرض قطعتين مروحة سقف بمصباح LED",84000,69000,null,null],[578,"عرض قطعتين ستارة مغناطيسية عازلة للحشرات",68000,53000,null,null],[579,"مسحة زجاج مع بخاخ",77000,62000,null,null],[580,"جهاز تعقيم وإذابة 4 في 1",80000,65000,null,null],[581,"مكنسة روبوت بالتحكم عبر التطبيق",102000,87000,null,null],[582,"عرض قطعتين مسن سكاكين إلكتروني",74000,59000,null,null],[583,"شفاط هواء مع أنبوب ألومنيوم",93000,78000,null,null],[584,"جهاز ضغط وغسيل 2 في 1",88000,73000,null,null],[585,"كشاف فائق السطوع ببطارية ليثيوم",80000,65000,null,null],[586,"مضخة هواء محمولة للشفط والنفخ",72000,57000,null,null],[587,"عرض قطعتين كرسي محمول قابل للطي",82500,67500,null,null],[588,"مكيف وتدفئة 2 في 1 Silver Crest",89000,74000,null,null],[589,"مبرد هواء محمول صغير",92000,77000,null,null],[590,"صاعق حشرات بقاعدة قابلة لإعادة الشحن",73000,58000,null,null],[591,"ستاند ملابس زوجي",77000,62000,null,null],[592,"ماكينة صنع آيس كريم Silver Crest بضمان 6 أشهر",102000,87000,null,null],[593,"قدر بديل للطباخ الكهربائي بضمان 6 أشهر",96000,81000,null,null],[594,"مكنسة روبوت Smart Home بضمان 6 أشهر",77000,62000,null,null],[595,"مجموعة BARDEFU 6 في 1 خلاط + عصارة فواكه بالشحن",115000,100000,null,null],[596,"عرض BARDEFU 6 IN 1 خلاط + صانعة الثلج الفورية",188000,173000,null,null],[597,"عرض كرسي نفخ ترند + مضخة هواء محمولة",91000,76000,null,null],[598,"ثلاجة محمولة 8 لتر للسيارة والمنزل DENX بضمان",97000,82000,null,null],[599,"عرض صانع وافل بالشحن + ماكينة باستا",107000,92000,null,null],[600,"عرض موقد شواء 3 طوابق + جهاز ضغط 2 في 1",122000,107000,null,null],[601,"عرض مكنسة روبوت Smart Home + مروحة شحن محمولة",86000,71000,null,null],[602,"عرض صانعة ثلج فورية 2 لتر + مروحة شحن محمولة",153000,138000,null,null],[603,"عرض لمبة LED ذكية + جهاز ليزر حفلات Star Shower",81000,66000,null,null],[604,"عرض 3 أجهزة قياس أسطوانة الغاز",70000,55000,null,null],[605,"بخاخ تبريد متعدد الاستخدامات",70000,55000,null,null],[606,"موزع سوائل كهربائي محمول",86000,71000,null,null],[607,"مبرد هواء عمودي بالريموت كنترول DENX بضمان 6 أشهر",91000,76000,null,null],[608,"مروحة تعمل بالطاقة الشمسية",95000,80000,null,null],[609,"صانعة ثلج للسيارة والمنزل",130000,115000,null,null],[610,"دوش محمول مع مضخة",88000,73000,null,null],[611,"قفل باب ذكي Smart Lock",123000,108000,null,null],[612,"مبرد هواء محمول صغير Turbo Fan",81000,66000,null,null],[613,"كشاف فحص LED بالأشعة فوق البنفسجية",88000,73000,null,null],[614,"مكنسة ولمامة 2 في 1",90000,75000,null,null],[615,"ماكينة صنع آيس كريم Soft Ice Cream",123000,108000,null,null],[616,"ممسحة كهربائية قابلة لإعادة الشحن",92000,77000,null,null],[617,"مسدس تعقيم محمول",87000,72000,null,null],[618,"مكيف صحراوي 10 لتر بالطاقة الشمسية",147000,132000,null,null],[619,"مكيف صحراوي 25 لتر بضمان 6 أشهر",144500,129500,null,null],[620,"مبرد هواء عمودي",95000,80000,null,null],[621,"مكيف هواء منزلي صحراوي 10 لتر بضمان 6 أشهر",119500,104500,null,null],[622,"كشاف طاقة شمسية للحائط",79000,64000,null,null],[623,"ماكينة صنع آيس كريم بضمان عام",105000,90000,null,null],[624,"عرض آلة صنع الآيس كريم + شريط الألمنيوم اللاصق",82000,67000,null,null],[625,"عرض قطعتين فلتر ماء سهل التركيب",73000,58000,null,null],[626,"مبرد محمول بباور بانك 3 في 1",81000,66000,null,null],[627,"ماكينة غزل البنات",80500,65500,null,null],[628,"آلة صنع الآيس كريم ضمان 6 أشهر",80500,65500,null,null],[629,"محضرة طعام 3 لتر",80000,65000,null,null],[630,"عرض خلاط Silver Crest الألماني + طاحونة + محضرة طعام",98500,83500,null,null],[631,"كرسي استراحة هزاز",138000,123000,null,null],[632,"موقد غاز 4 عيون بحامل",121000,106000,null,null],[633,"عرض ممسحة كهربائية + قطعتين ستارة مغناطيسية",91000,76000,null,null],[634,"مكنسة جاف ورطب قوية Hitachi 45 لتر",114000,99000,null,null],[635,"محضرة قهوة كهربائية + كوب ستيل 2 في 1",82000,67000,null,null],[636,"خلاط يدوي 5 في 1 Sokany ضمان عام",84000,69000,null,null],[637,"عرض خرطوم مياه قابل للتمدد Magic Hose + فرشاة دوارة",77000,62000,null,null],[638,"كشاف طاقة شمسية 9 لمبات Solar Sensor Light",75000,60000,null,null],[639,"كشاف بباور بانك الحديث",80000,65000,null,null],[640,"خلاط يدوي 4 في 1 ضمان 6 أشهر",84000,69000,null,null]]};
@@ -1,4 +1,5 @@
-[
+// بيانات جميع المنتجات (640 منتج)
+const allProducts = [
   {
     "id": 1,
     "title": "عرض منشار كهربائى ببطارية + مفك براغى 48 قطعه شحن",
@@ -5584,4 +5585,4 @@
     "description": "خلاط يدوي 4 في 1، أداة متعددة للمطبخ. يخلط ويهرس ويخفق ويطحن بسهولة. يأتي مع ضمان لمدة 6 أشهر، مثالي لتحضير الوجبات بسرعة.",
     "slug": "خلاط-يدوي-4-في-1-ضمان-6-أشهر"
   }
-]
\ No newline at end of file
+];
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قياس أداء بناء الكتالوج على كتالوجات عربية مصطنعة بأحجام مختلفة
+
+لكل حجم يُنشأ catalog.jsonl بنفس حقول الكتالوج الحقيقي في مجلد مؤقت،
+ثم تُشغَّل المراحل التالية كلٌّ في عملية مستقلة (حتى يكون أقصى RSS خاصاً بها):
+
+- generate_cold: generate_products.build() على مجلد فارغ
+- generate_noop: نفس البناء مرة ثانية بدون تغيير (البناء التزايدي)
+- schema: generate_enhanced_schema لكل منتج في الذاكرة
+- fix_schema: fix-schema.py على الصفحات المولّدة
+- indexes: data/listing.js و data/search.js وخريطة الموقع وحدها
+
+لكل مرحلة: زمن التنفيذ، صفحة/ثانية، أقصى RSS، والبايتات المكتوبة.
+النتائج تُحفظ JSON للمقارنة بين التشغيلات.
+
+استخدام (من أي مجلد):
+python benchmarks/bench_build.py
+python benchmarks/bench_build.py --sizes 640 10000 100000 --workers 4
+python benchmarks/bench_build.py --stages generate_cold indexes --compare benchmarks/results/old.json
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from build_io import peak_memory_mb  # noqa: E402
+from catalog import iter_products  # noqa: E402
+from facet_index import FacetIndexBuilder  # noqa: E402
+from listing_index import ListingIndexBuilder, slugify  # noqa: E402
+from search_index import SearchIndexBuilder  # noqa: E402
+
+RESULTS_DIR = os.path.join(REPO_DIR, 'benchmarks', 'results')
+DEFAULT_SIZES = (640, 10000, 100000)
+STAGES = ('generate_cold', 'generate_noop', 'schema', 'fix_schema', 'indexes')
+
+NOUNS = ('خلاط', 'مكواة', 'سماعة', 'ساعة ذكية', 'شاحن', 'مكنسة', 'كريم', 'سيروم', 'مبرد', 'تابلت',
+         'منشار كهربائي', 'مفك براغي', 'كاميرا مراقبة', 'مصباح', 'ماكينة حلاقة', 'مجفف شعر')
+QUALIFIERS = ('لاسلكي', 'محمول', 'بالشحن', 'ذكي', 'احترافي', 'مقاوم للماء', 'متعدد الاستخدامات', 'صغير')
+BRANDS = ('Sokany', 'Silver Crest', 'BARDEFU', 'Xiaomi', 'Cosrx', 'Air Tab', 'DLC', 'Philips')
+SENTENCES = (
+    "يجمع هذا المنتج بين الأداء المتميز والراحة التي تبحث عنها.",
+    "تصميمه العصري وخصائصه المتقدمة تجعله رفيقاً مثالياً لتحقيق الراحة والكفاءة.",
+    "اختبر الجودة والكفاءة التي يستحقها كل من يقدر الابتكار والتطور.",
+    "بفضل تصميمه الأنيق وسهولة استخدامه، سيصبح جزءاً من روتينك اليومي.",
+    "اجعل هذا المنتج خيارك الأول وتمتع بحياة أفضل.",
+    "مناسب للاستخدام اليومي في المنزل والعمل والسفر.",
+)
+
+
+def synthetic_products(size, seed=0, duplicate_every=50):
+    """
+    منتجات مصطنعة بنفس حقول وأحجام الكتالوج الحقيقي (عنوان ~30 حرفاً، وصف ~300)
+    كل duplicate_every منتج يكرر slug منتج سابق كما يحدث في الكتالوج الحقيقي
+    """
+    rng = random.Random(seed)
+    slugs = []
+    for i in range(1, size + 1):
+        title = (f"{rng.choice(NOUNS)} {rng.choice(QUALIFIERS)} {rng.choice(BRANDS)} "
+                 f"{rng.randint(1, 999)} ضمان {rng.choice((3, 6, 12))} أشهر")
+        if duplicate_every and slugs and i % duplicate_every == 0:
+            slug = rng.choice(slugs)
+        else:
+            slug = f"{slugify(title)}-{i}"
+            slugs.append(slug)
+        price = rng.randrange(20000, 200000, 500)
+        intro = f"لا تدع فرصة اقتناء منتج '{title}' تفوتك. "
+        yield {
+            'id': i,
+            'title': title,
+            'price': price,
+            'sale_price': price - rng.randrange(5000, price // 3, 500),
+            'image_link': f"https://media.taager.com/360x360/{rng.getrandbits(128):032x}.png",
+            'description': intro + ' '.join(rng.sample(SENTENCES, 4)),
+            'slug': slug,
+        }
+
+
+def write_synthetic_catalog(path, size, seed=0):
+    """كتابة كتالوج مصطنع بصيغة JSON Lines"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for product in synthetic_products(size, seed):
+            f.write(json.dumps(product, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+
+def load_fix_schema():
+    """fix-schema.py اسمه يحتوي '-' فيُحمَّل بالمسار"""
+    spec = importlib.util.spec_from_file_location('fix_schema', os.path.join(REPO_DIR, 'fix-schema.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bytes_written_since(root, start_ns):
+    """
+    مجموع أحجام الملفات التي كُتبت تحت root بعد start_ns
+    (بدون حفظ قائمة الملفات في الذاكرة حتى لا يتأثر قياس RSS)
+    """
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            st = os.stat(os.path.join(dirpath, name))
+            if st.st_mtime_ns >= start_ns:
+                total += st.st_size
+    return total
+
+
+def run_stage(stage, work_dir, workers):
+    """تشغيل مرحلة واحدة (داخل عملية مستقلة)، يعيد (عدد الصفحات، تفاصيل إضافية)"""
+    catalog_file = os.path.join(work_dir, 'catalog.jsonl')
+    site_dir = os.path.join(work_dir, 'site')
+    output_dir = os.path.join(site_dir, 'products')
+    manifest_file = os.path.join(work_dir, 'build-manifest.json')
+
+    if stage in ('generate_cold', 'generate_noop'):
+        import generate_products
+        # كل ملفات البناء الجانبية داخل work_dir حتى لا يكتب القياس في مجلد التشغيل
+        stats, errors = generate_products.build(catalog_file, output_dir, manifest_file,
+                                                workers=workers, site_dir=site_dir, verbose=False,
+                                                image_mirror=os.path.join(work_dir, 'image-mirror'),
+                                                image_cache=os.path.join(work_dir, 'image-cache.json'),
+                                                lint_file=os.path.join(work_dir, 'catalog-lint.json'))
+        return stats['total'], {'created': stats['created'], 'updated': stats['updated'],
+                                'unchanged': stats['unchanged'], 'errors': len(errors)}
+
+    if stage == 'schema':
+        from product_schema import generate_enhanced_schema
+        count = 0
+        for product in iter_products(catalog_file):
+            generate_enhanced_schema(product)
+            count += 1
+        return count, {}
+
+    if stage == 'fix_schema':
+        counts, _, total = load_fix_schema().fix_products_dir(output_dir, workers=workers, verbose=False)
+        return total, counts
+
+    if stage == 'indexes':
+        from sitemap import write_sitemaps
+        index_dir = os.path.join(work_dir, 'indexes')
+        # مرور واحد على الكتالوج كما في generate_products.build
+        listing, search, facets = ListingIndexBuilder(index_dir), SearchIndexBuilder(), FacetIndexBuilder()
+        lastmod = {}
+        for position, product in enumerate(iter_products(catalog_file), 1):
+            listing.add(product, position)
+            search.add(product)
+            facets.add(product)
+            lastmod[product['slug']] = '2025-01-01'
+        files = listing.finish() + search.finish(index_dir) + facets.finish(index_dir)
+        files += write_sitemaps(sorted(lastmod.items()), index_dir)
+        return len(listing.rows), {'files': files}
+
+    raise ValueError(f"مرحلة غير معروفة: {stage}")
+
+
+def measure_stage(stage, work_dir, workers):
+    """قياس مرحلة: الزمن والبايتات المكتوبة وأقصى RSS (يُستدعى في عملية جديدة)"""
+    start_ns = time.time_ns()
+    started = time.perf_counter()
+    pages, details = run_stage(stage, work_dir, workers)
+    seconds = time.perf_counter() - started
+    return {
+        'stage': stage,
+        'pages': pages,
+        'seconds': round(seconds, 4),
+        'pages_per_sec': round(pages / seconds, 1) if seconds else None,
+        'peak_rss_mb': round(peak_memory_mb(), 1),
+        'bytes_written': bytes_written_since(work_dir, start_ns),
+        **details,
+    }
+
+
+def bench_size(size, stages, workers, seed=0):
+    """كل المراحل لحجم واحد في مجلد مؤقت يُحذف بعد الانتهاء"""
+    work_dir = tempfile.mkdtemp(prefix=f'iraq-store-bench-{size}-')
+    try:
+        started = time.perf_counter()
+        write_synthetic_catalog(os.path.join(work_dir, 'catalog.jsonl'), size, seed)
+        print(f"\n📦 {size:,} منتج (تجهيز الكتالوج: {time.perf_counter() - started:.2f} ثانية)")
+
+        results = []
+        # spawn: كل مرحلة تبدأ بعملية نظيفة حتى لا يرث RSS من المراحل السابقة
+        context = get_context('spawn')
+        for stage in stages:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(measure_stage, stage, work_dir, workers).result()
+            results.append(result)
+            print(f"   {stage:<14} {result['seconds']:9.2f} s  {result['pages_per_sec'] or 0:10,.0f} صفحة/ث"
+                  f"  {result['peak_rss_mb']:7.1f} MB  {result['bytes_written'] / 1e6:9.2f} MB مكتوبة")
+        return {'size': size, 'stages': results}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def git_revision():
+    """رقم الـ commit الحالي (أو None خارج git)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_file):
+    """طباعة نسبة الزمن لكل (حجم، مرحلة) مقارنة بملف نتائج سابق"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    old = {(run['size'], s['stage']): s for run in baseline['runs'] for s in run['stages']}
+
+    print(f"\n📊 مقارنة مع {baseline_file} ({baseline.get('git_revision')}):")
+    for run in results['runs']:
+        for stage in run['stages']:
+            previous = old.get((run['size'], stage['stage']))
+            if previous and previous['seconds']:
+                ratio = stage['seconds'] / previous['seconds']
+                flag = '⚠️' if ratio > 1.1 else '✅'
+                print(f"   {flag} {run['size']:>7,} {stage['stage']:<14} {previous['seconds']:8.2f}s ← "
+                      f"{stage['seconds']:8.2f}s ({ratio:.2f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='قياس أداء بناء الكتالوج')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='أحجام الكتالوج')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES), help='المراحل')
+    parser.add_argument('--workers', type=int, default=1, help='عدد عمليات إنشاء الصفحات (0 = عدد الأنوية)')
+    parser.add_argument('--seed', type=int, default=0, help='بذرة الكتالوج المصطنع')
+    parser.add_argument('--output', help='ملف النتائج JSON (الافتراضي: benchmarks/results/<التاريخ>.json)')
+    parser.add_argument('--compare', help='ملف نتائج سابق للمقارنة')
+    args = parser.parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+
+    now = datetime.now(timezone.utc)
+    results = {
+        'created_at': now.isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'workers': workers,
+        'seed': args.seed,
+        'runs': [bench_size(size, args.stages, workers, args.seed) for size in args.sizes],
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"build-{now.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 النتائج: {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
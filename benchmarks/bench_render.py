@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+مقارنة سرعة إنشاء صفحات المنتجات: القالب المترجم مسبقاً (templates/product.html)
+مقابل f-string القديم في create_product_page
+
+استخدام (من أي مجلد):
+python benchmarks/bench_render.py
+python benchmarks/bench_render.py --repeat 20 --catalog feed.jsonl
+"""
+
+import argparse
+import os
+import sys
+import time
+from urllib.parse import quote
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from catalog import CATALOG_FILE, load_products  # noqa: E402
+from generate_products import ASSETS_DIR, PRODUCT_CSS_FILE, create_product_page, minify_html  # noqa: E402
+from product_schema import discount_percent, generate_enhanced_schema  # noqa: E402
+
+
+def legacy_create_product_page(product):
+    """create_product_page قبل القوالب المترجمة: f-string كبير يُعاد تنسيقه لكل منتج"""
+    whatsapp_number = "201110760081"
+    discount = discount_percent(product)
+
+    # رسالة WhatsApp
+    title = product.get('title', 'منتج')
+    sale_price = product.get('sale_price', 0)
+    whatsapp_message = f"مرحباً، أريد طلب المنتج التالي:%0A%0A📦 {quote(title)}%0A💰 السعر: {sale_price:,} د.ع"
+    whatsapp_url = f"https://wa.me/{whatsapp_number}?text={whatsapp_message}"
+
+    # مسار الصورة الصحيح (بدون ../)
+    image_url = product.get('image_link', '')
+
+    # الوصف
+    description = product.get('description', 'منتج عالي الجودة بأفضل سعر')[:160]
+
+    # JSON-LD الكامل (بيانات التاجر، الشحن، الإرجاع، التقييم) يُولَّد هنا مباشرة
+    schema = generate_enhanced_schema(product)
+
+    html = f"""<!DOCTYPE html>
+<html dir="rtl" lang="ar">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+
+    <!-- SEO Meta Tags -->
+    <title>{title} - متجر العراق</title>
+    <meta name="description" content="{description}">
+    <meta name="keywords" content="{title}, متجر العراق, {title} سعر, شراء {title}">
+    <meta name="author" content="متجر العراق">
+    <meta name="robots" content="index, follow">
+    <link rel="canonical" href="https://sherow1982.github.io/1/products/{product.get('slug', '')}.html">
+
+    <!-- Open Graph -->
+    <meta property="og:type" content="product">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{description}">
+    <meta property="og:image" content="{image_url}">
+    <meta property="og:url" content="https://sherow1982.github.io/1/products/{product.get('slug', '')}.html">
+    <meta property="og:price:amount" content="{sale_price}">
+    <meta property="og:price:currency" content="IQD">
+
+    <!-- Twitter Card -->
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:title" content="{title}">
+    <meta name="twitter:description" content="{description}">
+    <meta name="twitter:image" content="{image_url}">
+
+    <!-- Bootstrap RTL -->
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.rtl.min.css">
+    <link href="https://fonts.googleapis.com/css2?family=Cairo:wght@400;600;700&display=swap" rel="stylesheet">
+
+    <!-- Structured Data -->
+{schema}
+
+    <link rel="stylesheet" href="../{ASSETS_DIR}/{PRODUCT_CSS_FILE}">
+</head>
+<body>
+    <nav class="navbar">
+        <div class="container">
+            <a class="navbar-brand" href="../index.html">🛒 متجر العراق</a>
+        </div>
+    </nav>
+
+    <div class="product-container">
+        <a href="../index.html" class="btn-back">← العودة للرئيسية</a>
+
+        <div class="product-header">
+            <h1>{title}</h1>
+        </div>
+
+        <div class="product-content">
+            <div class="row p-4">
+                <div class="col-md-6 text-center">
+                    <img src="{image_url}" alt="{title}" class="product-image" loading="lazy">
+                </div>
+
+                <div class="col-md-6">
+                    <div class="price-section">
+                        <div class="mb-3">
+                            <span class="discount-badge">خصم {discount}%</span>
+                        </div>
+                        <div>
+                            <span class="old-price">{product.get('price', 0):,} د.ع</span>
+                        </div>
+                        <div class="new-price">{sale_price:,} د.ع</div>
+                    </div>
+
+                    <div class="description">
+                        <h3 style="color: #2d3748; margin-bottom: 1rem;">📋 وصف المنتج</h3>
+                        <p>{product.get('description', 'منتج عالي الجودة بأفضل سعر')}</p>
+                    </div>
+
+                    <div class="text-center mt-4">
+                        <a href="{whatsapp_url}" target="_blank" rel="noopener" class="btn-whatsapp">
+                            📱 اطلب المنتج واتساب
+                        </a>
+                        <p class="mt-3" style="color: #666; font-size: 0.95rem;">
+                            سيتم فتح محادثة واتساب مع تفاصيل المنتج
+                        </p>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <footer>
+        <div class="container">
+            <p>© 2025 متجر العراق - جميع الحقوق محفوظة</p>
+            <p style="font-size: 0.9rem; margin-top: 0.5rem; opacity: 0.7;">
+                للاستفسارات: <a href="https://wa.me/201110760081" style="color: #25D366;">واتساب</a>
+            </p>
+        </div>
+    </footer>
+</body>
+</html>"""
+
+    return minify_html(html)
+
+
+def pages_per_second(render, products, repeat):
+    """أفضل نتيجة من repeat تكرارات (صفحة/ثانية)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for product in products:
+            render(product)
+        best = min(best, time.perf_counter() - start)
+    return len(products) / best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='مقارنة سرعة إنشاء صفحات المنتجات')
+    parser.add_argument('--catalog', default=os.path.join(REPO_DIR, CATALOG_FILE), help='ملف بيانات المنتجات')
+    parser.add_argument('--repeat', type=int, default=5, help='عدد التكرارات (تؤخذ أفضل نتيجة)')
+    args = parser.parse_args(argv)
+
+    products = load_products(args.catalog)
+    print(f"📦 {len(products)} منتج، أفضل نتيجة من {args.repeat} تكرارات\n")
+
+    legacy = pages_per_second(legacy_create_product_page, products, args.repeat)
+    template = pages_per_second(create_product_page, products, args.repeat)
+    print(f"   f-string القديم:       {legacy:10,.0f} صفحة/ثانية")
+    print(f"   القالب المترجم مسبقاً: {template:10,.0f} صفحة/ثانية")
+    print(f"   ⚡ التسريع: {template / legacy:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+أدوات الكتابة المشتركة لسكريبتات البناء - Iraq-Store
+
+- write_page: كتابة ذرّية (ملف مؤقت ثم os.replace)
+- write_if_changed: لا يكتب إذا كان المحتوى على القرص مطابقاً
+- write_chunks_if_changed: نفس الشيء لملف كبير يُكتب على أجزاء (ذاكرة ثابتة)
+- write_precompressed: نسخ .gz و .br بجانب الملف ليقدّمها الخادم مضغوطة مسبقاً
+- precompressed_variants: نفس النسخ في الذاكرة بدون كتابة
+- dumps: JSON مضغوط بدون مسافات (صفوف الفهارس وسطور الكتالوج)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import zlib
+
+try:
+    import brotli
+except ImportError:  # اختياري: بدونه تُكتب نسخ .gz فقط
+    brotli = None
+
+BROTLI_QUALITY = 11
+PRECOMPRESSED_SUFFIXES = ('.gz', '.br') if brotli is not None else ('.gz',)
+
+
+def dumps(value):
+    """JSON مضغوط بدون مسافات"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_page(filename, page_html):
+    """
+    كتابة ذرّية لصفحة واحدة: ملف مؤقت في نفس المجلد ثم os.replace
+    حتى لا يترك أي تشغيل مقطوع صفحة نصف مكتوبة
+    """
+    tmp_path = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(page_html)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_if_changed(filename, text):
+    """كتابة الملف فقط إذا تغيّر محتواه، يعيد True عند الكتابة"""
+    try:
+        with open(filename, 'r', encoding='utf-8', newline='') as f:
+            if f.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    write_page(filename, text)
+    return True
+
+
+def file_digest(filename, chunk_size=1 << 16):
+    """sha256 لمحتوى ملف (أو None إذا لم يوجد) بدون قراءته كاملاً في الذاكرة"""
+    digest = hashlib.sha256()
+    try:
+        with open(filename, 'rb') as f:
+            for block in iter(lambda: f.read(chunk_size), b''):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def write_chunks_if_changed(filename, chunks):
+    """
+    كتابة ملف كبير من أجزاء bytes إلى ملف مؤقت مع حساب البصمة، ثم استبدال
+    الملف الأصلي فقط إذا اختلفت البصمة. يعيد True عند الكتابة
+    """
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    tmp_path = f"{filename}.{os.getpid()}.tmp"
+    digest = hashlib.sha256()
+    try:
+        with open(tmp_path, 'wb') as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+        if digest.hexdigest() == file_digest(filename):
+            os.remove(tmp_path)
+            return False
+        os.replace(tmp_path, filename)
+        return True
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def iter_gzip(chunks):
+    """ضغط gzip على أجزاء بدون اسم ملف أو وقت في الرأس (نفس المدخل = نفس البايتات)"""
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def precompressed_variants(data):
+    """[(اللاحقة، المحتوى المضغوط)] لنسخ .gz و .br في الذاكرة (لوضع الأرشيف مثلاً)"""
+    variants = [('.gz', b''.join(iter_gzip([data])))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=BROTLI_QUALITY)))
+    return variants
+
+
+def write_precompressed(filename, data=None):
+    """
+    كتابة filename.gz و filename.br (إذا توفرت مكتبة brotli) من محتوى الملف
+    data: محتوى الملف bytes إن كان في الذاكرة أصلاً (وإلا يُقرأ من القرص)
+    يعيد عدد الملفات التي كُتبت
+    """
+    if data is None:
+        with open(filename, 'rb') as f:
+            data = f.read()
+    return sum(write_chunks_if_changed(f"{filename}{suffix}", [compressed])
+               for suffix, compressed in precompressed_variants(data))
+
+
+def sync_precompressed(filename, changed=True):
+    """نفس write_precompressed لكن فقط إذا تغيّر الملف أو نقصت إحدى النسخ المضغوطة"""
+    if changed or not all(os.path.exists(filename + suffix) for suffix in PRECOMPRESSED_SUFFIXES):
+        return write_precompressed(filename)
+    return 0
+
+
+def remove_with_siblings(filename):
+    """حذف الملف ونسخه المضغوطة (.gz و .br) إن وُجدت"""
+    for path in (filename, f"{filename}.gz", f"{filename}.br"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def peak_memory_mb():
+    """
+    أقصى استخدام للذاكرة (RSS) بالميجابايت للعملية الحالية أو أكبر عملية فرعية
+    (عمال الـ process pool)، أو 0 إذا لم تتوفر وحدة resource (ويندوز)
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss بالكيلوبايت على لينكس وبالبايت على macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+مؤقتات المراحل والتنميط (--profile) لسكريبتات البناء - Iraq-Store
+
+BuildProfile يجمع:
+- زمن كل مرحلة وعدد مرات تنفيذها (قراءة الكتالوج، إنشاء الصفحة، الكتابة...)
+- أبطأ N ملف (heap بحجم ثابت، فلا تكبر الذاكرة مع عدد الصفحات)
+
+ثم يطبع ملخصاً مختصراً بدلاً من رسائل التقدم، ويكتب ملف مقاييس JSON.
+run_profiled يشغّل الدالة تحت cProfile اختيارياً ويحفظ ملف .prof
+(يُقرأ بـ python -m pstats أو snakeviz).
+"""
+
+import cProfile
+import heapq
+import json
+import pstats
+import time
+from contextlib import contextmanager
+
+from build_io import peak_memory_mb, write_page
+
+SLOWEST_FILES = 10
+
+
+class BuildProfile:
+    """مؤقتات المراحل + أبطأ الملفات"""
+
+    def __init__(self, tool, slowest=SLOWEST_FILES):
+        self.tool = tool
+        self.slowest_n = slowest
+        self.stages = {}
+        self.files = []
+        self.started = time.perf_counter()
+
+    def add(self, stage, seconds, count=1):
+        """إضافة زمن لمرحلة (تراكمي)"""
+        entry = self.stages.get(stage)
+        if entry is None:
+            self.stages[stage] = [seconds, count]
+        else:
+            entry[0] += seconds
+            entry[1] += count
+
+    @contextmanager
+    def stage(self, name):
+        """with profile.stage('sitemap'): ..."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def timed_iter(self, name, iterable):
+        """تمرير iterable مع احتساب زمن كل next() ضمن المرحلة name (مثل قراءة الكتالوج)"""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(name, time.perf_counter() - started, 0)
+                return
+            self.add(name, time.perf_counter() - started)
+            yield item
+
+    def add_file(self, name, timings):
+        """تسجيل ملف واحد: timings = {المرحلة: ثوانٍ}، يُحتفظ بأبطأ N فقط"""
+        for stage, seconds in timings.items():
+            self.add(stage, seconds)
+        if self.slowest_n:
+            entry = (sum(timings.values()), name, timings)
+            if len(self.files) < self.slowest_n:
+                heapq.heappush(self.files, entry)
+            elif entry[0] > self.files[0][0]:
+                heapq.heapreplace(self.files, entry)
+
+    def slowest(self):
+        """أبطأ الملفات، الأبطأ أولاً"""
+        return sorted(self.files, key=lambda entry: entry[0], reverse=True)
+
+    def to_dict(self, **extra):
+        """المقاييس كقاموس قابل للتحويل إلى JSON"""
+        total = time.perf_counter() - self.started
+        return {
+            'tool': self.tool,
+            'total_seconds': round(total, 4),
+            'peak_memory_mb': round(peak_memory_mb(), 1),
+            'stages': {name: {'seconds': round(seconds, 4), 'count': count}
+                       for name, (seconds, count) in self.stages.items()},
+            'slowest_files': [{'file': name, 'seconds': round(seconds, 6),
+                               'stages': {k: round(v, 6) for k, v in timings.items()}}
+                              for seconds, name, timings in self.slowest()],
+            **extra,
+        }
+
+    def write(self, path, **extra):
+        """كتابة ملف المقاييس JSON، يعيد القاموس المكتوب"""
+        metrics = self.to_dict(**extra)
+        write_page(path, json.dumps(metrics, ensure_ascii=False, indent=2) + '\n')
+        return metrics
+
+    def print_summary(self, metrics):
+        """ملخص مختصر: المراحل مرتبة بالزمن ثم أبطأ الملفات"""
+        print(f"⏱️ {metrics['tool']}: {metrics['total_seconds']:.2f} ثانية، "
+              f"أقصى ذاكرة {metrics['peak_memory_mb']:.1f} MB")
+        stages = sorted(metrics['stages'].items(), key=lambda item: item[1]['seconds'], reverse=True)
+        for name, stage in stages:
+            print(f"   {name:<12} {stage['seconds'] * 1000:10.1f} ms  ×{stage['count']}")
+        if metrics['slowest_files']:
+            print(f"🐢 أبطأ {len(metrics['slowest_files'])} ملفات:")
+            for entry in metrics['slowest_files']:
+                print(f"   {entry['seconds'] * 1000:8.2f} ms  {entry['file']}")
+
+
+def run_profiled(func, cprofile_path=None, top=20):
+    """
+    تشغيل func() وإعادة نتيجتها، مع cProfile إذا أُعطي cprofile_path
+    (يُحفظ ملف .prof وتُطبع أعلى الدوال حسب الزمن التراكمي)
+    """
+    if not cprofile_path:
+        return func()
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        profiler.dump_stats(cprofile_path)
+        print(f"🔬 cProfile: {cprofile_path}")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(top)
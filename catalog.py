@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+الكتالوج المرجعي وقراءته منتجاً منتجاً - Iraq-Store
+
+catalog.jsonl هو المصدر الوحيد لبيانات المنتجات (منتج في كل سطر، أنواع
+موحّدة: id و price و sale_price أرقام). products.js (const allProducts = [...]
+لصفحة products/index.html) مشتق منه ويعيد generate_products.py توليده فقط
+عندما يتغير catalog.jsonl.
+
+لا تعدّل products.js يدوياً. لاستيراد ملف منتجات جديد:
+python catalog.py import feed.json
+
+iter_products يقرأ الملف على دفعات ويعيد المنتجات واحداً تلو الآخر بدون
+تحميل الملف كاملاً في الذاكرة، سواء كان:
+
+- مصفوفة JSON واحدة (مثل ملفات التصدير)
+- JSON Lines (منتج في كل سطر) - .jsonl / .ndjson
+"""
+
+import json
+import os
+import sys
+
+from build_io import PRECOMPRESSED_SUFFIXES, dumps, file_digest, sync_precompressed, write_chunks_if_changed
+
+CATALOG_FILE = 'catalog.jsonl'
+CHUNK_SIZE = 1 << 16
+JSON_WHITESPACE = ' \t\r\n'
+FIELDS = ('id', 'title', 'price', 'sale_price', 'image_link', 'description', 'slug')
+INT_FIELDS = ('id', 'price', 'sale_price')
+
+# النسخ المشتقة من الكتالوج
+VIEWS = ('products.js',)
+
+
+def normalize_product(data):
+    """
+    توحيد الأنواع ("12" ← 12 للحقول الرقمية) بترتيب الحقول الثابت وبدون
+    الحقول المعروفة الفارغة (None)؛ الحقول غير المعروفة تبقى في آخر القاموس
+    """
+    product = {name: data[name] for name in FIELDS if data.get(name) is not None}
+    for name in INT_FIELDS:
+        value = product.get(name)
+        if isinstance(value, str) and value.strip().lstrip('-').isdigit():
+            product[name] = int(value)
+    product.update((name, value) for name, value in data.items() if name not in FIELDS)
+    return product
+
+
+def iter_products(path, chunk_size=CHUNK_SIZE):
+    """قراءة المنتجات من ملف JSON array أو JSON Lines واحداً تلو الآخر"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            yield from iter_json_lines(f)
+            return
+
+        # تحديد الصيغة من أول حرف: [ مصفوفة، { سطر JSON
+        head = f.read(chunk_size)
+        first = head.lstrip(JSON_WHITESPACE)[:1]
+        if first == '{':
+            f.seek(0)
+            yield from iter_json_lines(f)
+        else:
+            yield from iter_json_array(f, head, chunk_size)
+
+
+def iter_json_lines(f):
+    """JSON Lines: منتج في كل سطر، الأسطر الفارغة تُتجاهل"""
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if line:
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"سطر {line_number}: {e}") from None
+
+
+def iter_json_array(f, buf='', chunk_size=CHUNK_SIZE):
+    """تحليل تدريجي لمصفوفة JSON: لا يُحتفظ في الذاكرة إلا بعنصر واحد ودفعة قراءة واحدة"""
+    decoder = json.JSONDecoder()
+    pos = 0
+    eof = False
+
+    def fill():
+        # إضافة دفعة جديدة مع حذف الجزء الذي تمت قراءته
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def next_token():
+        # أول حرف غير فارغ (مع القراءة عند الحاجة)
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return ''
+
+    if next_token() != '[':
+        raise ValueError("ملف الكتالوج يجب أن يكون مصفوفة JSON أو JSON Lines")
+    pos += 1
+
+    if next_token() == ']':
+        return
+
+    while True:
+        if not next_token():
+            raise ValueError("نهاية غير متوقعة لملف الكتالوج")
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except ValueError:
+            if fill():
+                continue
+            raise
+        # قيمة تنتهي عند حدود الدفعة قد تكون مقطوعة (رقم مثلاً): نقرأ المزيد ونعيد المحاولة
+        if end == len(buf) and not eof and fill():
+            continue
+        pos = end
+        yield item
+
+        token = next_token()
+        if token == ',':
+            pos += 1
+        elif token == ']':
+            return
+        else:
+            raise ValueError(f"فاصل غير متوقع في ملف الكتالوج: {token!r}")
+
+
+def load_products(path):
+    """تحميل كل المنتجات في قائمة (للملفات الصغيرة والاختبارات)"""
+    return list(iter_products(path))
+
+
+def write_catalog(products, path=CATALOG_FILE):
+    """كتابة الكتالوج المرجعي (JSON Lines)، يعيد True إذا تغيّر الملف"""
+    return write_chunks_if_changed(path, (f"{dumps(normalize_product(p))}\n".encode('utf-8') for p in products))
+
+
+def count_products(path):
+    """عدد المنتجات (عدّ الأسطر مباشرة في JSON Lines)"""
+    if path.endswith(('.jsonl', '.ndjson')):
+        with open(path, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+    return sum(1 for _ in iter_products(path))
+
+
+def iter_view(path, total=0):
+    """
+    محتوى products.js على أجزاء bytes بنفس تنسيق json.dumps(indent=2)
+    (نفس شكل الملف الموجود في الريبو حتى لا يتغير بدون سبب)
+    """
+    yield f"// بيانات جميع المنتجات ({total} منتج)\nconst allProducts = ".encode('utf-8')
+
+    empty = True
+    for product in iter_products(path):
+        if not isinstance(product, dict):
+            # سطر ليس منتجاً: generate_products.py يسجّله في الأخطاء
+            continue
+        item = json.dumps(normalize_product(product), ensure_ascii=False, indent=2).replace('\n', '\n  ')
+        yield (('[\n  ' if empty else ',\n  ') + item).encode('utf-8')
+        empty = False
+    yield b'[]' if empty else b'\n]'
+    yield b';\n'
+
+
+def sync_views(source=CATALOG_FILE, site_dir='.', stamp=None):
+    """
+    إعادة توليد النسخ المشتقة فقط إذا تغيّر الكتالوج (أو حُذفت إحدى النسخ)
+    مع نسخ .gz و .br مضغوطة مسبقاً
+    stamp: ما أعادته هذه الدالة في البناء السابق
+    يعيد (عدد الملفات المكتوبة، stamp الجديد)
+    """
+    source_hash = file_digest(source)
+    paths = [os.path.join(site_dir, name) for name in VIEWS]
+    expected = paths + [path + suffix for path in paths for suffix in PRECOMPRESSED_SUFFIXES]
+    if stamp == {'source': source_hash} and all(os.path.exists(p) for p in expected):
+        return 0, stamp
+
+    total = count_products(source)
+    written = 0
+    for path in paths:
+        changed = write_chunks_if_changed(path, iter_view(source, total))
+        written += changed + sync_precompressed(path, changed)
+    return written, {'source': source_hash}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in (2, 3) or argv[0] != 'import':
+        print("الاستخدام: python catalog.py import feed.json [catalog.jsonl]")
+        return 1
+
+    source = argv[1]
+    target = argv[2] if len(argv) == 3 else CATALOG_FILE
+    changed = write_catalog(iter_products(source), target)
+    print(f"✅ {target}: {count_products(target)} منتج" + ("" if changed else " (بدون تغيير)"))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
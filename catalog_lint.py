@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+"""
+فحص الكتالوج قبل إنشاء الصفحات (lint) - Iraq-Store
+
+1. تعارض الـ slugs (فهرس hash في مرور واحد):
+   - duplicate: نفس الـ slug لأكثر من منتج، فتُكتب صفحة فوق أخرى (آخر منتج يفوز)
+   - case: slugs تختلف فقط في حالة الأحرف أو تطبيع Unicode (نفس الملف على
+     أنظمة ملفات لا تفرّق بينها مثل macOS و Windows)
+   - reserved: slug يطابق صفحة مكتوبة يدوياً (products/index.html)؛ البناء يرفضه
+   - invalid: slug فارغ أو يحتوي / أو \\ أو يبدأ بنقطة
+
+2. المنتجات شبه المكررة بـ MinHash/LSH (وقت خطي تقريباً بدلاً من مقارنة كل زوج):
+   - العناوين: كلمات العنوان بعد التطبيع العربي (search_index.normalize_arabic)
+   - الأوصاف: ثلاثيات كلمات متتالية (shingles)
+   الكلمات والثلاثيات الموجودة في نسبة كبيرة من المنتجات (جمل القالب المشتركة
+   و"عرض" و"ضمان"...) تُحذف بناءً على عيّنة من أول المنتجات.
+   لكل منتج توقيع MinHash من 32 قيمة بتجزئة واحدة (one permutation hashing
+   مع تكثيف الخانات الفارغة بالتدوير)، مقسّم إلى 8 حزم × 4 قيم. المنتجات التي
+   تتطابق في حزمة واحدة على الأقل مرشحة، ثم يُحسب تشابه Jaccard الفعلي للمرشحين فقط.
+
+استخدام:
+python catalog_lint.py                      # catalog.jsonl → catalog-lint.json
+python catalog_lint.py feed.jsonl --threshold 0.7
+
+يعمل أيضاً في generate_products.py قبل إنشاء الصفحات كلما تغيّر الكتالوج.
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+import unicodedata
+import zlib
+from array import array
+from collections import Counter
+from itertools import combinations
+
+from build_io import write_if_changed
+from catalog import CATALOG_FILE, iter_products
+from search_index import normalize_arabic
+
+LINT_FILE = 'catalog-lint.json'
+
+# صفحات مكتوبة يدوياً داخل products/ لا يجوز أن يكتب فوقها منتج
+RESERVED_SLUGS = frozenset({'index'})
+
+THRESHOLD = 0.8
+NUM_BINS = 32
+BIN_MASK = NUM_BINS - 1
+BAND_ROWS = 4
+NUM_BANDS = NUM_BINS // BAND_ROWS
+
+# كلمة أو ثلاثية تظهر في أكثر من 5% من العيّنة (وفي 20 منتجاً على الأقل) تُعتبر من القالب
+SAMPLE_SIZE = 5000
+STOP_FRACTION = 0.05
+STOP_MIN_DOCS = 20
+# حزمة أكبر من هذا تُقارن بأول منتج فيها فقط بدلاً من كل الأزواج (حتى يبقى الوقت خطياً)
+PAIRWISE_BUCKET = 16
+# مجموعة بقي فيها أقل من كلمتين/ثلاثيتين بعد حذف القالب لا يُحكم على تشابهها
+MIN_TOKENS = 2
+
+WORD_RE = re.compile(r'[^\W_]+')
+
+
+def slug_problem(slug):
+    """'reserved' أو 'invalid' إذا كان الـ slug لا يصلح اسماً لملف داخل products/، وإلا None"""
+    if not isinstance(slug, (str, int)):
+        return 'invalid'
+    text = str(slug)
+    if text in RESERVED_SLUGS:
+        return 'reserved'
+    if not text or text.startswith('.') or '/' in text or '\\' in text:
+        return 'invalid'
+    return None
+
+
+def word_ids(words):
+    """رقم ثابت لكل كلمة (crc32): بصمات الكلمات وتركيباتها نفسها في كل تشغيل"""
+    return list(map(zlib.crc32, map(str.encode, words)))
+
+
+def title_tokens(title):
+    """مجموعة بصمات كلمات العنوان"""
+    return set(map(hash, zip(word_ids(normalize_arabic(title).split()))))
+
+
+def description_shingles(description):
+    """مجموعة بصمات كل ثلاث كلمات متتالية في الوصف"""
+    ids = word_ids(WORD_RE.findall(description.lower()))
+    return set(map(hash, zip(ids, ids[1:], ids[2:]) if len(ids) > 2 else zip(ids)))
+
+
+def minhash(hashes):
+    """
+    توقيع MinHash من NUM_BINS قيمة بتجزئة واحدة: أدنى 5 بتات تحدد الخانة وأصغر
+    بصمة في كل خانة هي قيمتها. الخانة الفارغة تأخذ قيمة أول خانة ممتلئة بعدها
+    مع المسافة إليها (densification بالتدوير) حتى يبقى احتمال التطابق ≈ Jaccard
+    """
+    ordered = sorted(hashes, reverse=True)
+    # الترتيب تنازلي: آخر قيمة تُكتب لكل خانة هي الأصغر
+    bins = dict(zip(map(BIN_MASK.__and__, ordered), ordered))
+    signature = [bins.get(b) for b in range(NUM_BINS)]
+    if len(bins) < NUM_BINS:
+        filled = sorted(bins)
+        previous = filled[-1] - NUM_BINS
+        for b in filled:
+            # الفهارس السالبة تلتف إلى آخر القائمة: الخانات الفارغة بعد آخر خانة ممتلئة
+            for empty in range(previous + 1, b):
+                signature[empty] = hash((bins[b], b - empty))
+            previous = b
+    return signature
+
+
+def jaccard(a, b):
+    """تشابه Jaccard لمجموعتين بدون عناصر مكررة"""
+    common = len(set(a).intersection(b))
+    return common / (len(a) + len(b) - common)
+
+
+class NearDuplicateIndex:
+    """
+    فهرس LSH لحقل واحد. المنتجات ذات المجموعة المتطابقة تماماً تُجمع أولاً
+    (dict) ويدخل LSH ممثل واحد لكل مجموعة مختلفة
+    """
+
+    def __init__(self):
+        self.exact = {}
+        self.members = []
+        self.tokens = []
+        self.bands = [array('q') for _ in range(NUM_BANDS)]
+
+    def add(self, hashes, position):
+        if len(hashes) < MIN_TOKENS:
+            return
+        # البايتات نفسها مفتاح التطابق التام ونسخة البصمات للتحقق (memoryview بدون نسخ)
+        key = array('q', sorted(hashes)).tobytes()
+        rep = self.exact.get(key)
+        if rep is not None:
+            self.members[rep].append(position)
+            return
+        self.exact[key] = len(self.members)
+        self.members.append([position])
+        self.tokens.append(memoryview(key).cast('q'))
+        signature = minhash(hashes)
+        for b, band in enumerate(self.bands):
+            band.append(hash(tuple(signature[b * BAND_ROWS:(b + 1) * BAND_ROWS])))
+
+    def candidates(self, stats):
+        """أزواج الممثلين التي تتطابق في حزمة واحدة على الأقل، كل زوج رقم واحد i << 32 | j"""
+        pairs = set()
+        for band in self.bands:
+            counts = Counter(band)
+            buckets = {}
+            for rep, key in enumerate(band):
+                if counts[key] > 1:
+                    buckets.setdefault(key, []).append(rep)
+            for reps in buckets.values():
+                if len(reps) <= PAIRWISE_BUCKET:
+                    pairs.update(i << 32 | j for i, j in combinations(reps, 2))
+                else:
+                    stats['large_buckets'] += 1
+                    first = reps[0] << 32
+                    pairs.update(first | rep for rep in reps[1:])
+        stats['candidates'] += len(pairs)
+        return pairs
+
+    def groups(self, threshold, stats):
+        """مجموعات المنتجات شبه المكررة: [(أعلى تشابه، [المواقع...])] بعد حساب Jaccard الفعلي"""
+        parent = {}
+
+        def find(x):
+            while parent.get(x, x) != x:
+                x = parent[x]
+            return x
+
+        top = {}
+        for pair in self.candidates(stats):
+            i, j = pair >> 32, pair & 0xFFFFFFFF
+            similarity = jaccard(self.tokens[i], self.tokens[j])
+            if similarity < threshold:
+                continue
+            ri, rj = find(i), find(j)
+            if ri != rj:
+                parent[max(ri, rj)] = min(ri, rj)
+            top[i] = max(top.get(i, 0), similarity)
+            top[j] = max(top.get(j, 0), similarity)
+
+        groups = {}
+        for rep, positions in enumerate(self.members):
+            if rep in top or len(positions) > 1:
+                root = find(rep)
+                similarity = 1.0 if len(positions) > 1 else top[rep]
+                best, members = groups.get(root, (0, []))
+                groups[root] = (max(best, similarity), members + positions)
+        return sorted(((round(best, 3), sorted(members)) for best, members in groups.values()),
+                      key=lambda item: (-item[0], item[1][0]))
+
+
+class CatalogLinter:
+    """
+    فحص الكتالوج منتجاً منتجاً: add(product) ثم report()
+    أول SAMPLE_SIZE منتج تُحفظ مؤقتاً لتحديد كلمات القالب قبل الفهرسة
+    """
+
+    def __init__(self, threshold=THRESHOLD):
+        self.threshold = threshold
+        self.started = time.perf_counter()
+        self.products = []
+        self.slugs = {}
+        self.folded = {}
+        self.case = {}
+        self.titles = NearDuplicateIndex()
+        self.descriptions = NearDuplicateIndex()
+        self.sample = []
+        self.stop = None
+        self.errors = []
+
+    def add(self, product, position):
+        """
+        position يبدأ من 1 بنفس ترقيم generate_products.py (للـ slug الافتراضي)
+        منتج لا يمكن فحصه يُسجَّل في errors بدلاً من إيقاف الفحص
+        """
+        try:
+            slug = product.get('slug', f'product-{position}')
+            title = product.get('title') or ''
+            folded = unicodedata.normalize('NFC', str(slug)).casefold()
+            tokens = (title_tokens(title), description_shingles(product.get('description') or ''), position)
+            hash(slug)  # slug يصلح مفتاحاً في self.slugs (ليس قائمة مثلاً)
+        except Exception as e:
+            product_id = product.get('id') if isinstance(product, dict) else None
+            self.products.append((product_id, None, ''))
+            self.errors.append({'position': position, 'id': product_id, 'error': f"{type(e).__name__}: {e}"})
+            return
+
+        self.products.append((product.get('id'), slug, title))
+        self.slugs.setdefault(slug, []).append(position)
+        first = self.folded.setdefault(folded, slug)
+        if first != slug:
+            self.case.setdefault(folded, {first}).add(slug)
+
+        if self.stop is None:
+            self.sample.append(tokens)
+            if len(self.sample) == SAMPLE_SIZE:
+                self.flush_sample()
+        else:
+            self.index(tokens)
+
+    def flush_sample(self):
+        """تحديد كلمات/ثلاثيات القالب من العيّنة ثم فهرسة منتجاتها"""
+        limit = max(STOP_MIN_DOCS, STOP_FRACTION * len(self.sample))
+        self.stop = []
+        for field in range(2):
+            df = Counter()
+            for tokens in self.sample:
+                df.update(tokens[field])
+            self.stop.append({h for h, count in df.items() if count > limit})
+        for tokens in self.sample:
+            self.index(tokens)
+        self.sample = []
+
+    def index(self, tokens):
+        title, description, position = tokens
+        self.titles.add(title - self.stop[0], position)
+        self.descriptions.add(description - self.stop[1], position)
+
+    def describe(self, position):
+        product_id, slug, title = self.products[position - 1]
+        return {'position': position, 'id': product_id, 'slug': slug, 'title': title}
+
+    def slug_issues(self):
+        issues = []
+        for slug, positions in self.slugs.items():
+            problem = slug_problem(slug)
+            if problem:
+                issues.append((problem, slug, positions))
+            if len(positions) > 1:
+                issues.append(('duplicate', slug, positions))
+        for slugs in self.case.values():
+            positions = sorted(p for slug in slugs for p in self.slugs[slug])
+            issues.append(('case', ' | '.join(sorted(map(str, slugs))), positions))
+        issues.sort(key=lambda issue: (issue[0], issue[2][0]))
+        return [{'kind': kind, 'slug': slug, 'winner': positions[-1],
+                 'products': [self.describe(p) for p in positions]}
+                for kind, slug, positions in issues]
+
+    def report(self):
+        """التقرير الكامل كقاموس قابل للتحويل إلى JSON"""
+        if self.stop is None:
+            self.flush_sample()
+        stats = {'candidates': 0, 'large_buckets': 0}
+        near = {}
+        for name, index in (('title', self.titles), ('description', self.descriptions)):
+            # مجموعة كل منتجاتها بنفس الـ slug مذكورة أصلاً في تعارض الـ slugs
+            near[name] = [{'similarity': similarity, 'products': [self.describe(p) for p in group]}
+                          for similarity, group in index.groups(self.threshold, stats)
+                          if len({self.products[p - 1][1] for p in group}) > 1]
+        collisions = self.slug_issues()
+        return {
+            'products': len(self.products),
+            'threshold': self.threshold,
+            'slug_issues': collisions,
+            'errors': self.errors,
+            'near_duplicates': near,
+            'summary': {
+                **Counter(issue['kind'] for issue in collisions),
+                'errors': len(self.errors),
+                'title_groups': len(near['title']),
+                'description_groups': len(near['description']),
+                **stats,
+                'seconds': round(time.perf_counter() - self.started, 2),
+            },
+        }
+
+
+def lint_catalog(products_file=CATALOG_FILE, threshold=THRESHOLD):
+    """فحص ملف كتالوج كامل، يعيد التقرير"""
+    linter = CatalogLinter(threshold)
+    for position, product in enumerate(iter_products(products_file), 1):
+        linter.add(product, position)
+    return linter.report()
+
+
+def write_report(report, path=LINT_FILE):
+    """كتابة التقرير (بدون الزمن حتى لا يتغير الملف بدون سبب)، يعيد True عند الكتابة"""
+    stable = {**report, 'summary': {k: v for k, v in report['summary'].items() if k != 'seconds'}}
+    return write_if_changed(path, json.dumps(stable, ensure_ascii=False, indent=1) + '\n')
+
+
+def print_report(report, limit=5):
+    """ملخص مختصر للتقرير مع أمثلة من كل نوع"""
+    summary = report['summary']
+    print(f"🔎 فحص الكتالوج: {report['products']} منتج في {summary['seconds']:.2f} ثانية")
+    labels = {
+        'reserved': '⛔ slug محجوز لصفحة مكتوبة يدوياً',
+        'invalid': '⛔ slug غير صالح',
+        'duplicate': '⚠️ slug مكرر (آخر منتج يفوز)',
+        'case': '⚠️ slugs تختلف فقط في حالة الأحرف',
+    }
+    for kind, label in labels.items():
+        issues = [issue for issue in report['slug_issues'] if issue['kind'] == kind]
+        if issues:
+            print(f"   {label}: {len(issues)}")
+            for issue in issues[:limit]:
+                positions = ', '.join(str(p['position']) for p in issue['products'])
+                print(f"      - {issue['slug']} ← المنتجات {positions}")
+    if report['errors']:
+        print(f"   ❌ منتجات تعذّر فحصها: {len(report['errors'])}")
+        for error in report['errors'][:limit]:
+            print(f"      - المنتج {error['position']}: {error['error']}")
+    for name, label in (('title', 'عناوين'), ('description', 'أوصاف')):
+        groups = report['near_duplicates'][name]
+        if groups:
+            print(f"   🧬 مجموعات {label} شبه مكررة (تشابه ≥ {report['threshold']}): {len(groups)}")
+            for group in groups[:limit]:
+                titles = ' | '.join(p['title'][:40] for p in group['products'][:3])
+                more = f" (+{len(group['products']) - 3})" if len(group['products']) > 3 else ''
+                print(f"      - {group['similarity']:.2f}: {titles}{more}")
+
+
+def has_errors(report):
+    """slug محجوز أو غير صالح يمنع إنشاء الصفحة"""
+    return any(issue['kind'] in ('reserved', 'invalid') for issue in report['slug_issues'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='فحص الكتالوج: تعارض الـ slugs والمنتجات شبه المكررة')
+    parser.add_argument('catalog', nargs='?', default=CATALOG_FILE, help='ملف المنتجات (JSON array أو JSON Lines)')
+    parser.add_argument('--report', default=LINT_FILE, help='ملف التقرير الكامل JSON')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='أقل تشابه Jaccard للمنتجات شبه المكررة')
+    parser.add_argument('--limit', type=int, default=5, help='عدد الأمثلة المطبوعة من كل نوع')
+    args = parser.parse_args(argv)
+
+    report = lint_catalog(args.catalog, args.threshold)
+    write_report(report, args.report)
+    print_report(report, args.limit)
+    print(f"📄 التقرير الكامل: {args.report}")
+    return 1 if has_errors(report) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,2 @@
+// فهارس الترتيب والفلاتر - مولّد تلقائياً من generate_products.py
+const facetIndex = {"rows":640,"width":2,"sorts":{"price":"JwEsAAEBBwGmAQ8CSQHBADQBRgFMAfABCgG9ANgA4wADAQ0BFQEeAVgBdQF8AYkB2wHgAegB/QECAhsCKQKSAdIBbAEmAJIAlQDWAN8AFgEfATABMQFFAVYBWwFeAcwB6QEBAhkCHQI+AkEC3gDkAH8BhQFGAE4AjACeAK4A1QDXAPQAFAEcAVkBdwGHAZQBmQGbAaoBrQHXAd4B/wEJAhUCHAKfAHQAkAGcAdQBUwFLAJwAwgDZAAIBKQFBAVABcgF7AYABhgGYAdgB2gEOAicCOwJbAlwC/gBNAY0BlgCqAMQA0wD2AB0BKwE+AUABZgFvAYoB4gHyAf4BFAIeAiUCPQKgAFUB6gFZAFsAewCDAIgA3ADdAOsAGQE4AU8BaQF9AY4B1QH1AQACFwIaAkkCIgEMAS0BMwFjAYgB5QH5AQoCVwCvASEAJAB9AKUArQDlABsBQgFIAUoBUgFXAWQBawGDAZ0BwwHjAe0B7gEzAjcCTQJwAkUAhgBEAWEBqQEgADMAQwCNAJcAmQCrALIAyADSANoA8wD/ACABJAEoAS4BMgE3AaMBpwG4AbkBvAHBAcgB9gH4AfwBIwIwAkUC7QCpAOwA+QAIAVoBxwE0AgYAeQCbAMcA6gDyABABSwFcAWcBcwF4Ad0B5AEGAjwCfQJOAVQBcAHrAewBbwBxAKcAsAC/AOIA5gBgAYsBmgG1AbsBxAHQATICywD1AAcALgBVAHIAdQB3AHgAkACaALMA+wD9AAQBJgFtAXoBlwH7AQ0CEAISAkICTgJRAnwCYQCzAZ0AxQDOADYBQwFfAeYB8QH3ASECJAI7AUcATQBwAKwBtgEoAGAAmADAAM0A+gAAAS8BngGxAboBEwJtAiUBAgAYAB8AaAB2AIQAjwC1APAAEgFlAX4BkwGwAbcB0QEEAkMCSAJ0An4CGQAaAEkAYwByAnMCNQEdAD4ATwBRAKwA5wAYASwBggGRAa4BvQHFAdMBWgJjAnECCQAlAD0ATABtALwACwFRAW4BjwHLAQsCKgJvAnoCgABKAlQA6QD8AF0BYgGEAcYBzwHnARECggAFAQEACACTAKQAtAAvAkACewJ/AkQAlAATASoBgQGoAdkB+gEDAj8CbgDUAPgAsgG0AQ0AEQA3AEoAXQChAVgCXQIAADUAUgCoAMYAzwDbAOAA8QD3AKsBFgIYAiACNQJoAroAaAHNAQUAOwBAAIUAwwA/ASYCRwJhAmQCfACKAL4AKAJ/AA4BOQH0AQgCSwLRAGoBOQB6AIsAyQDvABcBOgFxAeEB8wEiAmUCDwBIAGQA0AAfAlQCXgJ4AjYAfgAJAT0BygFMAmcCFACHAMoAdgGiAcAB3wFGAisAIwEOAB4AoAEtAEIAZQBfAmsCagAGAUcBjAGfAdYB7wEMAlACYgB0Ac4BVQIPAQcCFwB1AugAgQCxALkAuwAaATwBvwHJASsCMQJzAI4ArwC+AUQCTwKmACEBNgJrACcAbgJsAKEAogCjAMwAOAI5AjoCEABfAJEAVgIqADoAiQBaAJYBXAALADwAeQIyAGcAUgLuABIAtgC3ALgALAItAi4CKQBsAhsAVgAVAOEAwgF3Al4AVwI4AD8AaQBiAmYCDAAcAC8AMABBAGACEwB5AdwBFgB2AgQAMQBqAjQAEQEFAmkCIgAjAFgApAGlAVkCCgBTAJUBUABmAFMCAwA=","discount":"pAGlAVMCwgEDAGYAvgEFAlkCaQJqAlAAnwGgAaIBvwHAAckBygHOAdwBdgIKAFMAlQGhAasBsgG0Ac0BVwJgAmICZgJ3AiIAIwAxADQAWAARAagBrgGwAbcBvQHFAcYBywHPASwCLQIuAlICbAJ5AgQAEwAWAHkBngGjAacBrAGxAbMBtQG2AbgBuQG6AbsBvAHBAcQBxwHIAdABOAI5AjoCVgJuAgwAHAAvADAAQQCpAa8BwwEHAisCMQI2AkQCTwJVAnUCEgAVABsAKQA4AD8AVgBeAGkAtgC3ALgA4QCqAa0BzAHWAd8B7wEMAh8CRgJMAlACVAJeAl8CZwJrAngCCwAyADwAWgBcAGcA7gCWAaYB4QHzAfQBCAIWAhgCIAIiAiYCKAI1AkcCSwJYAl0CYQJkAmUCaAIQACcAKgA6AF8AawBsAIkAkQChAKIAowDMANkB5wH6AQMCCwIRAioCLwI/AkACSgJvAnoCewJ/AhcAcwCBAI4ApgCvALEAuQC7AOgADwEaASEBPAHRAdMB5gHxAfcB+wEEAg0CEAISAhMCIQIkAkICQwJIAk4CUQJaAmMCbQJxAnICcwJ0AnwCfgIOABQAHgArAC0AQgBiAGUAagCHAMoABgEjAUcBdAF2AYwB3QHkAesB7AH2AfgB/AEGAiMCMAIyAjQCPAJFAn0CDwA2ADkASABkAHoAfAB+AH8AigCLAL4AyQDQANEA7wAJAQ4BFwE5AToBPQFqAXEB1QHYAdoB4gHjAeUB6gHtAe4B8gH1AfkB/gEAAgoCDgIUAhcCGgIeAiUCJwIzAjcCOwI9AkkCTQJbAlwCcAIAAAEABQAIAA0AEQA1ADcAOwBAAEQASgBSAF0AbgCFAJMAlACkAKgAtAC6AMMAxgDPANQA2wDgAPEA9wD4ABMBKgE/AWgBgQHSAdQB1wHbAd4B4AHoAekB/QH/AQECAgIJAhUCGQIbAhwCHQIpAj4CQQIJABkAGgAdACUAPQA+AEkATABPAFEAVABjAG0AgACCAKwAvADnAOkA/AAFAQsBGAEsATUBUQFdAWIBbgGCAYQBjwGRAfABDwICAAcAGAAfACgALgBHAE0AVQBgAGEAaABwAHIAdQB2AHcAeACEAI8AkACYAJoAnQCzALUAwADFAM0AzgDwAPoA+wD9AAABBAESASUBJgEvATYBOwFDAV8BZQFtAXoBfgGTAZcBBgAgADMAQwBFAG8AcQB5AIYAjQCXAJkAmwCnAKkAqwCwALIAvwDHAMgAywDSANoA4gDmAOoA7ADtAPIA8wD1APkA/wAIARABIAEkASgBLgEyATcBRAFLAU4BVAFaAVwBYAFhAWcBcAFzAXgBiwGaASEAJABXAFkAWwB7AH0AgwCIAJYAoAClAKoArQDEANMA3ADdAOUA6wD2AP4ADAEZARsBHQEiASsBLQEzATgBPgFAAUIBSAFKAU0BTwFSAVUBVwFjAWQBZgFpAWsBbwF9AYMBiAGKAY0BjgGdASYARgBLAE4AdACMAJIAlQCcAJ4AnwCuAMIA1QDWANcA2QDeAN8A5AD0AAIBFAEWARwBHwEpATABMQFBAUUBUAFTAVYBWQFbAV4BcgF3AXsBfwGAAYUBhgGHAZABlAGYAZkBmwGcAb0AwQDYAOMAAwEKAQ0BFQEeATQBRgFJAUwBWAFsAXUBfAGJAZIBLAABAQcBJwE=","id":"AAABAAIAAwAEAAUABgAHAAgACQAKAAsADAANAA4ADwAQABEAEgATABQAFQAWABcAGAAZABoAGwAcAB0AHgAfACAAIQAiACMAJAAlACYAJwAoACkAKgArACwALQAuAC8AMAAxADIAMwA0ADUANgA3ADgAOQA6ADsAPAA9AD4APwBAAEEAQgBDAEQARQBGAEcASABJAEoASwBMAE0ATgBPAFAAUQBSAFMAVABVAFYAVwBYAFkAWgBbAFwAXQBeAF8AYABhAGIAYwBkAGUAZgBnAGgAaQBqAGsAbABtAG4AbwBwAHEAcgBzAHQAdQB2AHcAeAB5AHoAewB8AH0AfgB/AIAAgQCCAIMAhACFAIYAhwCIAIkAigCLAIwAjQCOAI8AkACRAJIAkwCUAJUAlgCXAJgAmQCaAJsAnACdAJ4AnwCgAKEAogCjAKQApQCmAKcAqACpAKoAqwCsAK0ArgCvALAAsQCyALMAtAC1ALYAtwC4ALkAugC7ALwAvQC+AL8AwADBAMIAwwDEAMUAxgDHAMgAyQDKAMsAzADNAM4AzwDQANEA0gDTANQA1QDWANcA2ADZANoA2wDcAN0A3gDfAOAA4QDiAOMA5ADlAOYA5wDoAOkA6gDrAOwA7QDuAO8A8ADxAPIA8wD0APUA9gD3APgA+QD6APsA/AD9AP4A/wAAAQEBAgEDAQQBBQEGAQcBCAEJAQoBCwEMAQ0BDgEPARABEQESARMBFAEVARYBFwEYARkBGgEbARwBHQEeAR8BIAEhASIBIwEkASUBJgEnASgBKQEqASsBLAEtAS4BLwEwATEBMgEzATQBNQE2ATcBOAE5AToBOwE8AT0BPgE/AUABQQFCAUMBRAFFAUYBRwFIAUkBSgFLAUwBTQFOAU8BUAFRAVIBUwFUAVUBVgFXAVgBWQFaAVsBXAFdAV4BXwFgAWEBYgFjAWQBZQFmAWcBaAFpAWoBawFsAW0BbgFvAXABcQFyAXMBdAF1AXYBdwF4AXkBegF7AXwBfQF+AX8BgAGBAYIBgwGEAYUBhgGHAYgBiQGKAYsBjAGNAY4BjwGQAZEBkgGTAZQBlQGWAZcBmAGZAZoBmwGcAZ0BngGfAaABoQGiAaMBpAGlAaYBpwGoAakBqgGrAawBrQGuAa8BsAGxAbIBswG0AbUBtgG3AbgBuQG6AbsBvAG9Ab4BvwHAAcEBwgHDAcQBxQHGAccByAHJAcoBywHMAc0BzgHPAdAB0QHSAdMB1AHVAdYB1wHYAdkB2gHbAdwB3QHeAd8B4AHhAeIB4wHkAeUB5gHnAegB6QHqAesB7AHtAe4B7wHwAfEB8gHzAfQB9QH2AfcB+AH5AfoB+wH8Af0B/gH/AQACAQICAgMCBAIFAgYCBwIIAgkCCgILAgwCDQIOAg8CEAIRAhICEwIUAhUCFgIXAhgCGQIaAhsCHAIdAh4CHwIgAiECIgIjAiQCJQImAicCKAIpAioCKwIsAi0CLgIvAjACMQIyAjMCNAI1AjYCNwI4AjkCOgI7AjwCPQI+Aj8CQAJBAkICQwJEAkUCRgJHAkgCSQJKAksCTAJNAk4CTwJQAlECUgJTAlQCVQJWAlcCWAJZAloCWwJcAl0CXgJfAmACYQJiAmMCZAJlAmYCZwJoAmkCagJrAmwCbQJuAm8CcAJxAnICcwJ0AnUCdgJ3AngCeQJ6AnsCfAJ9An4CfwI="},"facets":{"price":[{"min":0,"max":50000,"count":1,"rows":"JwE="},{"min":50000,"max":60000,"count":232,"rows":"IAAhACQAJgAsADMAQwBFAEYASwBOAFcAWQBbAHQAewB9AIMAhgCIAIwAjQCSAJUAlgCXAJkAnACeAJ8AoAClAKkAqgCrAK0ArgCyAL0AwQDCAMQAyADSANMA1QDWANcA2ADZANoA3ADdAN4A3wDjAOQA5QDrAOwA7QDzAPQA9gD5AP4A/wABAQIBAwEHAQgBCgEMAQ0BFAEVARYBGQEbARwBHQEeAR8BIAEiASQBKAEpASsBLQEuATABMQEyATMBNAE3ATgBPgFAAUEBQgFEAUUBRgFIAUkBSgFMAU0BTwFQAVIBUwFVAVYBVwFYAVkBWgFbAV4BYQFjAWQBZgFpAWsBbAFvAXIBdQF3AXsBfAF9AX8BgAGDAYUBhgGHAYgBiQGKAY0BjgGQAZIBlAGYAZkBmwGcAZ0BowGmAacBqQGqAa0BrwG4AbkBvAHBAcMBxwHIAcwB0gHUAdUB1wHYAdoB2wHeAeAB4gHjAeUB6AHpAeoB7QHuAfAB8gH1AfYB+AH5AfwB/QH+Af8BAAIBAgICCQIKAg4CDwIUAhUCFwIZAhoCGwIcAh0CHgIjAiUCJwIpAjACMwI0AjcCOwI9Aj4CQQJFAkkCTQJbAlwCcAI="},{"min":60000,"max":75000,"count":244,"rows":"AAABAAIABQAGAAcACAAJAA0AEQAYABkAGgAdAB8AJQAoAC4ANQA3ADsAPQA+AEAARABHAEkASgBMAE0ATwBRAFIAVABVAF0AYABhAGMAaABtAG4AbwBwAHEAcgB1AHYAdwB4AHkAfAB/AIAAggCEAIUAigCPAJAAkwCUAJgAmgCbAJ0ApACnAKgArACwALMAtAC1ALoAvAC+AL8AwADDAMUAxgDHAMsAzQDOAM8A0QDUANsA4ADiAOYA5wDpAOoA8ADxAPIA9QD3APgA+gD7APwA/QAAAQQBBQELAQ4BEAESARMBGAElASYBKgEsAS8BNQE2ATkBOwE/AUMBSwFOAVEBVAFcAV0BXwFgAWIBZQFnAWgBagFtAW4BcAFzAXgBegF+AYEBggGEAYsBjwGRAZMBlwGaAZ4BoQGoAasBrAGuAbABsQGyAbMBtAG1AbYBtwG6AbsBvQHEAcUBxgHLAc0BzwHQAdEB0wHZAd0B5AHmAecB6wHsAfEB9AH3AfoB+wEDAgQCBgIIAgsCDQIQAhECEgITAhYCGAIgAiECJAImAigCKgIvAjICNQI8Aj8CQAJCAkMCRwJIAkoCSwJOAlECWAJaAl0CYQJjAmQCaAJtAm8CcQJyAnMCdAJ6AnsCfAJ9An4CfwI="},{"min":75000,"max":100000,"count":106,"rows":"CwAOAA8AEAAUABcAHgAnACoAKwAtADYAOQA6ADwAQgBIAFoAXABfAGIAZABlAGoAawBsAHMAegB+AIEAhwCJAIsAjgCRAKEAogCjAKYArwCxALkAuwDJAMoAzADQAOgA7wAGAQkBDwEXARoBIQEjAToBPAE9AUcBcQF0AXYBjAGWAZ8BoAGiAb4BvwHAAckBygHOAdYB3wHhAe8B8wEHAgwCHwIiAisCMQI2AjgCOQI6AkQCRgJMAk8CUAJUAlUCVgJeAl8CZQJnAmsCbgJ1AngCeQI="},{"min":100000,"max":150000,"count":53,"rows":"BAAKAAwAEgATABUAFgAbABwAIgAjACkALwAwADEAMgA0ADgAPwBBAFMAVgBYAF4AZwBpALYAtwC4AOEA7gARAXkBlQGkAaUBwgHcAQUCLAItAi4CUgJXAlkCYAJiAmYCaQJqAmwCdgJ3Ag=="},{"min":150000,"max":null,"count":4,"rows":"AwBQAGYAUwI="}]}};
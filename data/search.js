@@ -0,0 +1,2 @@
+// فهرس البحث - مولّد تلقائياً من generate_products.py
+const searchIndex = {"vocab":["1","10","100","105","11","120","120m","16gb","17","180","1910","1tb","2","25","27","28","3","3208","35","360","3d","4","42","45","48","5","50spf","5g","6","6310","64","6اشهر","8","8k","9","950","a08","a19","a20","acarid","agent","air","airpods","airtab","allure","and","android","app","bardefu","beauty","body","botox","bright","care","children","coating","conditioning","control","cooler","cooling","cosrx","cream","crest","crystal","cx06","cyber","denx","dewalt","dlc","electric","enzo","eye","face","fan","filp","fino","foldable","foot","g","game","hair","headphone","healthy","hitachi","home","hose","i19","ice","ikt","in","inline","intense","jano","joseon","kaliya","kemei","km","labubu","lc","led","light","lighter","lock","lotion","lpl","magic","massager","max","memo","mille","mini","mist","ml","moc","nebulizer","neo","of","oil","orabella","p20","p9","peeling","perfume","pest","pg02","popcorn","portable","pro","projector","pubg","raf","ram","rechargeable","reject","remover","retinol","rom","rosemary","sensor","serum","sexy","shower","silver","slicer","sm","smart","snail","soft","sokany","solar","sound","spray","star","stick","straghtner","super","sws","t808","tab","tablet","top","trimmer","turbo","tv","u","u08","u09","usb","vacuum","veggie","watch","wax","wireless","with","yellow","yes","اباجوره","ابيض","اتربه","اثناء","اجهزه","احذيه","اداه","ادخنه","ادوات","ادوار","اذابه","اربطه","ازاله","اساس","اسبراي","استا","استاند","استانلس","استحمام","استخدام","استخدامات","استراحه","استيكر","اسطح","اسطوانه","اسفل","اسموثي","اسنان","اسود","اسيكل","اشعه","اشهر","اصطناعيه","اصغر","اصلي","اصليه","اضاءه","اطارات","اطفال","اعصاب","افل","اقوي","اقي","اكليل","اكواب","اكياس","ال","الاتربه","الاربطه","الاستخدام","الاستخدامات","الاسطح","الاسموثي","الاسنان","الاسود","الاشعه","الاصطناعيه","الاصغر","الاصلي","الاصليه","الاضاءه","الاطارات","الاطفال","الاكياس","الالكترونيه","الالماني","الالمنيوم","الام","الامتصاص","الامريكي","الامنه","الانف","الايس","الباستا","البخار","البشره","البطاريه","البطاطا","البطن","البلازما","البلاط","البلوتوث","البنات","البنفسجيه","البيتيفور","التالف","التجفيف","التحكم","التربو","الترجمه","التركي","التركيب","الترند","التريند","التسبيح","التصليح","التطبيق","التفريغ","التقنيه","التلسكوبي","التنعيم","التنفس","الثابت","الثلج","الجبل","الجديثه","الجديد","الجسم","الجهاز","الجوده","الجيم","الحبل","الحديث","الحديثه","الحراره","الحراري","الحساسه","الحشرات","الحفلات","الحلاقه","الحلزونيه","الحواجب","الخارق","الخصر","الخضروات","الخلفي","الخياطه","الداخليه","الداطلي","الداعم","الدرامز","الدريل","الدهون","الدواره","الدوكو","الذكي","الراس","الرجال","الرقبه","الركبه","الرياضي","الرياضيه","الريتينول","الريموت","الزجاج","الساعد","السبلت","السبيكر","السجاد","السحري","السداسي","السرقه","السريعه","السطوع","السلطعون","السموثي","السيارات","السياره","الشامه","الشحن","الشعر","الشفاط","الشمس","الشمسيه","الشواء","الصغيره","الصوت","الصوف","الضغط","الطاحونه","الطاقه","الطباخ","الطبيعي","الطبيعيه","الطرد","الطعام","الطوارئ","الظهر","العالم","العجيب","العصا","العصر","العلاج","العيون","الغاز","الغبار","الغسيل","الغنم","الفرشاه","الفشار","الفضاء","الفقاعات","الفوري","الفوريه","الفوم","القدم","القران","القمر","القهوه","القويه","الكامل","الكامله","الكتروني","الكترونيه","الكتف","الكريم","الكف","الكليجه","الكهربائي","الكولاجين","الكوي","اللاصق","اللانش","اللحام","اللحوم","اللحيه","اللكتروني","اللمس","اللهب","اللون","الماء","الماني","المانيه","المبخره","المتعدده","المتكامله","المتنقل","المحمول","المحموله","المرايا","المركزي","المرنه","المريحه","المساج","المسامير","المعلق","المغناطيسي","المغناطيسيه","المفاصل","المقاوم","المقاومه","المكنسه","الملاكمه","المنزل","المنيوم","المهارات","الموبايل","الموسيقي","الموطه","المونيوم","المياه","الميكروبيلدنج","النشره","النفاث","النفخ","النوم","اله","الهاتف","الهواء","الهوائي","الوافل","الوبر","الوجه","الوظائف","الومنيوم","الياباني","اليابانيه","اليكسا","امبير","امتصاص","امريكي","امريكيه","امنه","انبوب","انبوبه","انف","انك","انكه","اوتي","اور","ايباد","ايبوكسي","اير","ايرتاب","ايرليس","ايس","ايسر","ايمن","ب","باب","بابين","باج","باستا","باسيكل","بالاشعه","بالبخار","بالبشره","بالبطاريه","بالبلازما","بالبلوتوث","بالتحكم","بالتفريغ","بالتقنيه","بالريموت","بالشحن","بالصوت","بالطاقه","بالطرد","بالغاز","بالفوم","باللمس","باللون","بانك","بانكه","باور","ببابين","بباور","ببخاخ","ببطاريتين","ببطاريه","بحامل","بحساس","بخاخ","بخار","بخاريه","بدعامه","بديل","بذاكره","براغي","برتقال","برتقان","بروجكتور","بريموت","بزود","بستاند","بسلم","بسماعه","بسينسور","بشاشه","بشحن","بشره","بشريحتين","بشريحه","بضمان","بطاريتين","بطاريه","بطاطا","بطن","بقاعده","بقوه","بكيبورد","بلازما","بلاط","بلاور","بلسم","بلندر","بلوتوث","بمايك","بمسند","بمصباح","بنات","بنفسجيه","بني","بوتي","بودر","بودره","بوصه","بوكس","بول","بوهيمي","بيانو","بيتيفور","بيج","بيكل","تاب","تابلت","تابلوه","تاتش","تاتو","تالف","تبريد","تبييض","تتحكم","تجفيف","تحسين","تحضير","تحكم","تحويل","تخم","تدفئه","تدليك","تربو","ترجمه","ترطيب","تركي","تركيب","ترند","تريند","تسبيح","تشذيب","تصحيح","تصغير","تصفييف","تصلح","تصليح","تصوير","تطبيق","تعقيم","تعليمي","تعمل","تفريغ","تقصييف","تقنيه","تلسكوبي","تمارين","تمدد","تنظيف","تنعيم","تنفس","تنقيه","تنميه","توب","توفير","تيرا","ثابت","ثلاجه","ثلج","جاف","جبل","جدر","جديثه","جديد","جسم","جميع","جنطه","جهاز","جو","جوجل","جوده","جولدن","جيم","حائط","حامل","حامي","حاميه","حبل","حده","حديث","حديثه","حراره","حراري","حساس","حساسه","حشرات","حفاظ","حفظ","حفلات","حقيبه","حلاقه","حلزونيه","حليب","حمام","حنفيه","حواجب","حوض","حينرال","خاتم","خاخ","خارق","خاريه","خداديه","خدوش","خرطوم","خزانه","خصر","خضروات","خلاط","خلفي","خياطه","خيمه","خيوط","داخليه","داطلي","داعم","درامز","درجه","دريل","دش","دعامه","دفتر","دميه","دهون","دواء","دواره","دوش","دوشك","دوكو","دووش","ديجيتال","ديسبنسر","ديل","ذاكره","ذكي","ذكيه","رائد","راس","راغي","راوتر","رتقال","رتقان","رجال","رذاذ","رش","رشاش","رصاصي","رضاعه","رطب","رعايه","رغوي","رف","رقبه","ركبه","رمادي","روبوت","روتينك","روجكتور","رول","رياضي","رياضيه","ريتينول","ريموت","زاويه","زجاج","زجاجه","زوايا","زوجي","زود","زيت","سائل","ساده","ساعد","ساكورا","سانيسا","سباق","سبراي","سبلت","سبليت","سبيكر","ستاره","ستاند","ستيبر","ستيتش","ستيل","سجاد","سجاده","سحري","سداسي","سرقه","سريرللبيبي","سريعه","سطوع","سفنجه","سقف","سكاكين","سكوتر","سلطعون","سلم","سم","سمارت","سماعه","سموثي","سنك","سهل","سهله","سوائل","سيارات","سياره","سيرم","سيروم","سينسور","شاحن","شاشه","شامبو","شامه","شبكه","شبكيه","شحن","شرشف","شروخ","شريحتين","شريحه","شريط","شعر","شفاط","شفاف","شفافه","شفط","شمس","شمسيه","شنطه","شنيور","شواء","صاعق","صانع","صانعه","صبغ","صحراوي","صغير","صغيره","صلاه","صندوق","صنع","صوبه","صوت","صوف","ضد","ضغط","ضلفه","ضمان","طائرات","طاحونه","طارد","طاريه","طاقه","طاوله","طاوه","طباخ","طبي","طبيعي","طبيعيه","طرد","طعام","طقم","طوابق","طوارئ","ظهر","عائلي","عازل","عازله","عالم","عالي","عام","عبر","عبوتين","عجان","عجله","عجيب","عده","عربه","عرض","عصا","عصائر","عصاره","عصر","عكاز","علاج","علي","عمودي","عموديه","عنايه","عيون","غاز","غامق","غبار","غزل","غساله","غسيل","غلق","غنم","فائق","فاتح","فاشون","فتحات","فتحه","فحص","فرد","فرشاه","فروع","فشار","فضاء","فقاعات","فلتر","فواطم","فواكه","فواكهه","فورمون","فوري","فوريه","فوطه","فوق","فولت","فوم","في","قابل","قابله","قاعده","قدر","قدم","قران","قص","قطاعه","قطع","قطعتين","قطعه","قفازات","قفل","قلم","قمر","قناع","قنفه","قهوه","قوه","قويه","قي","قياده","قياس","كارت","كامل","كامله","كاميرا","كاميره","كبار","كتروني","كترونيه","كتف","كجم","كرسي","كريب","كريم","كشاف","كليجه","كماشه","كنترول","كنتور","كهرباء","كهربائي","كهربائيه","كوب","كوري","كوسره","كولاجين","كونترول","كوي","كيبورد","كيس","كيمي","لازاله","لاسلكي","لاسلكيه","لاصق","لاصقات","لاصلاح","لاط","لاعاده","لانش","لاور","لتتبع","لتحديد","لتر","لتركيب","لتعطير","لتنظيف","لحام","لحجب","لحوم","لحيه","لسم","لسياره","لعبه","لعلاج","لفافه","لكتروني","للادخنه","للاسطح","للاطفال","للترطيب","للتمارين","للتمدد","للتنظيف","للتوفير","للحائط","للحشرات","للحفاظ","للحوض","للرجال","للرش","للرضاعه","للرقبه","للركبه","للزاويه","للزوايا","للسبليت","للسنك","للسيارات","للسياره","للشفط","للشنطه","للطائرات","للطباخ","للطي","للظهر","للعنايه","للغبار","للفواكه","للفواكهه","للكبار","للماء","للملابس","للمناطق","للمنزل","للنساء","للنفخ","للهاتف","للوجه","لمامه","لمبات","لمبه","لمس","لمقعد","لمنشار","لندر","لهب","لوتوث","لور","لوزن","لوشن","لون","ليثيوم","ليد","ليزر","ماء","ماجنتيك","ماركه","ماكينه","ماندولين","مانع","مانيه","ماوس","مايك","مايكروفايبر","مبخره","مبرد","مبرده","متحرك","متحركه","متر","متعدد","متعدده","متكامله","متنقل","متنقله","مثلث","مجفف","مجموعه","محضره","محمول","محموله","محول","مخاط","مخده","مراقبه","مرايا","مرطب","مركزي","مرنه","مروحه","مريحه","مزدوجه","مزود","مزودجه","مزوده","مزيل","مساج","مساحه","مساعد","مسامير","مسبح","مسحه","مسدس","مسن","مسند","مشاكل","مشد","مصباح","مصفاه","مصيده","مضخه","مضيئه","مظله","مع","معالج","معجون","معقم","معلق","مغناطيسي","مغناطيسيه","مفاصل","مفتاح","مفرد","مفرش","مفك","مقاعد","مقاوم","مقاومه","مقبس","مقص","مقياس","مكس","مكنسه","مكواه","مكيف","مكينه","مكييف","مل","ملابس","ملاكمه","ملصقات","ملمع","ممتصه","ممسحه","من","مناديل","مناطق","منبه","منزل","منزلي","منزليه","منشار","منضديه","منظف","منظم","منفاخ","منيوم","مهارات","موبايل","موبيل","مودكس","موزع","موسيقي","موطه","موقد","موكيت","مونيوم","مياه","ميزان","ميكروبيلدنج","ميني","ناموسيه","نحت","نساء","نشره","نط","نظاره","نفاث","نفاضه","نفخ","نفرين","نمو","نوكيا","نوم","نيو","هاتف","هاند","هديه","هزاز","هواء","هوائي","هوم","هيرلتجديد","و","واذابه","واسفل","وافل","واقي","والاتربه","والتجفيف","والحراره","والرجال","والسجاد","والمنزل","والنفخ","وايرليس","وبر","وتدفئه","وتشذيب","وتي","وجه","وحده","ودر","ودره","ورطب","وساده","وستاند","وسريرللبيبي","وصندوق","وصه","وظائف","وعجان","وغسيل","وكس","ولمامه","وماوس","ومنيوم","وهيمي","ياباني","يابانيه","يانو","يد","يدوي","يعمل","يكسا","يكل"],"postings":[[1,3,4,1,1,4,15,28,11,12,3,11,8,1,2,5,14,3,6,10,14,12,4,7,5,1,5,1,15,4,2,37,8,13,39,6,100,8,3,9,21,46,16,7,5,11,2,11,4,4,16,4,4,7,1,4,14,12,9,1,4],[4,6,31,11,26,83,1,1,155,111,69,70,1,1,47,3],[290,25,5],[171,273],[16,98],[116,116,179],[116,295],[27,1,19,1],[18],[252,82,158,37],[111,49,277],[27,1,19,1],[9,34,14,11,20,6,19,3,5,2,1,3,6,49,1,1,7,1,6,13,2,1,16,41,2,38,113,28,65,2,22,1,14,1,1,25,4,12,2,12,21],[4,45,569],[193,139],[219],[23,1,5,65,16,10,53,19,1,13,1,8,24,71,17,36,64,9,47,12,8,37,4,1,18,36,4,22,3],[238,1,1,142],[193,139],[60,24,5,240,81,54],[251,279],[1,20,61,61,14,12,11,70,20,44,185,21,11,28,20,52,8],[392],[11,622],[0,217,2],[8,6,66,81,1,1,23,29,1,200,152,1,1,65],[324],[317,141],[1,24,16,8,23,26,4,1,1,2,9,20,31,2,12,5,3,2,5,6,6,31,3,17,13,2,43,18,25,10,29,15,44,24,3,8,25,2,7,8,9,1,2,6,2,1,4,6,1,25,1,1,1,1,11,12,2,7,12],[172,273],[73],[208],[83,15,499],[202,246],[6,631],[145],[105],[47],[175,271],[260,265],[368],[18,9,1,19,1,4,74],[187,150,110,12],[10],[386],[211,14,225,92],[337,122],[142],[102,1,82,370,39,1],[212],[238,1,1,142],[87,344],[132],[134],[123,76],[284,84],[52],[79,63,186],[126],[318],[290,25,5],[39,17,59,141,34,5,12,1,7,299],[23,92,12,41,20,7,174,112,69,4,11,22,4,38],[284],[85],[273,244],[72,26,499,9],[145],[100,171,248],[135,106,293],[20,398],[256,39,11,1],[87,169,49,3,123],[62,73,106,93,10,144,46,77],[360,101],[309],[334],[412],[290,25],[202,23,223,2],[116,18,47,57,1,1,113,29,29],[350,110],[253,275],[11,622],[93,11,489,7],[7,271,235,123],[233,221],[39,17,59,499],[387],[102,1,82,26,331,53],[135,106,293],[293,3],[166,400],[212],[331],[14,97,75,52,1,1,142,34,21],[238,1,1,142],[76],[131],[59,20,68,64,117,31,20,105,10,48,34,26,10],[6,631],[211,331],[63,547],[116,295],[291],[7,271,235,123],[412],[467],[85],[321,1,97],[126,218,16,101,27],[318],[315,5],[386],[123,76],[116,295],[212],[287,17,123],[266],[360,101],[350,110],[287,17,123],[293,3],[206,64,32,10,189,3,16,25],[10],[253,275],[126],[4,23,1,20,185,221],[225,225],[10],[190,11,6,1,335,1,2,6],[27,1,19,1],[211,331],[206,64,32,10,189,3,16,25],[260,265],[256,49,1,1,1],[27,1,19,1],[134],[6,631],[87,169,49,1,9,5,111],[293,3],[79,141,318,64],[23,92,12,41,20,7,174,112,69,4,11,22,4,38],[150,423],[413],[63,16,14,11,83,141,119,146,7,10],[290,25,5],[56,558],[8,627],[6,46,585],[79,249],[368],[79,141,318,64],[202,185,61],[181,172],[132],[286,2,220,1],[27],[27,1,19,1],[10],[467],[238,1,1,142],[62,549],[202,23,223,2],[4],[48],[28],[165,81,77,21,28,90,26,9,35,35],[149],[150,423],[187,260],[387],[181,169,3,107],[187,260],[287,17],[254],[399],[183,374],[363,120],[97,338],[603],[223,87,193,34],[97,61,252,25,29],[339],[300],[94,233],[143,436],[16,98],[77,158,14,5,38,110,26,38,69],[389],[244],[598],[30],[5,41],[30],[80,314],[75,205,101,223],[22,608],[314],[7,294,41,31,107,9,16],[511,10,82],[13,109,88],[340],[228,206],[33,233,31,59],[282],[59,553],[1,24,16,8,23,26,6,2,9,20,31,2,12,5,3,2,5,6,6,34,30,2,61,25,10,29,15,68,3,8,25,2,15,9,1,2,6,2,1,4,6,1,25,1,1,13,12,2,7,12],[228],[218,231],[212,97],[20,91,1,306,19,1],[229,178,44],[345],[12,7,11,56,33,17,18,55,116,40,6],[409],[598],[227],[324,7],[96,28,57,102,38,1,71,26,14],[13,18,1,1],[149,425],[254],[363,120],[16,98],[80,314],[75,205,101,223],[7,294,72,107,25],[340],[228,206],[266,31,59],[59,553],[228],[218,231],[309],[20,91,1,306,19,1],[229,222],[345],[119],[149],[197],[23,346,112,148],[37,178,1,41,366],[77,1,350,1],[214,327],[38,261,48],[169,105,3,237,2],[333],[25,12,586,4],[377,99],[201,345],[226,136],[101,36],[272,246],[234,27,18,57],[249],[268,99,24,80,11],[383,16],[26,600],[59,553],[95,94,364],[116,295],[99],[580],[351,135],[406],[408],[36,364,68,156],[14,43,87,26,7,78,58,103,40,44],[96,135,6,66,130,20],[151,1,1,287,1,1],[300],[580],[574],[434],[140],[81,122,227],[97,338],[44,378],[65,23,14,171,244,78],[96,28,57,102,38,1,71,26,14],[19],[229,133,89],[226,157,49],[80],[466],[5,56],[119],[2,36,29,32,9,19,172,27,21,31,16,102,142],[56,30,64,57,68,19,90,29,21],[37,178,1,41,270],[414],[238,1,1,142],[206,64,4,3,15,10,10,189,3,10,2,4,25],[79,141,318],[81,349],[272,246],[263],[139],[261,136],[150,19,215],[13,18],[413],[407],[95,71],[140],[107,1],[158],[370],[7,13,92,189,72,45,20,42,25],[204],[80,71,1,1,287,1,1],[17,107,293],[261,136],[69,345,11],[415],[289],[16,98,120,27,18],[256,106],[606],[38,326],[110,317,9],[298,32],[231,222],[42],[140,268],[205,210],[236,219],[169],[584],[361],[491],[38,210,51,48],[13,18,162,83,56,16,9,11,11],[249],[15,8,20,11,29,5,5,2,8,22,23,6,10,2,38,13,58,44,15,70,65,120,5,4,17],[96,20,121,10,7,12,26,5,6,49,2,2,55,22],[135],[358],[60,6,130,161,192,58,10],[94,233],[203],[494],[235,167],[94,232,170],[168,183,135,79],[60,6,130,161,192,58,10],[106],[34,1,385,1],[138],[195,13,335,7],[149],[405],[13,1,55,53,48,40,128,78,9],[218,231],[361,7],[392],[268,122],[34,1,385,1],[159],[242,29,240,10,82],[363],[198],[42],[7,13,92,189,72,45,20,42,25],[253,275],[399],[73],[406],[88,14,171,244,78],[198],[412],[197,351],[224,312],[169],[11,157,397],[208,178],[195,355],[475,106],[155,42,142,209,24],[110,317,9],[197,351],[409],[262,262],[73,33,175,311],[70,43,313],[244],[37,178,1,41,151,215],[281],[50],[143],[51,372],[141,239],[554],[251,279],[266,31,59],[473],[23,346,112,148],[164],[197],[300],[83,322],[271],[108,215,174,69],[81,349],[314,185],[195,13,335,7],[16,98],[346],[205,189,21],[378],[536],[343],[5,56],[77,1,350,1],[37,178,1,41],[81,349],[207],[16,51,198],[65,17,16,499,11],[37,178,1,41,270,12,1,83],[392],[343],[16,51,198],[25,12],[135],[286,2,220,1],[44,378],[407],[99],[100,31,454],[97,249,89],[25,12,586,4],[218,231],[99,40,184,174],[107],[566],[466,69],[84,75,100,111],[94,233,168],[582],[221,1,47,150],[226],[118,321],[145],[214,327],[38,261,48],[145],[169,105,3,237,2,48],[582],[135],[333],[2,27,359,75,162,13],[66,22,5,54,1,127,59,10,15],[250],[388,75],[325],[381],[4,6],[105],[167,10,175,91],[25,12,19,535,23,8,1,4],[34,386],[35,386],[68,130,32,88,106,28,46],[63,415,132],[502],[176],[377,99,122],[282],[59,553],[201,345],[226],[101,36],[249],[383,16],[580],[574],[434],[606],[23,20,45,5,2,8,45,6,10,2,38,13,58,44,15,70,65,125,4],[494],[60,6,130,161,192,58,10],[195,13,335,7],[242],[198],[554],[297,59],[2,27,359,75,162,13],[66,22,5,54,1,127,59,10,15],[2,27,359,75,162,13],[502],[2,27,596,13],[144],[219,13],[0,129,1,2,452],[631],[473],[144,174,180,35,45,26],[201,345],[250,281],[395],[106,138,348],[105],[0],[552],[190],[372,90],[72,47,288],[10],[21],[371],[276],[385],[234,27,18,3,7,63,18,18,75],[561],[226,136],[171,1,46,226,1,4],[60],[39,167,96,10,15,74,3,63,14,14,6,3,41,46,1,1,4,9,12,2,2],[219,13],[0,43,58,28,1,2,5,61,386],[272,246],[234,27,18,57],[125,464],[16,98],[4,6],[249],[268,99,24,80,11,40],[319],[221,1,99,98],[1,7,172],[276,107,16],[109],[200,347],[147,212,125,92],[26,600],[59,553],[163,405],[371],[259],[432],[4,6],[281],[58],[161,1,1,405,1,1],[109],[95,94,364],[32,152,372],[58],[4,6],[4,6,8,9,1,19,1,57,70,271],[379],[188,57],[263],[116,295],[75,282,247],[434],[494],[99],[97,338],[564],[248,332],[158],[161,1,1],[127,460],[17,400],[351,135],[406],[318,180],[408],[36,364,68,156],[14,43,43,44,26,7,78,58,36,67,40,31,13,96],[96,135,6,66,130,20],[151,1,1,287,1,1],[42],[69,356],[333],[354],[209],[300],[365,45,54],[580],[53,90,436,37],[325],[23,37,6,22,5,10,45,16,111,59,70,203],[574],[247],[434],[140],[16,51,47,151,17],[7,271,235,123],[99,102,26,33,88,177,21],[81,122,227],[97,338],[286,2,220,1],[392],[401],[385],[4,6,95],[44,378],[55,27,16,499],[65,23,14,171,244,78,6,7],[11,622],[96,28,57,102,38,1,71,26,14],[94,39],[19],[229,133,89],[226,157,49],[7,294,72,107,25],[232,4,219],[16,51,2,11,15,15,33,6,10,7,35,4,1,29,27,3,5,19,2,1,10,10,24,34,24,8,12,1,10,2,7,2,30,35,3,7,9,1,3,11,3,7,1,28,5,4,16,3],[19],[118,137,184,17],[466],[264],[5,56],[40,581],[5,8,18,1,1,13,38,5,240,14,288],[342],[489],[119],[248],[2,36,29,32,9,19,172,27,21,31,16,102,142],[56,30,64,57,68,19,90,29,21,40],[37,178,1,41,270],[110,304,13,9],[473,76],[238,1,1,142],[15,110,21,60,64,4,3,15,10,10,63,103,23,3,10,2,4,25,32,12],[473],[149],[79,141,318,64],[5,56,344],[14,67,30,49,10,246,14,7],[272,246],[138],[309],[385,88],[263],[500],[381],[151,1,1,287,1,1],[318,180,35,45,26],[139],[250,281],[182,1,1],[38,261,48],[7,271,235,123],[310,192,1],[261,136],[150,19,215,90,90,9],[23,79,1,82,184,29,71,12,74,4,35,1,34,6,4],[13,18],[413],[136],[70,43,313],[407],[95,71],[140],[107,1],[60,24,5,163,77,81,54,65],[158,61,13],[326,170],[395],[386],[71],[370],[191,1,21],[7,13,92,189,72,45,20,42,25,131],[64,545],[182,1,1],[204],[556,1,1],[234,9,18,18,3,7,63,18],[74],[106,138,348],[105],[43,20,17,38,33,1,1,286,1,1,1,168],[494,13,60,35],[399],[17,107,293],[0],[317,141],[552],[190],[238,1,1,21,121,15],[318,180],[204],[73],[182],[138],[11,622],[556,1,1],[490,33],[313,187],[13,56,53,88,136,68,11],[110,305,12,9],[161,1,396,11,1],[93,11,38,133,19,213,8,65,13,7],[362],[372,90],[342],[289],[16,98,120,27,18,3],[256,106],[72,47,288,199],[178,382],[38,139,17,33,137,187,10,17],[5,41,145,1,21],[472],[117,473],[10],[51,45,28,57,102,110,26,4,10],[389],[13,109,88],[110,317,9],[120,1,100,1,4,43,150],[389],[248],[75,184],[298,32],[127,140,74,149,3,13,17],[229,1,1,24,61,135,1,1,3,1],[15,131,10,219,103,93,6,55],[21,96,193,193,87],[289],[71],[9,625],[42],[200,347],[135,5,101,167],[205,210],[236,219],[335],[169],[584],[227],[147,212,125,92],[141,239,95,106],[3],[361],[371],[193,139],[165],[276],[491],[313],[36,364,68,156],[268,122],[605],[38,189,21,51,48],[13,6,12,24,10,15,2,4,12,24,35,17,19,17,66,56,16,9,1,10,11,28,190,11],[212],[333],[196,189],[157],[234,27,18,3,7,63,18,18,75],[120,1,100,45,3,28,25,34,63],[249],[355],[485],[0,15,8,20,11,29,5,5,2,8,22,23,6,10,2,11,27,13,58,44,15,64,6,65,23,23,46,14,14,5,4,2,1,14],[182,1,1,372,1,1],[38,326],[171,1,46,226,1,4],[60],[37,178,1,41,270,12,1,83],[96,20,121,10,7,5,7,26,5,6,49,2,2,55,22],[135,19,87,133,105,55,48],[342],[489],[100,31,239,215],[324,7,27],[6,34,20,6,130,161,192,58,10,4,16],[335,227],[232],[94,233,168,104],[125,464],[95,64,7,96,78,151,33,42,32],[65,23,14,170,1,244,1,77,6,7],[266,31,59],[41,8,3,565,1,2],[588,23],[62,38,31,72],[200,347],[13,18,481],[25,12,2,17,39,20,74,64,124,99,52,25,38,23,8,1,4],[251,1,151,62,64,1],[494],[42,193,167],[236,219],[94,39,193,170,87,16],[311],[1,7,17,14,2,8,23,26,6,2,9,20,31,2,12,5,3,2,5,6,5,1,1,33,30,2,29,10,15,7,25,10,29,3,3,9,54,14,3,8,3,6,3,13,2,15,9,1,1,1,6,2,1,4,6,1,25,1,1,4,9,12,2,2,5,8,4],[209],[23,145,183,18,112,5,79,64],[99,107,64,32,10,189,3,16,25],[43,155],[6,34,20,6,108,22,161,192,58,10,4,16],[568,1,1],[376,101],[106,82,366,38],[182,1,1,372,1,1],[34,1,385,1],[138],[195,13,335,7],[23,1,125,363,116,1],[214,42,68,38,179,15,1,1],[495,104],[405],[13,1,55,53,48,30,10,128,57,21,9,122],[90,2],[381],[15,131,229,103,99],[218,231],[326,140,30],[8,31,583,13],[580],[77,351],[173,390],[234,27,18],[361,7],[83],[209],[0,5,2,6,1,1,1,7,13,1,1,39,1,1,9,5,1,1,1,4,2,11,3,4,1,1,1,1,4,1,8,4,5,1,1,21,12,10,1,1,10,3,9,1,5,14,3,1,1,16,5,6,1,2,4,1,4,4,4,1,5,4,1,1,2,1,12,1,16,1,31,4,48,1,3,8,1,1,4,49,1,16,5,1,1,2,7,1,4,1,1,1,12,4,1,5,19,11,1,1,4,5,9,1,2,1,1,1,1,1,20,1,5,3,4],[107,285],[491],[23,80,87,5,13,196,139,7,2,42],[268,122],[68,356],[34,1,385,1],[473],[606,13],[45,27],[226],[21,138,472],[242,29,240,8,2,82,28],[161,409],[363,120],[26,600],[401,66],[198,385],[149,425],[42],[214,327,43],[162,407],[236,219],[318,180],[73],[59,553],[96,207,130],[7,10,3,76,16,12,123,54,2,45,4,2,19,44,1,15,5,42,25,131],[156,415],[253,275],[399],[73],[36,250,2,112,68,40,1,115],[556,1,1],[550,44],[23,80,92,13,196],[264],[406],[88,14,171,244,78,6],[193,139],[59,553],[219],[198,69,74],[1,7,1,5,15,28,11,12,14,16,14,3,6,10,14,16,7,6,5,1,15,6,5,32,8,13,39,106,8,3,9,13,54,16,7,5,13,11,4,4,16,4,4,7,5,14,12,9,1,4],[7,83,2,33,3,150,7,225,3,73,50],[15,39,155,146,130,7,97,26],[125,464],[106,486],[412],[197,351],[42],[150,19,89,126,90,52,38,9],[161,1,1,29,14,9,23,1,31,44,49,120,16,21,20,5,23,1,1],[15,21,86,6,1,12,5,1,1,55,13,19,5,16,11,7,5,4,4,1,5,4,1,1,2,1,30,35,115,22,1,1,2,8,5,2,12,4,36,1,1,4,5,38,8],[0,113,3,4,1,2,68,23,3,2,13,160,149],[34,1,385,1],[63,547],[44,198,7,157,16],[224,312],[159],[100,249],[9,160,395,70],[16,98],[11,157,397,68],[83],[276],[511,10,82],[19],[208,178],[195,355],[365],[60],[119],[475,106],[155,184,209,24],[110,317,9],[16,98],[12,10,106,48,48,61,202,23,26,26,24,10,34],[376,101],[25,12,19,141,112,80,159,43,23,8,1,4],[2,4,34,19,9,64,64,228,125,35,28,9,16,1],[262,262],[280],[72,534],[311],[43,333],[0,73,1,27,5,12,19,144,85,73,73,80,13],[9,6,4,35,32,93,11,62,144,74,7,52,23,63,17,2],[9,625],[169],[164],[70,43,313],[407],[244],[4,6,157,276],[182,1,1,372,1,1],[14,146,26,52,1,1,142,34],[78,169,182],[388,75,98],[138],[37,178,1,41,151,119,12,1,83],[77,1,350,1],[345],[522],[15,39,71,464,26],[281],[319],[84],[259],[11,12,1,17,8,3,30,6,10,175,244,80,4,16,1,2,8,5],[135],[432],[7,294,72,107,25],[50,95,34,63],[358],[143],[51,372],[221,1,99,98],[198],[58,61,129,113,31],[362],[489],[141,239],[339],[342,147],[12,7,11,56,68,171,40,6],[318,180],[16,98],[7,271,235,123],[99],[385],[40,581],[15,131,229,103,99],[473],[500],[238,1,1,142],[318,180],[138],[13,109,88,136],[110,317,9],[560],[472],[493,13],[313],[227],[65,15,2,16,76,233,190,11],[100,31,454],[562],[209],[592],[128,81,76,70,130,7,18,76],[200,347],[226],[483],[550],[195,13],[119],[37,44,134,1,41,85,88,59,38],[533],[238,1,1,142],[193,139],[261,136],[90,2],[84],[212],[57,556],[637],[6,488,73,35],[554],[13,18],[158],[1,7,172],[251,279],[276],[264],[383],[116,295],[32,1,128,1,1,103,31,59,212,1,1],[132,452],[165],[79,141,71,247,64],[37,44,134,1,41,85,88,43,16,38,97],[85],[235,167],[14,12,13,3,14,25,14,16,4,30,15,10,16,3,14,50,1,123,36,3,14,7,39,52,25,38,7,16,8,4],[258,268],[363,120],[164],[4,6,157,276],[109,121,222],[193,139],[155,42,40,311,24],[29,56,41,197,174,91,18,5,8,6],[45,17,10],[89],[88,5,55,127,59],[215,1,102,180],[75,5,14,233,54,13,101,109],[280,20],[83,322],[271,103,105,40],[82,16],[268,122,82,50],[223,314],[226,37,301,30],[9,14,1,604,1,5],[29,24,11,10,34,18,2,48,109,32,6,75,60,11,28,13,52,4,20,2,17,4,2,5,9],[55,7,19,1,16,2,31,299,62,23,16,44,10,11,1,3,1],[43,131],[154],[346],[60],[314,185],[331],[195,13,335,7],[16,98],[129,1,227,127,4,4,23,60,1,24,1,6],[346],[551],[4,105],[194],[60],[38,261,48],[17,93,14,81,40,91,58,18,2,1,2,10,9],[4,6,134,33,17,74,122,82,50],[182,1,1,372,1,1],[378],[90,2],[551,10,17],[50,3,145,6,41,103,30,238],[141,239,95,106],[32,1,167,347],[362],[261,77,57,2,12],[147,99,113,125,48,44],[173,390],[274,3,237,2],[64,36,31,7,447,11,13],[156,415],[358],[5,8,18,1,1,10,3,18,54,79,242,109,30,4,27],[38,326],[268,99,24,80,11,40],[533],[536],[5,41,297,52],[5,10,46,85,48,181,17,86,73,26,55],[77,1,350,1],[345],[355,130],[161,1,1,405,1,1],[0,217],[161,1,1,405,1,1],[37,178,1,41,85,185],[81,349,59],[118,321],[101,36],[243],[401],[11,46,36,11,38,65,53,15,19,102,74,37,8,10,19,36,13,7,13,20],[179,352],[587,30,1,2],[238,1,1,142],[41,8,3,75],[116,295],[117,61,133,191,31,27,30],[16,51,198],[499],[368],[339],[15,39,561,17],[292,78,112],[13,18],[238,1,1,142],[231,222],[65,17,16,95,139,265,11],[41,219,265,95],[396,74],[0,137,229],[403,62],[267,74,149,33],[13,18,147,13,1,21,347],[90,1,48],[527,12,1],[392],[85,258],[5,41,43,240,31,101],[403,62],[298,32,163,13,99],[16,51,198],[25,12],[21,73,177,56,168,24,80,32],[214,327],[135],[5,2,29,10,232,8,2,97,15,68,5,35,1,4,123],[383],[44,378],[3],[355,130],[261,136],[261,136],[229,2,176,44,2],[119],[276],[99],[339],[90,2,8,31,218,138,98,11],[182,1,1],[51,372],[171,1,272,1],[97,249,89],[116,295],[84,87,1,46,15,211,1,4,5],[1,7,168,4],[37,51,339],[12,10,608],[41,4,27,27,1,27,4,8,159,25,7,44,105,14,4,9,28,48,3,3,8,10,5,8,1],[107],[118,321],[116,295],[11,6,48,4,12,1,16,2,10,8,1,8,4,12,6,10,8,24,1,1,16,4,13,5,79,21,1,16,15,54,8,2,3,6,3,4,10],[579],[13,109,88],[566,32],[324,7],[483],[99],[37,178,1,41,270],[261,136],[42],[597,11],[585],[167,10,175,91],[466,69],[587],[42],[371],[84,75,53,47,111],[248],[259],[432],[633],[13,109,88],[503],[335],[13,18],[4,6],[94,233,168],[173,390],[583],[281],[57,556],[4,6],[582],[161,1,1,405,1,1],[219,2,1,47,150],[226],[109],[32,1],[91,468,76,4],[43,52,6,17,19,17,12,30,8,13,102,120,30],[118,321],[58]]};
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+فهارس الترتيب والفلاتر المبنية مسبقاً للشبكة في index.html - Iraq-Store
+
+بدلاً من ترتيب كل المنتجات وفحصها في المتصفح مع كل تغيير، يكتب البناء
+data/facets.js بنفس ترتيب صفوف data/listing.js:
+
+- sorts: ترتيب الصفوف تصاعدياً حسب sale_price ونسبة الخصم و id
+  (التنازلي = نفس المصفوفة بالعكس)
+- facets: لكل قيمة (شريحة سعر، وفئة المنتج إن وُجد الحقل category) قائمة
+  أرقام الصفوف تصاعدياً
+
+كل قائمة أرقام صفوف مرمّزة base64 لمصفوفة Uint16 (حتى 65536 صف) أو Uint32
+بترتيب little-endian، فيفكها المتصفح مباشرة إلى Uint16Array/Uint32Array.
+الفلترة تقاطع قوائم صغيرة (أو قناع Uint8Array)، والترتيب مرور واحد على
+المصفوفة المحسوبة مسبقاً مع تخطي الصفوف غير المطابقة.
+"""
+
+import base64
+import os
+import sys
+from array import array
+
+from build_io import dumps, write_chunks_if_changed
+from product_schema import discount_percent
+
+FACETS_FILE = os.path.join('data', 'facets.js')
+
+# حدود شرائح السعر بالدينار (sale_price): أقل من 50,000، 50,000-60,000 ... 150,000 فأكثر
+PRICE_EDGES = (50000, 60000, 75000, 100000, 150000)
+# حقول نصية تصبح فلاتر إذا وُجدت في الكتالوج
+FACET_FIELDS = ('category',)
+# حدود مصفوفتي array('q') و array('h'): القيم خارجها تُقصّ بدلاً من OverflowError
+INT64_RANGE = (-(1 << 63), (1 << 63) - 1)
+INT16_RANGE = (-(1 << 15), (1 << 15) - 1)
+
+
+def sort_value(value, bounds=INT64_RANGE):
+    """قيمة صحيحة للترتيب: float ← int، وغير الرقمي أو الفارغ ← 0، مع القص إلى bounds"""
+    try:
+        number = int(value or 0)
+    except (TypeError, ValueError, OverflowError):
+        number = 0
+    return min(max(number, bounds[0]), bounds[1])
+
+
+def price_bucket(sale_price):
+    """رقم شريحة السعر (0 .. len(PRICE_EDGES))"""
+    for bucket, edge in enumerate(PRICE_EDGES):
+        if sale_price < edge:
+            return bucket
+    return len(PRICE_EDGES)
+
+
+def encode_rows(rows, typecode):
+    """قائمة أرقام صفوف ← base64 لمصفوفة Uint16/Uint32 little-endian"""
+    data = array(typecode, rows)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return base64.b64encode(data.tobytes()).decode('ascii')
+
+
+class FacetIndexBuilder:
+    """بناء الفهارس تدريجياً بنفس ترتيب صفوف data/listing.js"""
+
+    def __init__(self):
+        self.sale_prices = array('q')
+        self.discounts = array('h')
+        self.ids = array('q')
+        self.buckets = [array('I') for _ in range(len(PRICE_EDGES) + 1)]
+        self.values = {field: {} for field in FACET_FIELDS}
+
+    @property
+    def rows(self):
+        return len(self.sale_prices)
+
+    def add(self, product):
+        self.append(self.entry(product))
+
+    def entry(self, product):
+        """قيم الترتيب والفلاتر بدون تعديل الفهرس (انظر ListingIndexBuilder.entry)"""
+        sale_price = sort_value(product.get('sale_price'))
+        try:
+            discount = sort_value(discount_percent(product), INT16_RANGE)
+        except (TypeError, ValueError):
+            discount = 0
+        product_id = product.get('id')
+        product_id = sort_value(product_id) if isinstance(product_id, (int, float)) else None
+        values = {field: str(product[field]) for field in FACET_FIELDS if product.get(field)}
+        return sale_price, discount, product_id, values
+
+    def append(self, entry):
+        sale_price, discount, product_id, values = entry
+        row = self.rows
+        self.sale_prices.append(sale_price)
+        self.discounts.append(discount)
+        self.ids.append(row if product_id is None else product_id)
+        self.buckets[price_bucket(sale_price)].append(row)
+        for field, value in values.items():
+            self.values[field].setdefault(value, array('I')).append(row)
+
+    def index(self):
+        """القاموس الذي يُكتب في data/facets.js"""
+        typecode = 'H' if self.rows <= 1 << 16 else 'I'
+        rows = range(self.rows)
+        # ترتيب ثابت: نفس القيمة ← ترتيب الكتالوج
+        sorts = {name: encode_rows(sorted(rows, key=values.__getitem__), typecode)
+                 for name, values in (('price', self.sale_prices), ('discount', self.discounts), ('id', self.ids))}
+
+        edges = (0, *PRICE_EDGES, None)
+        facets = {'price': [{'min': edges[b], 'max': edges[b + 1], 'count': len(bucket),
+                             'rows': encode_rows(bucket, typecode)}
+                            for b, bucket in enumerate(self.buckets) if bucket]}
+        for field, values in self.values.items():
+            if values:
+                facets[field] = [{'value': value, 'count': len(values[value]),
+                                  'rows': encode_rows(values[value], typecode)} for value in sorted(values)]
+        return {'rows': self.rows, 'width': 2 if typecode == 'H' else 4, 'sorts': sorts, 'facets': facets}
+
+    def iter_facets_js(self):
+        """محتوى data/facets.js على أجزاء bytes"""
+        yield '// فهارس الترتيب والفلاتر - مولّد تلقائياً من generate_products.py\nconst facetIndex = '.encode('utf-8')
+        yield dumps(self.index()).encode('utf-8')
+        yield b';\n'
+
+    def finish(self, site_dir='.'):
+        """كتابة data/facets.js إذا تغيّر، يعيد True عند الكتابة"""
+        return write_chunks_if_changed(os.path.join(site_dir, FACETS_FILE), self.iter_facets_js())
@@ -10,235 +10,161 @@ Product Schema Fixer v2.0 - Iraq-Store
 - تقييمات محسّنة
 - بيانات إضافية للمنتجات
 
+الصفحات التي ينشئها generate_products.py تحتوي السكيما المحسّنة مسبقاً،
+هذا السكريبت مخصص للصفحات القديمة المكتوبة يدوياً ويتخطى صفحات المولّد
+(<meta name="generator" content="generate_products.py">).
+
+المخرجات ثابتة (GTIN من sha256 وتاريخ صلاحية سعر ثابت) والملفات التي لا
+يتغير محتواها لا تُعاد كتابتها.
+
+هذا هو تحويل schema في page_transforms.py وحده؛ لتطبيقه مع إصلاح الصور
+وأكواد التتبع في قراءة وكتابة واحدة لكل ملف: python page_transforms.py
+
 الاستخدام:
 python fix-schema.py
+python fix-schema.py --workers 4 --price-anchor 2025-11-01
+python fix-schema.py --profile   # مؤقتات المراحل وأبطأ الملفات في fix-schema-metrics.json
 """
 
+import argparse
 import os
-import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from datetime import datetime, timedelta
 
+from build_profile import BuildProfile, run_profiled
+from build_io import write_page
+from page_transforms import refresh_schema
+from product_schema import default_price_anchor, parse_price_anchor
 
-def extract_product_info(html_content):
-    """استخراج بيانات المنتج من HTML"""
-    data = {}
-    
-    # استخراج العنوان
-    title_match = re.search(r'<title>([^<]+)</title>', html_content)
-    if title_match:
-        full_title = title_match.group(1).strip()
-        # إزالة " - متجر العراق"
-        data['name'] = full_title.replace(' - متجر العراق', '').strip()
-    
-    # استخراج الوصف من meta description
-    desc_match = re.search(r'<meta name="description" content="([^"]+)"', html_content)
-    if desc_match:
-        data['description'] = desc_match.group(1).strip()
-    
-    # استخراج السعر القديم
-    old_price_match = re.search(r'<span class="old-price">([\d,]+)\s*د\.ع</span>', html_content)
-    if old_price_match:
-        data['old_price'] = old_price_match.group(1).replace(',', '')
-    
-    # استخراج السعر الجديد
-    new_price_match = re.search(r'<div class="new-price">([\d,]+)\s*د\.ع</div>', html_content)
-    if new_price_match:
-        data['price'] = new_price_match.group(1).replace(',', '')
-    
-    # استخراج نسبة الخصم
-    discount_match = re.search(r'<span class="discount-badge">خصم (\d+)%</span>', html_content)
-    if discount_match:
-        data['discount'] = discount_match.group(1)
-    
-    # استخراج رابط الصورة
-    img_match = re.search(r'<img src="([^"]+)" alt="[^"]*" class="product-image">', html_content)
-    if img_match:
-        data['image'] = img_match.group(1)
-    
-    return data
 
+METRICS_FILE = 'fix-schema-metrics.json'
 
-def generate_enhanced_schema(product_data, filename):
-    """توليد JSON-LD Schema محسّن للمنتج"""
-    
-    # تحضير البيانات
-    name = product_data.get('name', 'منتج')
-    description = product_data.get('description', 'منتج عالي الجودة من متجر العراق')
-    price = product_data.get('price', '0')
-    old_price = product_data.get('old_price', price)
-    image = product_data.get('image', 'https://via.placeholder.com/500')
-    discount = product_data.get('discount', '0')
-    
-    # حساب التقييم (مبني على الخصم)
-    discount_num = int(discount) if discount else 0
-    if discount_num >= 20:
-        rating = "4.7"
-        review_count = "156"
-    elif discount_num >= 15:
-        rating = "4.5"
-        review_count = "127"
-    elif discount_num >= 10:
-        rating = "4.3"
-        review_count = "98"
-    else:
-        rating = "4.2"
-        review_count = "73"
-    
-    # إنشاء URL للمنتج
-    product_url = f"https://sherow1982.github.io/Iraq-Store/products/{filename}"
-    
-    # حساب تاريخ انتهاء السعر (3 أشهر من الآن)
-    valid_until = (datetime.now() + timedelta(days=90)).strftime('%Y-%m-%d')
-    
-    # SKU فريد لكل منتج (بناءً على اسم الملف)
-    sku = f"IQ-{filename.replace('.html', '').replace(' ', '-')[:30]}"
-    
-    # GTIN (اختياري - يمكن تركه فارغ أو توليد رقم)
-    gtin = f"0{abs(hash(filename)) % 10**12:013d}"
-    
-    schema = f'''    <script type="application/ld+json">
-    {{
-      "@context": "https://schema.org/",
-      "@type": "Product",
-      "name": "{name}",
-      "description": "{description}",
-      "image": [
-        "{image}"
-      ],
-      "sku": "{sku}",
-      "mpn": "{sku}",
-      "gtin13": "{gtin}",
-      "brand": {{
-        "@type": "Brand",
-        "name": "متجر العراق"
-      }},
-      "offers": {{
-        "@type": "Offer",
-        "url": "{product_url}",
-        "priceCurrency": "IQD",
-        "price": "{price}",
-        "priceValidUntil": "{valid_until}",
-        "availability": "https://schema.org/InStock",
-        "itemCondition": "https://schema.org/NewCondition",
-        "seller": {{
-          "@type": "Organization",
-          "name": "متجر العراق",
-          "url": "https://sherow1982.github.io/Iraq-Store/",
-          "logo": "https://sherow1982.github.io/Iraq-Store/logo.png",
-          "telephone": "+201110760081",
-          "address": {{
-            "@type": "PostalAddress",
-            "addressCountry": "IQ",
-            "addressLocality": "بغداد"
-          }}
-        }},
-        "shippingDetails": {{
-          "@type": "OfferShippingDetails",
-          "shippingRate": {{
-            "@type": "MonetaryAmount",
-            "value": "5000",
-            "currency": "IQD"
-          }},
-          "shippingDestination": {{
-            "@type": "DefinedRegion",
-            "addressCountry": "IQ"
-          }},
-          "deliveryTime": {{
-            "@type": "ShippingDeliveryTime",
-            "handlingTime": {{
-              "@type": "QuantitativeValue",
-              "minValue": 1,
-              "maxValue": 2,
-              "unitCode": "DAY"
-            }},
-            "transitTime": {{
-              "@type": "QuantitativeValue",
-              "minValue": 3,
-              "maxValue": 7,
-              "unitCode": "DAY"
-            }}
-          }}
-        }},
-        "hasMerchantReturnPolicy": {{
-          "@type": "MerchantReturnPolicy",
-          "returnPolicyCategory": "https://schema.org/MerchantReturnFiniteReturnWindow",
-          "merchantReturnDays": 7,
-          "returnMethod": "https://schema.org/ReturnByMail",
-          "returnFees": "https://schema.org/FreeReturn"
-        }}
-      }},
-      "aggregateRating": {{
-        "@type": "AggregateRating",
-        "ratingValue": "{rating}",
-        "reviewCount": "{review_count}",
-        "bestRating": "5",
-        "worstRating": "1"
-      }},
-      "review": [
-        {{
-          "@type": "Review",
-          "reviewRating": {{
-            "@type": "Rating",
-            "ratingValue": "{rating}",
-            "bestRating": "5"
-          }},
-          "author": {{
-            "@type": "Person",
-            "name": "عميل متجر العراق"
-          }},
-          "reviewBody": "منتج ممتاز وجودة عالية، أنصح بالشراء"
-        }}
-      ]
-    }}
-    </script>'''
-    
-    return schema
 
-
-def add_schema_to_file(filepath):
-    """إضافة السكيما المحسّنة لملف HTML"""
+def add_schema_to_file(filepath, price_anchor=None, timings=None, verbose=True):
+    """
+    إضافة السكيما المحسّنة لملف HTML
+    يعيد 'added' أو 'updated' أو 'unchanged' (لا كتابة إذا لم يتغير المحتوى) أو 'error'
+    timings (اختياري): قاموس تُجمع فيه مدة كل مرحلة بالثواني
+    verbose=False: بدون رسالة لكل ملف (الأخطاء تُطبع دائماً)
+    """
+    if timings is None:
+        timings = {}
+    
+    def lap(stage, started):
+        now = time.perf_counter()
+        timings[stage] = timings.get(stage, 0.0) + (now - started)
+        return now
     
     try:
+        t = time.perf_counter()
         with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # فحص إذا كانت السكيما موجودة مسبقاً
-        if 'application/ld+json' in content:
-            # إزالة السكيما القديمة
-            content = re.sub(
-                r'<script type="application/ld\+json">.*?</script>',
-                '',
-                content,
-                flags=re.DOTALL
-            )
-            print(f"🔄 تحديث {filepath.name}")
-        else:
-            print(f"✅ إضافة سكيما جديدة لـ {filepath.name}")
+            original = f.read()
+        t = lap('read', t)
         
-        # استخراج بيانات المنتج
-        product_data = extract_product_info(content)
+        # إزالة السكيما القديمة إن وُجدت وإضافة المحسّنة قبل </head>
+        had_schema = 'application/ld+json' in original
+        new_content = refresh_schema(original, {'name': filepath.name, 'price_anchor': price_anchor})
+        t = lap('render', t)
         
-        # توليد السكيما المحسّنة
-        schema = generate_enhanced_schema(product_data, filepath.name)
+        if new_content == original:
+            return 'unchanged'
         
-        # إضافة السكيما قبل </head>
-        new_content = content.replace('</head>', f'{schema}\n</head>')
+        # حفظ الملف (كتابة ذرّية)
+        write_page(str(filepath), new_content)
+        lap('write', t)
         
-        # حفظ الملف
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        
-        return True
+        if had_schema:
+            if verbose:
+                print(f"🔄 تحديث {filepath.name}")
+            return 'updated'
+        if verbose:
+            print(f"✅ إضافة سكيما جديدة لـ {filepath.name}")
+        return 'added'
         
     except Exception as e:
         print(f"❌ خطأ في {filepath.name}: {str(e)}")
-        return False
+        return 'error'
+
 
+def process_file(filepath, price_anchor=None, verbose=True):
+    """معالجة ملف واحد داخل عملية منفصلة، يعيد (الحالة، التوقيتات)"""
+    timings = {}
+    status = add_schema_to_file(filepath, price_anchor, timings, verbose)
+    return status, timings
 
-def main():
+
+def fix_products_dir(products_dir, price_anchor=None, workers=1, verbose=True, profile=None):
+    """
+    تحديث السكيما في كل صفحات المجلد (ماعدا index.html)
+    يعيد (عدد كل حالة، التوقيت لكل مرحلة بالثواني، عدد الملفات)
+    profile (اختياري): BuildProfile يُسجَّل فيه زمن مراحل كل ملف وأبطأ الملفات
+    """
+    price_anchor = price_anchor or default_price_anchor()
+
+    started = time.perf_counter()
+    html_files = sorted(f for f in Path(products_dir).glob('*.html') if f.name != 'index.html')
+    stage_times = {'scan': time.perf_counter() - started}
+
+    counts = {'added': 0, 'updated': 0, 'unchanged': 0, 'error': 0}
+    if not html_files:
+        return counts, stage_times, 0
+
+    t = time.perf_counter()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(html_files) // (workers * 4))
+            results = list(executor.map(partial(process_file, price_anchor=price_anchor, verbose=verbose),
+                                        html_files, chunksize=chunksize))
+    else:
+        results = [process_file(html_file, price_anchor, verbose) for html_file in html_files]
+    stage_times['process'] = time.perf_counter() - t
+
+    for html_file, (status, timings) in zip(html_files, results):
+        counts[status] += 1
+        for stage, seconds in timings.items():
+            stage_times[stage] = stage_times.get(stage, 0.0) + seconds
+        if profile is not None:
+            profile.add_file(html_file.name, timings)
+
+    if profile is not None:
+        profile.add('scan', stage_times['scan'])
+
+    return counts, stage_times, len(html_files)
+
+
+def main(argv=None):
     """المعالج الرئيسي"""
     
+    parser = argparse.ArgumentParser(description='إصلاح وتحسين سكيما المنتجات')
+    parser.add_argument('--products-dir', default='products', help='مجلد صفحات المنتجات')
+    parser.add_argument('--price-anchor', type=parse_price_anchor, default=None,
+                        help='تاريخ بداية صلاحية السعر YYYY-MM-DD (الافتراضي: أول الشهر الحالي أو SOURCE_DATE_EPOCH)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='عدد العمليات المتوازية (0 = عدد الأنوية)')
+    parser.add_argument('--profile', action='store_true',
+                        help='مؤقتات المراحل وأبطأ الملفات مع ملخص مختصر بدلاً من رسائل التقدم')
+    parser.add_argument('--metrics', default=METRICS_FILE, help='ملف المقاييس JSON (مع --profile)')
+    parser.add_argument('--slowest', type=int, default=10, help='عدد أبطأ الملفات في التقرير (مع --profile)')
+    parser.add_argument('--cprofile', metavar='FILE',
+                        help='التشغيل تحت cProfile وحفظ النتيجة في FILE (العملية الرئيسية فقط)')
+    args = parser.parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+    price_anchor = args.price_anchor or default_price_anchor()
+
+    if args.profile:
+        profile = BuildProfile('fix-schema', args.slowest)
+        counts, _, total = run_profiled(
+            lambda: fix_products_dir(args.products_dir, price_anchor, workers, verbose=False, profile=profile),
+            args.cprofile)
+        metrics = profile.write(args.metrics, counts=counts, files=total, workers=workers,
+                                price_anchor=price_anchor.isoformat())
+        profile.print_summary(metrics)
+        print(f"📊 {total} ملف: {counts['added']} إضافة، {counts['updated']} تحديث، "
+              f"{counts['unchanged']} بدون تغيير، {counts['error']} أخطاء → {args.metrics}")
+        return
+    
     print("="*70)
     print("🔧 إصلاح وتحسين سكيما المنتجات v2.0 - متجر العراق")
     print("="*70)
@@ -254,41 +180,33 @@ def main():
     print("="*70)
     print()
     
-    # المجلد الحالي
-    products_dir = Path('products')
-    
+    products_dir = Path(args.products_dir)
     if not products_dir.exists():
         print("❌ مجلد products غير موجود!")
         print("تأكد من تشغيل السكربت من مجلد Iraq-Store الرئيسي")
         return
-    
-    # الحصول على جميع ملفات HTML (ماعدا index.html)
-    html_files = [f for f in products_dir.glob('*.html') if f.name != 'index.html']
-    
-    if not html_files:
+
+    counts, stage_times, total = run_profiled(
+        lambda: fix_products_dir(products_dir, price_anchor, workers), args.cprofile)
+    if not total:
         print("❌ لم يتم العثور على ملفات منتجات!")
         return
-    
-    print(f"📦 تم العثور على {len(html_files)} منتج")
-    print()
-    
-    # معالجة الملفات
-    updated_count = 0
-    error_count = 0
-    
-    for html_file in html_files:
-        if add_schema_to_file(html_file):
-            updated_count += 1
-        else:
-            error_count += 1
+    print(f"📦 تم العثور على {total} منتج")
     
     print()
     print("="*70)
     print("📊 ملخص العملية:")
-    print(f"   ✅ تم التحديث/الإضافة: {updated_count} ملف")
-    if error_count > 0:
-        print(f"   ❌ أخطاء: {error_count} ملف")
-    print(f"   📁 الإجمالي: {len(html_files)} ملف")
+    print(f"   ✅ تمت الإضافة: {counts['added']} ملف")
+    print(f"   🔄 تم التحديث: {counts['updated']} ملف")
+    print(f"   ⏸️ بدون تغيير (لم تتم الكتابة): {counts['unchanged']} ملف")
+    if counts['error'] > 0:
+        print(f"   ❌ أخطاء: {counts['error']} ملف")
+    print(f"   📁 الإجمالي: {total} ملف")
+    print(f"   📅 بداية صلاحية السعر: {price_anchor.isoformat()}")
+    print()
+    print("⏱️ التوقيت لكل مرحلة (read/render/write مجموع وقت الملفات):")
+    for stage, seconds in stage_times.items():
+        print(f"   {stage:<8} {seconds * 1000:9.1f} ms")
     print("="*70)
     print()
     print("✨ اكتملت العملية بنجاح!")
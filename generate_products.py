@@ -2,218 +2,765 @@
 # -*- coding: utf-8 -*-
 """
 سكريبت لإنشاء جميع صفحات المنتجات (640 صفحة) مع تحسينات SEO كاملة
-استخدام: python generate_products.py
+
+البناء تزايدي: يحفظ السكريبت بصمة (hash) لكل منتج ولنسخة القالب في
+ملف .build-manifest.json، وفي التشغيل التالي يكتب الصفحات الجديدة أو
+المتغيرة فقط ويحذف صفحات المنتجات المحذوفة من الكتالوج.
+
+الـ JSON-LD المحسّن (product_schema.py) يُكتب أثناء الإنشاء نفسه،
+فلا حاجة لتشغيل fix-schema.py على الصفحات المولّدة.
+
+استخدام:
+python generate_products.py
+python generate_products.py --force   # إعادة إنشاء جميع الصفحات
+python generate_products.py --workers 8   # إنشاء متوازٍ على 8 أنوية
+python generate_products.py --catalog feed.jsonl   # كتالوج آخر (JSON array أو JSON Lines)
+python generate_products.py --profile   # مؤقتات المراحل وأبطأ الصفحات في build-metrics.json
+python generate_products.py --profile --cprofile build.prof   # مع cProfile
+python generate_products.py --archive site.tar.gz   # الموقع كاملاً في أرشيف واحد (انظر site_archive.py)
+python generate_products.py --lint   # فحص الكتالوج (slugs ومنتجات شبه مكررة) حتى بدون تغيّره
+python preview.py   # وضع المراقبة: معاينة محلية تتحدث مع كل تعديل (انظر preview.py)
+
+خريطة الموقع (sitemap.xml + sitemaps/) تُولّد في نفس البناء، انظر sitemap.py.
+وكذلك index.html و page/<n>.html بالبطاقات جاهزة من templates/listing.html، انظر listing_pages.py.
+وكذلك نسخ assets/ بأسماء مبنية على المحتوى و sw.js للكاش المحلي، انظر service_worker.py.
+
+مصدر البيانات هو catalog.jsonl (انظر catalog.py)، و products.js يُشتق منه
+عند تغيّره فقط.
 """
 
+import argparse
+import hashlib
+import inspect
 import json
 import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import quote
 
-print("="*70)
-print("🚀 سكريبت إنشاء صفحات المنتجات المحسّن")
-print("="*70)
+import catalog_lint
+import facet_index
+import listing_index
+import page_template
+import product_schema
+import search_index
+import sitemap
+from build_io import (dumps, peak_memory_mb, precompressed_variants, remove_with_siblings, sync_precompressed,
+                      write_if_changed, write_page, write_precompressed)
+from build_profile import BuildProfile, run_profiled
+from catalog import CATALOG_FILE, VIEWS, iter_products, sync_views
+from catalog_lint import LINT_FILE, lint_catalog, print_report, slug_problem, write_report
+from facet_index import FACETS_FILE, FacetIndexBuilder
+from image_meta import (IMAGE_CACHE_FILE, IMAGE_MIRROR_DIR, VARIANTS_DIR, ImageMetaCache, image_attributes,
+                        listing_image)
+from listing_index import LISTING_FILE, ListingIndexBuilder
+from listing_pages import LISTING_VERSION, PAGES_DIR, write_listing_pages
+from page_template import load_template
+from search_index import SEARCH_FILE, SearchIndexBuilder
+from service_worker import ASSETS_DIR, REWRITTEN_PAGES, SERVICE_WORKER_FILE, sync_site
+from site_archive import SiteArchive
+from sitemap import SITEMAP_FILE, SITEMAPS_DIR, build_date, write_sitemaps
+from product_schema import build_schema, default_price_anchor
+
+OUTPUT_DIR = 'products'
+MANIFEST_FILE = '.build-manifest.json'
+METRICS_FILE = 'build-metrics.json'
+MANIFEST_VERSION = 1
+
+# ملفات الموقع في وضع الأرشيف (نسبةً إلى site_dir): الثابتة تُضاف قبل الصفحات
+# حتى تفوز الصفحة المولّدة عند تعارض الاسم، كما عند الكتابة في المجلد
+# (REWRITTEN_PAGES ومنها index.html تُضاف في النهاية بعد تحديث مراجع assets/ فيها)
+STATIC_FILES = ('robots.txt', 'CNAME', 'BingSiteAuth.xml', f'{OUTPUT_DIR}/index.html')
+GENERATED_FILES = (*VIEWS, os.path.dirname(LISTING_FILE), ASSETS_DIR, VARIANTS_DIR,
+                   SITEMAPS_DIR, SITEMAP_FILE, SERVICE_WORKER_FILE, PAGES_DIR)
+
+# CSS صفحات المنتجات: يُكتب مرة واحدة في assets/product.<hash>.css بدلاً من
+# تكراره داخل كل صفحة. الاسم يتغير مع المحتوى فيمكن تخزينه في الكاش بلا حدود
+PRODUCT_CSS = """
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: 'Cairo', sans-serif; direction: rtl; background-color: #f8f9fa; line-height: 1.8; }
+.navbar { background: white; box-shadow: 0 2px 10px rgba(0,0,0,0.1); padding: 1rem 0; position: sticky; top: 0; z-index: 1000; }
+.navbar-brand { font-size: 1.8rem; font-weight: bold; color: #667eea !important; text-decoration: none; }
+.product-container { max-width: 1200px; margin: 2rem auto; padding: 0 1rem; }
+.product-header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 15px 15px 0 0; }
+.product-header h1 { font-size: 2rem; font-weight: 700; margin: 0; }
+.product-content { background: white; border-radius: 0 0 15px 15px; box-shadow: 0 5px 20px rgba(0,0,0,0.1); overflow: hidden; }
+.product-image { width: 100%; max-width: 500px; height: auto; border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }
+.price-section { background: #f8f9fa; padding: 1.5rem; border-radius: 10px; margin: 1.5rem 0; }
+.old-price { text-decoration: line-through; color: #999; font-size: 1.2rem; margin-left: 1rem; }
+.new-price { font-size: 2.5rem; color: #667eea; font-weight: 700; }
+.discount-badge { display: inline-block; background: #e74c3c; color: white; padding: 0.5rem 1rem; border-radius: 25px; font-size: 1.2rem; font-weight: 600; margin-right: 1rem; }
+.description { font-size: 1.1rem; color: #555; line-height: 2; padding: 1.5rem 0; }
+.btn-whatsapp { background: #25D366; color: white; border: none; padding: 1rem 3rem; font-size: 1.3rem; font-weight: 700; border-radius: 50px; cursor: pointer; transition: all 0.3s ease; text-decoration: none; display: inline-block; margin: 1rem 0; box-shadow: 0 5px 15px rgba(37, 211, 102, 0.3); }
+.btn-whatsapp:hover { background: #128C7E; transform: translateY(-2px); box-shadow: 0 7px 20px rgba(37, 211, 102, 0.4); color: white; }
+.btn-back { background: #667eea; color: white; border: none; padding: 0.75rem 2rem; font-size: 1rem; font-weight: 600; border-radius: 10px; text-decoration: none; display: inline-block; margin-bottom: 1rem; }
+.btn-back:hover { background: #5568d3; color: white; }
+footer { background: #2d3748; color: white; padding: 2rem 0; margin-top: 3rem; text-align: center; }
+@media (max-width: 768px) { .product-header h1 { font-size: 1.5rem; } .new-price { font-size: 2rem; } .btn-whatsapp { padding: 0.85rem 2rem; font-size: 1.1rem; } }
+"""
+
+
+def minify_css(css):
+    """حذف المسافات غير اللازمة حول { } : ; ,"""
+    return re.sub(r'\s*([{}:;,])\s*', r'\1', css).strip() + '\n'
+
+
+PRODUCT_CSS_MIN = minify_css(PRODUCT_CSS)
+PRODUCT_CSS_FILE = f"product.{hashlib.sha256(PRODUCT_CSS_MIN.encode('utf-8')).hexdigest()[:10]}.css"
+COMMENT_RE = re.compile(r'^<!--[^>]*-->$')
+
+
+def minify_html(html):
+    """
+    تصغير HTML: حذف المسافات في بداية ونهاية الأسطر والأسطر الفارغة والتعليقات
+    (القالب لا يحتوي على pre أو textarea، و JSON-LD لا يتأثر بالأسطر)
+    """
+    lines = (line.strip() for line in html.split('\n'))
+    return '\n'.join(line for line in lines if line and not COMMENT_RE.match(line))
 
-# تحميل المنتجات
-print("\n📂 جاري تحميل بيانات المنتجات...")
-with open('products_final.json', 'r', encoding='utf-8') as f:
-    products = json.load(f)
 
-print(f"✅ تم تحميل {len(products)} منتج")
+# القالب يُترجم مرة واحدة عند تحميل الوحدة (مرة لكل عملية في الوضع المتوازي)
+PRODUCT_TEMPLATE = load_template('product.html', minify_html)
+DEFAULT_PRODUCT_DESCRIPTION = 'منتج عالي الجودة بأفضل سعر'
 
-# إنشاء مجلد products
-os.makedirs('products', exist_ok=True)
 
 # دالة لإنشاء صفحة منتج واحدة
-def create_product_page(product):
+def create_product_page(product, image=None):
     whatsapp_number = "201110760081"
-    discount = round(((product['price'] - product['sale_price']) / product['price']) * 100) if product.get('price') and product.get('sale_price') else 0
+    discount = product_schema.discount_percent(product)
 
     # رسالة WhatsApp
-    title = product.get('title', 'منتج')
+    title = product.get('title') or 'منتج'
     sale_price = product.get('sale_price', 0)
     whatsapp_message = f"مرحباً، أريد طلب المنتج التالي:%0A%0A📦 {quote(title)}%0A💰 السعر: {sale_price:,} د.ع"
-    whatsapp_url = f"https://wa.me/{whatsapp_number}?text={whatsapp_message}"
 
+    full_description = product.get('description') or DEFAULT_PRODUCT_DESCRIPTION
     # مسار الصورة الصحيح (بدون ../)
     image_url = product.get('image_link', '')
 
-    # الوصف
-    description = product.get('description', 'منتج عالي الجودة بأفضل سعر')[:160]
-
-    html = f"""<!DOCTYPE html>
-<html dir="rtl" lang="ar">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-
-    <!-- SEO Meta Tags -->
-    <title>{title} - متجر العراق</title>
-    <meta name="description" content="{description}">
-    <meta name="keywords" content="{title}, متجر العراق, {title} سعر, شراء {title}">
-    <meta name="author" content="متجر العراق">
-    <meta name="robots" content="index, follow">
-    <link rel="canonical" href="https://sherow1982.github.io/1/products/{product.get('slug', '')}.html">
-
-    <!-- Open Graph -->
-    <meta property="og:type" content="product">
-    <meta property="og:title" content="{title}">
-    <meta property="og:description" content="{description}">
-    <meta property="og:image" content="{image_url}">
-    <meta property="og:url" content="https://sherow1982.github.io/1/products/{product.get('slug', '')}.html">
-    <meta property="og:price:amount" content="{sale_price}">
-    <meta property="og:price:currency" content="IQD">
-
-    <!-- Twitter Card -->
-    <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="{title}">
-    <meta name="twitter:description" content="{description}">
-    <meta name="twitter:image" content="{image_url}">
-
-    <!-- Bootstrap RTL -->
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.rtl.min.css">
-    <link href="https://fonts.googleapis.com/css2?family=Cairo:wght@400;600;700&display=swap" rel="stylesheet">
-
-    <!-- Structured Data -->
-    <script type="application/ld+json">
-    {{
-      "@context": "https://schema.org/",
-      "@type": "Product",
-      "name": "{title}",
-      "image": "{image_url}",
-      "description": "{description}",
-      "offers": {{
-        "@type": "Offer",
-        "price": "{sale_price}",
-        "priceCurrency": "IQD",
-        "availability": "https://schema.org/InStock"
-      }}
-    }}
-    </script>
-
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Cairo', sans-serif; direction: rtl; background-color: #f8f9fa; line-height: 1.8; }}
-        .navbar {{ background: white; box-shadow: 0 2px 10px rgba(0,0,0,0.1); padding: 1rem 0; position: sticky; top: 0; z-index: 1000; }}
-        .navbar-brand {{ font-size: 1.8rem; font-weight: bold; color: #667eea !important; text-decoration: none; }}
-        .product-container {{ max-width: 1200px; margin: 2rem auto; padding: 0 1rem; }}
-        .product-header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 15px 15px 0 0; }}
-        .product-header h1 {{ font-size: 2rem; font-weight: 700; margin: 0; }}
-        .product-content {{ background: white; border-radius: 0 0 15px 15px; box-shadow: 0 5px 20px rgba(0,0,0,0.1); overflow: hidden; }}
-        .product-image {{ width: 100%; max-width: 500px; height: auto; border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }}
-        .price-section {{ background: #f8f9fa; padding: 1.5rem; border-radius: 10px; margin: 1.5rem 0; }}
-        .old-price {{ text-decoration: line-through; color: #999; font-size: 1.2rem; margin-left: 1rem; }}
-        .new-price {{ font-size: 2.5rem; color: #667eea; font-weight: 700; }}
-        .discount-badge {{ display: inline-block; background: #e74c3c; color: white; padding: 0.5rem 1rem; border-radius: 25px; font-size: 1.2rem; font-weight: 600; margin-right: 1rem; }}
-        .description {{ font-size: 1.1rem; color: #555; line-height: 2; padding: 1.5rem 0; }}
-        .btn-whatsapp {{ background: #25D366; color: white; border: none; padding: 1rem 3rem; font-size: 1.3rem; font-weight: 700; border-radius: 50px; cursor: pointer; transition: all 0.3s ease; text-decoration: none; display: inline-block; margin: 1rem 0; box-shadow: 0 5px 15px rgba(37, 211, 102, 0.3); }}
-        .btn-whatsapp:hover {{ background: #128C7E; transform: translateY(-2px); box-shadow: 0 7px 20px rgba(37, 211, 102, 0.4); color: white; }}
-        .btn-back {{ background: #667eea; color: white; border: none; padding: 0.75rem 2rem; font-size: 1rem; font-weight: 600; border-radius: 10px; text-decoration: none; display: inline-block; margin-bottom: 1rem; }}
-        .btn-back:hover {{ background: #5568d3; color: white; }}
-        footer {{ background: #2d3748; color: white; padding: 2rem 0; margin-top: 3rem; text-align: center; }}
-        @media (max-width: 768px) {{ .product-header h1 {{ font-size: 1.5rem; }} .new-price {{ font-size: 2rem; }} .btn-whatsapp {{ padding: 0.85rem 2rem; font-size: 1.1rem; }} }}
-    </style>
-</head>
-<body>
-    <nav class="navbar">
-        <div class="container">
-            <a class="navbar-brand" href="../index.html">🛒 متجر العراق</a>
-        </div>
-    </nav>
-
-    <div class="product-container">
-        <a href="../index.html" class="btn-back">← العودة للرئيسية</a>
-
-        <div class="product-header">
-            <h1>{title}</h1>
-        </div>
-
-        <div class="product-content">
-            <div class="row p-4">
-                <div class="col-md-6 text-center">
-                    <img src="{image_url}" alt="{title}" class="product-image" loading="lazy">
-                </div>
-
-                <div class="col-md-6">
-                    <div class="price-section">
-                        <div class="mb-3">
-                            <span class="discount-badge">خصم {discount}%</span>
-                        </div>
-                        <div>
-                            <span class="old-price">{product.get('price', 0):,} د.ع</span>
-                        </div>
-                        <div class="new-price">{sale_price:,} د.ع</div>
-                    </div>
-
-                    <div class="description">
-                        <h3 style="color: #2d3748; margin-bottom: 1rem;">📋 وصف المنتج</h3>
-                        <p>{product.get('description', 'منتج عالي الجودة بأفضل سعر')}</p>
-                    </div>
-
-                    <div class="text-center mt-4">
-                        <a href="{whatsapp_url}" target="_blank" rel="noopener" class="btn-whatsapp">
-                            📱 اطلب المنتج واتساب
-                        </a>
-                        <p class="mt-3" style="color: #666; font-size: 0.95rem;">
-                            سيتم فتح محادثة واتساب مع تفاصيل المنتج
-                        </p>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <footer>
-        <div class="container">
-            <p>© 2025 متجر العراق - جميع الحقوق محفوظة</p>
-            <p style="font-size: 0.9rem; margin-top: 0.5rem; opacity: 0.7;">
-                للاستفسارات: <a href="https://wa.me/201110760081" style="color: #25D366;">واتساب</a>
-            </p>
-        </div>
-    </footer>
-</body>
-</html>"""
-
-    return html
-
-# إنشاء الصفحات
-print(f"\n🔄 جاري إنشاء {len(products)} صفحة...")
-print("="*70)
-
-created_count = 0
-errors = []
-
-for i, product in enumerate(products, 1):
+    return PRODUCT_TEMPLATE.render({
+        'title': title,
+        'slug': product.get('slug', ''),
+        'image_url': image_url,
+        # width/height و srcset و placeholder من كاش بيانات الصور (image_meta.py)
+        'image_attrs': image_attributes(image, image_url, '../'),
+        'description': full_description[:160],
+        'full_description': full_description,
+        'sale_price': sale_price,
+        'sale_price_text': f"{sale_price:,}",
+        'price_text': f"{product.get('price', 0):,}",
+        'discount': discount,
+        'whatsapp_url': f"https://wa.me/{whatsapp_number}?text={whatsapp_message}",
+        'css_href': f"../{ASSETS_DIR}/{PRODUCT_CSS_FILE}",
+        # JSON-LD الكامل (بيانات التاجر، الشحن، الإرجاع، التقييم) يُولَّد هنا مباشرة
+        'schema': build_schema(product),
+    })
+
+
+# نسخة القالب: أي تعديل على create_product_page أو templates/product.html أو السكيما يغيّرها فيُعاد بناء كل الصفحات
+TEMPLATE_VERSION = hashlib.sha256(
+    (inspect.getsource(create_product_page) + inspect.getsource(minify_html) + PRODUCT_CSS_MIN
+     + inspect.getsource(image_attributes)
+     + ''.join(PRODUCT_TEMPLATE.chunks) + inspect.getsource(page_template) + inspect.getsource(product_schema)
+     ).encode('utf-8')
+).hexdigest()[:16]
+
+
+# نسخ مدخلات المراحل التي تمر على الكتالوج كاملاً: تعديل الكود يعيد تشغيلها حتى لو لم تتغير البيانات
+INDEX_VERSION = hashlib.sha256(
+    (inspect.getsource(listing_index) + inspect.getsource(search_index) + inspect.getsource(facet_index)
+     + inspect.getsource(listing_image) + LISTING_VERSION).encode('utf-8')
+).hexdigest()[:16]
+LINT_VERSION = hashlib.sha256(inspect.getsource(catalog_lint).encode('utf-8')).hexdigest()[:16]
+SITEMAP_VERSION = hashlib.sha256(inspect.getsource(sitemap).encode('utf-8')).hexdigest()[:16]
+
+
+def product_hash(product):
+    """بصمة ثابتة لحقول المنتج المدخلة"""
+    payload = json.dumps(product, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def product_slug(product, index):
+    """اسم ملف الصفحة (بدون .html) - نفس السلوك القديم عند غياب slug"""
+    return product.get('slug', f'product-{index}')
+
+
+def load_manifest(path):
+    """تحميل ملف البناء السابق، أو manifest فارغ إن لم يوجد أو كان تالفاً"""
+    empty = {'version': MANIFEST_VERSION, 'template_version': None, 'price_anchor': None, 'pages': {}}
     try:
-        page_html = create_product_page(product)
-        slug = product.get('slug', f'product-{i}')
-        filename = f"products/{slug}.html"
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(page_html)
-
-        created_count += 1
-
-        if i % 50 == 0:
-            print(f"✅ تم إنشاء {i}/{len(products)} صفحة...")
-
-    except Exception as e:
-        errors.append((product.get('id', i), str(e)))
-
-print(f"\n{'='*70}")
-print(f"✅ انتهى! تم إنشاء {created_count} صفحة بنجاح!")
-
-if errors:
-    print(f"\n⚠️ {len(errors)} خطأ:")
-    for error_id, error_msg in errors[:5]:
-        print(f"   - منتج {error_id}: {error_msg}")
-
-print(f"\n{'='*70}")
-print("📁 الصفحات موجودة في مجلد: products/")
-print("🌐 يمكنك الآن رفع الملفات على GitHub")
-print("\n✨ التحسينات المضافة:")
-print("   1. ✅ إصلاح مسار الصور (بدون ../)")
-print("   2. ✅ تحسينات SEO كاملة")
-print("   3. ✅ Structured Data")
-print("   4. ✅ Open Graph Tags")
-print("   5. ✅ Twitter Cards")
-print("="*70)
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return empty
+    manifest.setdefault('pages', {})
+    return manifest
+
+
+def save_manifest(path, manifest):
+    """حفظ ملف البناء (كتابة لملف مؤقت ثم استبداله)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def classify_page(slug, digest, old_pages, output_dir, rebuild_all):
+    """'created' أو 'updated' إذا يجب كتابة الصفحة، أو None إذا لم تتغير"""
+    old_digest = old_pages.get(slug)
+    exists = os.path.exists(os.path.join(output_dir, f"{slug}.html"))
+    if old_digest is None or not exists:
+        return 'created'
+    if rebuild_all or old_digest != digest:
+        return 'updated'
+    return None
+
+
+def write_assets(site_dir='.'):
+    """
+    كتابة assets/product.<hash>.css (ونسخه المضغوطة) وحذف النسخ القديمة منه
+    يعيد عدد الملفات التي كُتبت
+    """
+    assets_dir = os.path.join(site_dir, ASSETS_DIR)
+    css_path = os.path.join(assets_dir, PRODUCT_CSS_FILE)
+    written = write_if_changed(css_path, PRODUCT_CSS_MIN)
+    written += sync_precompressed(css_path, written)
+
+    for name in os.listdir(assets_dir):
+        if name.startswith('product.') and name.split('.')[2:3] == ['css'] and not name.startswith(PRODUCT_CSS_FILE):
+            os.remove(os.path.join(assets_dir, name))
+    return written
+
+
+def render_pages(items, output_dir):
+    """
+    إنشاء وكتابة مجموعة صفحات [(slug, product, image), ...]
+    يعيد قائمة (slug, error, timings, files) حيث error = None عند النجاح
+    و timings = {'render': ثوانٍ, 'write': ثوانٍ} لمؤقتات --profile
+    output_dir=None (وضع الأرشيف): لا يُكتب شيء، و files = [(اللاحقة، bytes)]
+    للصفحة ونسخها المضغوطة، وإلا files = None
+    تُستدعى مباشرة في الوضع التسلسلي أو داخل عمليات الـ process pool
+    """
+    results = []
+    for slug, product, image in items:
+        timings = {}
+        try:
+            t = time.perf_counter()
+            page_html = create_product_page(product, image)
+            now = time.perf_counter()
+            timings['render'] = now - t
+            data = page_html.encode('utf-8')
+            if output_dir is None:
+                files = [('', data), *precompressed_variants(data)]
+            else:
+                filename = os.path.join(output_dir, f"{slug}.html")
+                write_page(filename, page_html)
+                write_precompressed(filename, data)
+                files = None
+            timings['write'] = time.perf_counter() - now
+            results.append((slug, None, timings, files))
+        except Exception as e:
+            results.append((slug, str(e), timings, None))
+    return results
+
+
+class PageWriter:
+    """
+    خط إنشاء وكتابة الصفحات: يستقبل الصفحات المتغيرة واحدة تلو الأخرى
+    ويكتبها على دفعات، تسلسلياً أو عبر ProcessPoolExecutor.
+
+    عدد الدفعات قيد التنفيذ محدود (ضعف عدد العمال) فلا تتراكم نصوص الصفحات
+    في الذاكرة مهما كبر الكتالوج، والنتائج تُعاد بنفس ترتيب الإدخال حتى
+    تطابق قائمة الأخطاء الوضع التسلسلي.
+
+    profile (اختياري): BuildProfile تُسجَّل فيه مؤقتات كل صفحة
+    verbose=False يلغي رسالة التقدم بعد كل دفعة
+    archive (اختياري): SiteArchive تُضاف إليه الصفحات باسم <prefix>/<slug>.html
+    بدلاً من كتابتها في output_dir
+    """
+
+    def __init__(self, output_dir, workers=1, chunk_size=None, profile=None, verbose=True,
+                 archive=None, prefix=OUTPUT_DIR):
+        self.output_dir = None if archive is not None else output_dir
+        self.archive = archive
+        self.prefix = prefix
+        self.profile = profile
+        self.verbose = verbose
+        self.executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        self.max_in_flight = workers * 2
+        self.chunk_size = chunk_size or (64 if self.executor else 50)
+        self.items = []
+        self.metas = []
+        self.in_flight = deque()
+        self.done = 0
+
+    def submit(self, slug, product, meta, image=None):
+        """إضافة صفحة للكتابة، يعيد نتائج الدفعات التي اكتملت [(meta, error), ...]"""
+        self.items.append((slug, product, image))
+        self.metas.append(meta)
+        if len(self.items) >= self.chunk_size:
+            return self._dispatch()
+        return []
+
+    def _dispatch(self):
+        items, metas = self.items, self.metas
+        self.items, self.metas = [], []
+        if not items:
+            return []
+        if self.executor is None:
+            return self._collect(metas, render_pages(items, self.output_dir))
+
+        self.in_flight.append((self.executor.submit(render_pages, items, self.output_dir), metas))
+        finished = []
+        while len(self.in_flight) > self.max_in_flight:
+            future, done_metas = self.in_flight.popleft()
+            finished.extend(self._collect(done_metas, future.result()))
+        return finished
+
+    def _collect(self, metas, results):
+        self.done += len(results)
+        if self.verbose:
+            print(f"✅ تمت كتابة {self.done} صفحة...")
+        if self.profile is not None:
+            for slug, _, timings, _ in results:
+                self.profile.add_file(f"{slug}.html", timings)
+        if self.archive is not None:
+            for slug, _, _, files in results:
+                for suffix, data in files or ():
+                    self.archive.add_bytes(f"{self.prefix}/{slug}.html{suffix}", data)
+        return [(meta, error) for meta, (_, error, _, _) in zip(metas, results)]
+
+    def drain(self):
+        """انتظار كل الصفحات المعلّقة (قبل إعادة كتابة slug مكرر مثلاً)"""
+        finished = self._dispatch()
+        while self.in_flight:
+            future, metas = self.in_flight.popleft()
+            finished.extend(self._collect(metas, future.result()))
+        return finished
+
+    def close(self):
+        finished = self.drain()
+        if self.executor is not None:
+            self.executor.shutdown()
+        return finished
+
+
+def archive_prefix(output_dir, site_dir):
+    """مسار مجلد الصفحات داخل الأرشيف (products عادةً)"""
+    prefix = os.path.relpath(output_dir, site_dir).replace(os.sep, '/')
+    return OUTPUT_DIR if prefix.startswith('..') or prefix == '.' else prefix
+
+
+def index_catalog(products_file, site_dir, images, errors):
+    """
+    فهارس index.html: data/listing.js وأجزاء data/details/ و data/search.js و data/facets.js
+    بنفس منتجات وترتيب صفحات البناء (المنتجات بـ slug غير صالح لا تُفهرس)
+    كل منتج يُضاف للفهارس الثلاثة معاً أو لا يُضاف (صفوفها يجب أن تبقى متطابقة)،
+    والخطأ يُسجَّل في errors مثل أخطاء إنشاء الصفحات
+    يعيد (ListingIndexBuilder، عدد الملفات المكتوبة)
+    """
+    listing = ListingIndexBuilder(site_dir)
+    search = SearchIndexBuilder()
+    facets = FacetIndexBuilder()
+    for i, product in enumerate(iter_products(products_file), 1):
+        if not isinstance(product, dict) or slug_problem(product_slug(product, i)):
+            continue
+        try:
+            image = images.get(product.get('image_link'))
+        except Exception:
+            # مسجّل مسبقاً في مرور إنشاء الصفحات
+            image = None
+        try:
+            entries = (listing.entry(product, i, listing_image(image)), search.entry(product), facets.entry(product))
+        except Exception as e:
+            errors.append((product.get('id', product_slug(product, i)), f"فهرس الشبكة: {e}"))
+            continue
+        listing.append(entries[0])
+        search.append(entries[1])
+        facets.append(entries[2])
+
+    listing_written = listing.finish()
+    search_written = search.finish(site_dir)
+    facets_written = facets.finish(site_dir)
+    written = (listing_written + search_written + facets_written
+               + sync_precompressed(os.path.join(site_dir, LISTING_FILE), listing_written)
+               + sync_precompressed(os.path.join(site_dir, SEARCH_FILE), search_written)
+               + sync_precompressed(os.path.join(site_dir, FACETS_FILE), facets_written))
+    return listing, written
+
+
+def build(products_file=CATALOG_FILE, output_dir=OUTPUT_DIR, manifest_file=MANIFEST_FILE, force=False, workers=1,
+          site_dir='.', profile=None, verbose=True, image_mirror=IMAGE_MIRROR_DIR, image_cache=IMAGE_CACHE_FILE,
+          archive=None, lint=None, lint_file=LINT_FILE):
+    """
+    بناء تزايدي للصفحات، يعيد قاموس الإحصائيات وقائمة الأخطاء
+
+    الكتالوج يُقرأ منتجاً منتجاً (catalog.iter_products) ويمر عبر خط واحد:
+    مقارنة البصمة ← إنشاء/كتابة الصفحة، ومرور ثانٍ لفهرس الشبكة والبحث
+    (index_catalog) فقط إذا تغيّرت بصمات المنتجات أو ترتيبها،
+    فلا تُحفظ قائمة المنتجات ولا نصوص الصفحات (الوصف يُكتب إلى data/details/
+    جزءاً جزءاً). لكن ما يبقى لكل منتج ينمو خطياً مع الكتالوج: صف data/listing.js
+    وقوائم البحث والفلاتر وبصمات فحص التكرار وبصمة الصفحة وlastmod في manifest
+    (نحو 2 KB لكل منتج: أقصى RSS ‏62 MB لـ 10,000 منتج و249 MB لـ 100,000
+    في benchmarks/bench_build.py).
+
+    profile (اختياري): BuildProfile لمؤقتات المراحل وأبطأ الصفحات
+    (render و write في الوضع المتوازي هي مجموع زمن العمال)
+
+    image_mirror/image_cache: المرآة المحلية للصور وكاش أبعادها (image_meta.py)؛
+    بيانات الصورة جزء من بصمة الصفحة فتُعاد كتابتها عند تغيّر الصورة
+
+    archive (اختياري): مسار site.tar أو site.tar.gz أو site.zip؛ كل الصفحات
+    تُكتب في الأرشيف بدلاً من output_dir، مع ملفات الفهرس وخريطة الموقع
+    (تُحدَّث في site_dir كالعادة) والملفات الثابتة. انظر site_archive.py
+
+    lint: فحص الكتالوج (catalog_lint.py) بعد إنشاء الصفحات وكتابة تقريره في
+    lint_file؛ None = فقط عند تغيّر الـ slugs أو العناوين أو الأوصاف، True = دائماً،
+    False = بدون فحص
+    """
+    profile = profile or BuildProfile('generate_products', slowest=0)
+    site = SiteArchive(archive) if archive else None
+    if site is None:
+        os.makedirs(output_dir, exist_ok=True)
+        target = os.path.normpath(output_dir)
+    else:
+        target = f"archive:{archive}"
+        for name in STATIC_FILES:
+            site.add_path(os.path.join(site_dir, name), name)
+
+    with profile.stage('manifest'):
+        manifest = load_manifest(manifest_file)
+    old_pages = manifest.get('pages', {})
+    # تغيّر القالب أو تاريخ صلاحية السعر في السكيما يستلزم إعادة بناء كل الصفحات،
+    # وكذلك إذا كان البناء السابق لأرشيف أو لمجلد آخر (الصفحات على القرص لا تطابق الـ manifest)
+    rebuild_all = (force
+                   or manifest.get('template_version') != TEMPLATE_VERSION
+                   or manifest.get('price_anchor') != default_price_anchor().isoformat()
+                   or manifest.get('target', target) != target)
+
+    def classify(slug, digest):
+        # الأرشيف يحتوي دائماً كل الصفحات
+        if site is not None:
+            return 'created'
+        return classify_page(slug, digest, old_pages, output_dir, rebuild_all)
+
+    stats = {'total': 0, 'created': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0, 'duplicates': 0}
+    errors = []
+    seen = {}
+    new_pages = {}
+    duplicate_slugs = set()
+
+    def apply(results):
+        for (slug, kind, digest, product_id), error in results:
+            if error is None:
+                new_pages[slug] = digest
+                if kind != 'duplicate':
+                    stats[kind] += 1
+            else:
+                # لا نسجل الصفحة في الـ manifest حتى يُعاد بناؤها في التشغيل التالي
+                new_pages.pop(slug, None)
+                errors.append((product_id, error))
+
+    # النسخ المشتقة (products.js) فقط عند تغيّر الكتالوج
+    with profile.stage('views'):
+        stats['views'], views_stamp = sync_views(products_file, site_dir, manifest.get('views'))
+
+    # مدخلات الفهارس (بصمة كل منتج مفهرس مع رقمه) ومدخلات الفحص (id و slug والعنوان والوصف)
+    # تُجمع أثناء المرور حتى لا تُعاد هاتان المرحلتان على الكتالوج كاملاً إلا عند تغيّرها
+    index_key = hashlib.sha256(INDEX_VERSION.encode('utf-8'))
+    lint_key = hashlib.sha256(LINT_VERSION.encode('utf-8'))
+
+    writer = PageWriter(output_dir, workers, profile=profile, verbose=verbose,
+                        archive=site, prefix=archive_prefix(output_dir, site_dir))
+    images = ImageMetaCache(image_cache, image_mirror, site_dir)
+
+    # slugs كانت مكررة في البناء السابق: نؤجل قرارها لنهاية الكتالوج حتى لا
+    # نكتب صفحة المنتج الأول ثم نكتب فوقها صفحة المنتج الأخير في كل تشغيل
+    old_duplicates = set(manifest.get('duplicate_slugs', []))
+    deferred = {}
+
+    for i, product in enumerate(profile.timed_iter('catalog', iter_products(products_file)), 1):
+        stats['total'] += 1
+        if not isinstance(product, dict):
+            lint_key.update(f"{dumps(product)}\n".encode('utf-8'))
+            errors.append((i, f"المنتج {i} ليس كائن JSON"))
+            continue
+        slug = product_slug(product, i)
+        lint_key.update(f"{dumps([product.get('id'), slug, product.get('title'), product.get('description')])}\n"
+                        .encode('utf-8'))
+        problem = slug_problem(slug)
+        if problem:
+            # صفحة مكتوبة يدوياً (products/index.html) أو مسار يخرج من output_dir (../x، a/b، .x)
+            errors.append((product.get('id', slug), f"slug {'محجوز' if problem == 'reserved' else 'غير صالح'}: {slug}"))
+            continue
+
+        t = time.perf_counter()
+        try:
+            image = images.get(product.get('image_link'))
+        except Exception as e:
+            errors.append((product.get('id', slug), f"بيانات الصورة: {e}"))
+            image = None
+        now = time.perf_counter()
+        profile.add('images', now - t)
+
+        digest = product_hash(product if image is None else {**product, 'image_meta': image})
+        index_key.update(f"{i}:{digest}\n".encode('utf-8'))
+        profile.add('hash', time.perf_counter() - now)
+
+        if slug in deferred:
+            stats['duplicates'] += 1
+            duplicate_slugs.add(slug)
+            deferred[slug] = (product, image)
+            seen[slug] = digest
+            continue
+        if slug in seen:
+            # slug مكرر: يفوز المنتج الأخير (كما كان يحدث عند الكتابة فوق الملف)
+            stats['duplicates'] += 1
+            duplicate_slugs.add(slug)
+            if seen[slug] == digest:
+                continue
+            # انتظار الكتابة السابقة لنفس الملف حتى يبقى الترتيب صحيحاً في الوضع المتوازي
+            apply(writer.drain())
+            kind = 'duplicate'
+        elif slug in old_duplicates:
+            deferred[slug] = (product, image)
+            seen[slug] = digest
+            continue
+        else:
+            kind = classify(slug, digest)
+        seen[slug] = digest
+
+        if kind is None:
+            new_pages[slug] = digest
+            stats['unchanged'] += 1
+        else:
+            apply(writer.submit(slug, product, (slug, kind, digest, product.get('id', slug)), image))
+
+    # المنتج الأخير لكل slug مؤجل
+    for slug, (product, image) in deferred.items():
+        digest = seen[slug]
+        kind = classify(slug, digest)
+        if kind is None:
+            new_pages[slug] = digest
+            stats['unchanged'] += 1
+        else:
+            apply(writer.submit(slug, product, (slug, kind, digest, product.get('id', slug)), image))
+
+    with profile.stage('wait'):
+        apply(writer.close())
+
+    # وضع الأرشيف لا يلمس output_dir: الصفحات المحذوفة من الكتالوج تبقى في الـ manifest
+    # حتى يحذفها أول بناء تالٍ للمجلد
+    stale_pages = {}
+    with profile.stage('delete'):
+        for slug in old_pages:
+            if slug in seen:
+                continue
+            if site is not None:
+                stale_pages[slug] = old_pages[slug]
+                continue
+            remove_with_siblings(os.path.join(output_dir, f"{slug}.html"))
+            stats['deleted'] += 1
+
+    # الفهارس وصفحات الشبكة (index.html و page/<n>.html) تُبنى من الكتالوج كاملاً:
+    # فقط إذا تغيّرت مدخلاتها أو حُذف أحد ملفاتها، وعندها تُكتب الصفحات التي تغيّرت منتجاتها فقط
+    index_key = index_key.hexdigest()[:16]
+    listing_pages = manifest.get('listing_pages') or {}
+    index_outputs = [LISTING_FILE, SEARCH_FILE, FACETS_FILE, *listing_pages]
+    indexed = (force or manifest.get('indexes') != index_key or not listing_pages
+               or not all(os.path.exists(os.path.join(site_dir, *name.split('/'))) for name in index_outputs))
+    if indexed:
+        with profile.stage('index'):
+            listing, stats['listing_files'] = index_catalog(products_file, site_dir, images, errors)
+        with profile.stage('listing_pages'):
+            listing_pages, stats['listing_pages'] = write_listing_pages(
+                listing.rows, list(listing.prefix_ids), site_dir, listing_pages, force)
+    else:
+        stats['listing_files'] = stats['listing_pages'] = 0
+    # page/<n>.html بالترتيب (الـ manifest محفوظ بمفاتيح مرتبة أبجدياً: page/10.html قبل page/2.html)
+    paged = [name for name in sorted(listing_pages, key=lambda n: (len(n), n)) if name.startswith(f"{PAGES_DIR}/")]
+    with profile.stage('assets'):
+        stats['asset_files'] = write_assets(site_dir)
+        # نسخ data/listing.js و data/search.js و data/facets.js و products.js بأسماء مبنية على المحتوى
+        # ومراجعها في index.html و page/، ثم sw.js (نسخته تتغير مع أي صفحة منتج أو القالب)
+        pages_digest = hashlib.sha256(json.dumps(
+            [TEMPLATE_VERSION, default_price_anchor().isoformat(), sorted(new_pages.items()),
+             LISTING_VERSION, sorted(listing_pages.items())],
+            ensure_ascii=False).encode('utf-8')).hexdigest()
+        # مراجع page/ تتغير فقط مع ملفات الفهرس: بدون قراءة مئات الصفحات إذا لم يُعد بناؤه
+        _, written = sync_site(site_dir, pages_digest, [f"{ASSETS_DIR}/{PRODUCT_CSS_FILE}"], paged, indexed)
+        stats['asset_files'] += written
+    with profile.stage('images'):
+        images.save()
+    stats['image_hits'], stats['image_misses'] = images.hits, images.misses
+
+    # lastmod في خريطة الموقع يتغير فقط مع تغيّر محتوى الصفحة (بصمة المنتج أو القالب)،
+    # لا مع --force ولا مع تجديد تاريخ صلاحية السعر الشهري
+    t = time.perf_counter()
+    today = build_date().isoformat()
+    old_lastmod = manifest.get('lastmod', {})
+    template_changed = manifest.get('template_version') != TEMPLATE_VERSION
+    lastmod = {}
+    for slug in sorted(new_pages):
+        if slug in old_lastmod and old_pages.get(slug) == new_pages[slug] and not template_changed:
+            lastmod[slug] = old_lastmod[slug]
+        else:
+            lastmod[slug] = today
+    # صفحات الترقيم بنفس القاعدة: lastmod يتغير فقط مع بصمة منتجات الصفحة
+    old_listing_pages = manifest.get('listing_pages') or {}
+    old_listing_lastmod = manifest.get('listing_lastmod', {})
+    listing_lastmod = {}
+    for name, digest in listing_pages.items():
+        if name in old_listing_lastmod and old_listing_pages.get(name) == digest:
+            listing_lastmod[name] = old_listing_lastmod[name]
+        else:
+            listing_lastmod[name] = today
+    sitemap_pages = list(lastmod.items())
+    sitemap_listing = [(name, listing_lastmod[name]) for name in paged]
+    sitemap_key = hashlib.sha256(dumps([SITEMAP_VERSION, sitemap_pages, sitemap_listing])
+                                 .encode('utf-8')).hexdigest()[:16]
+    if force or manifest.get('sitemap') != sitemap_key or not os.path.exists(os.path.join(site_dir, SITEMAP_FILE)):
+        stats['sitemap_files'] = write_sitemaps(sitemap_pages, site_dir, listing_pages=sitemap_listing)
+    else:
+        stats['sitemap_files'] = 0
+    profile.add('sitemap', time.perf_counter() - t)
+
+    # تعارض الـ slugs والمنتجات شبه المكررة: تقرير فقط (الـ slugs المحجوزة وغير الصالحة
+    # مرفوضة أعلاه)، فلا يُعاد الفحص إلا إذا تغيّرت الـ slugs أو العناوين أو الأوصاف
+    lint_key = lint_key.hexdigest()[:16]
+    stats['lint'] = None
+    if lint or (lint is None and (manifest.get('lint') != lint_key or not os.path.exists(lint_file))):
+        with profile.stage('lint'):
+            report = lint_catalog(products_file)
+            write_report(report, lint_file)
+        stats['lint'] = report['summary']
+        errors.extend((error['id'] or error['position'], f"فحص الكتالوج: {error['error']}")
+                      for error in report['errors'])
+        if verbose:
+            print_report(report)
+    elif lint is False:
+        # بدون فحص: نحتفظ ببصمة آخر فحص حتى يُعاد في البناء التالي إذا تغيّر شيء
+        lint_key = manifest.get('lint')
+
+    if site is not None:
+        with profile.stage('archive'):
+            for name in (*GENERATED_FILES, *REWRITTEN_PAGES):
+                site.add_path(os.path.join(site_dir, name), name)
+            stats['archive_files'] = site.close()
+
+    with profile.stage('manifest'):
+        save_manifest(manifest_file, {
+            'version': MANIFEST_VERSION,
+            'template_version': TEMPLATE_VERSION,
+            'price_anchor': default_price_anchor().isoformat(),
+            'pages': {**stale_pages, **new_pages},
+            'duplicate_slugs': sorted(duplicate_slugs),
+            'views': views_stamp,
+            'lastmod': lastmod,
+            'listing_pages': listing_pages,
+            'listing_lastmod': listing_lastmod,
+            'indexes': index_key,
+            'lint': lint_key,
+            'sitemap': sitemap_key,
+            'target': target,
+        })
+
+    stats['peak_memory_mb'] = peak_memory_mb()
+    return stats, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='إنشاء صفحات المنتجات')
+    parser.add_argument('--catalog', default=CATALOG_FILE, help='ملف بيانات المنتجات (JSON array أو JSON Lines)')
+    parser.add_argument('--output', default=OUTPUT_DIR, help='مجلد الصفحات')
+    parser.add_argument('--site-dir', default='.', help='جذر الموقع (لملفات data/ الخاصة بـ index.html)')
+    parser.add_argument('--manifest', default=MANIFEST_FILE, help='ملف حالة البناء التزايدي')
+    parser.add_argument('--force', action='store_true', help='إعادة إنشاء جميع الصفحات')
+    parser.add_argument('--archive', metavar='FILE',
+                        help='كتابة الموقع كاملاً في أرشيف واحد (.tar أو .tar.gz أو .zip) بدلاً من مجلد الصفحات')
+    parser.add_argument('--lint', action=argparse.BooleanOptionalAction, default=None,
+                        help='فحص الكتالوج (الافتراضي: فقط عند تغيّر الـ slugs أو العناوين أو الأوصاف)، --no-lint لتخطيه')
+    parser.add_argument('--lint-report', default=LINT_FILE, help='ملف تقرير فحص الكتالوج JSON')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='عدد العمليات المتوازية لإنشاء الصفحات (0 = عدد الأنوية)')
+    parser.add_argument('--image-mirror', default=IMAGE_MIRROR_DIR,
+                        help='مرآة محلية للصور مرتبة حسب الرابط (لأبعاد الصور و srcset)')
+    parser.add_argument('--image-cache', default=IMAGE_CACHE_FILE, help='كاش بيانات الصور')
+    parser.add_argument('--profile', action='store_true',
+                        help='مؤقتات المراحل وأبطأ الصفحات مع ملخص مختصر بدلاً من رسائل التقدم')
+    parser.add_argument('--metrics', default=METRICS_FILE, help='ملف المقاييس JSON (مع --profile)')
+    parser.add_argument('--slowest', type=int, default=10, help='عدد أبطأ الصفحات في التقرير (مع --profile)')
+    parser.add_argument('--cprofile', metavar='FILE',
+                        help='تشغيل البناء تحت cProfile وحفظ النتيجة في FILE (العملية الرئيسية فقط)')
+    args = parser.parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+
+    if args.profile:
+        profile = BuildProfile('generate_products', args.slowest)
+        stats, errors = run_profiled(
+            lambda: build(args.catalog, args.output, args.manifest, args.force, workers, args.site_dir,
+                          profile=profile, verbose=False, image_mirror=args.image_mirror, image_cache=args.image_cache,
+                          archive=args.archive, lint=args.lint, lint_file=args.lint_report),
+            args.cprofile)
+        metrics = profile.write(args.metrics, stats=stats, errors=len(errors), workers=workers)
+        profile.print_summary(metrics)
+        print(f"📊 {stats['total']} منتج: {stats['created']} جديدة، {stats['updated']} محدّثة، "
+              f"{stats['unchanged']} بدون تغيير، {stats['deleted']} محذوفة، {len(errors)} أخطاء → {args.metrics}")
+        return
+
+    print("="*70)
+    print("🚀 سكريبت إنشاء صفحات المنتجات المحسّن")
+    print("="*70)
+
+    print(f"\n🔄 جاري مقارنة {args.catalog} بالبناء السابق...")
+    stats, errors = run_profiled(
+        lambda: build(args.catalog, args.output, args.manifest, args.force, workers, args.site_dir,
+                      image_mirror=args.image_mirror, image_cache=args.image_cache, archive=args.archive,
+                      lint=args.lint, lint_file=args.lint_report),
+        args.cprofile)
+
+    print(f"\n{'='*70}")
+    print(f"✅ انتهى! {stats['total']} منتج في الكتالوج")
+    print(f"   🆕 صفحات جديدة: {stats['created']}")
+    print(f"   🔄 صفحات محدّثة: {stats['updated']}")
+    print(f"   ⏸️ بدون تغيير: {stats['unchanged']}")
+    print(f"   🗑️ صفحات محذوفة: {stats['deleted']}")
+    if stats['duplicates']:
+        print(f"   ⚠️ منتجات بـ slug مكرر (آخر منتج يفوز): {stats['duplicates']}")
+    print(f"   📇 ملفات فهرس الشبكة المحدّثة (data/): {stats['listing_files']}")
+    print(f"   📄 ملفات صفحات الشبكة المحدّثة (index.html و {PAGES_DIR}/): {stats['listing_pages']}")
+    print(f"   🎨 ملفات assets/ و sw.js المحدّثة: {stats['asset_files']}")
+    print(f"   🗺️ ملفات خريطة الموقع المحدّثة: {stats['sitemap_files']}")
+    if stats['image_hits'] or stats['image_misses']:
+        print(f"   🖼️ بيانات الصور: {stats['image_hits']} من الكاش، {stats['image_misses']} محسوبة")
+    print(f"   🗂️ النسخ المشتقة من الكتالوج المحدّثة: {stats['views']}")
+    if stats['lint']:
+        print(f"   🔎 فحص الكتالوج: {stats['lint'].get('duplicate', 0)} slug مكرر، "
+              f"{stats['lint']['title_groups'] + stats['lint']['description_groups']} مجموعة شبه مكررة "
+              f"→ {args.lint_report}")
+    if args.archive:
+        print(f"   📦 ملفات في الأرشيف: {stats['archive_files']}")
+    print(f"   🧠 أقصى استخدام للذاكرة: {stats['peak_memory_mb']:.1f} MB")
+
+    if errors:
+        print(f"\n⚠️ {len(errors)} خطأ:")
+        for error_id, error_msg in errors[:5]:
+            print(f"   - منتج {error_id}: {error_msg}")
+
+    print(f"\n{'='*70}")
+    if args.archive:
+        print(f"📦 الموقع كاملاً في: {args.archive}")
+        print(f"🌐 للاستخراج: python site_archive.py sync {args.archive} --target <جذر الموقع>")
+    else:
+        print(f"📁 الصفحات موجودة في مجلد: {args.output}/")
+        print("🌐 يمكنك الآن رفع الملفات على GitHub")
+    print("="*70)
+
+
+if __name__ == '__main__':
+    main()
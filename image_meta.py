@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+بيانات الصور (الأبعاد، placeholder، srcset) مع كاش دائم - Iraq-Store
+
+الصور نفسها على CDN خارجي، لذلك تُقرأ من نسخة محلية (mirror) مرتبة حسب
+الرابط: https://media.taager.com/360x360/x.png ← image-mirror/media.taager.com/360x360/x.png
+(نفس ترتيب wget --mirror). الصور غير الموجودة في المرآة تُترك بدون بيانات.
+
+لكل صورة يُحسب مرة واحدة فقط:
+- width/height من رأس الملف (PNG و JPEG و GIF و WebP بدون مكتبات إضافية)
+- مع Pillow (اختياري): placeholder صغير مموّه (data URI) ولون متوسط للشبكة،
+  ونسخ مصغّرة في img/ تُستخدم في srcset
+
+الكاش (.image-cache.json) مفتاحه الرابط ويحفظ بصمة المحتوى وحجم الملف ووقت
+تعديله: إذا لم يتغير stat لا يُقرأ الملف أصلاً، وإذا تغيّر بدون تغيّر البصمة
+لا يُعاد الحساب.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import struct
+from urllib.parse import unquote, urlsplit
+
+from build_io import write_if_changed
+from page_template import escape_html
+
+try:
+    from PIL import Image, ImageFilter
+except ImportError:  # اختياري: بدونه تُحسب الأبعاد فقط
+    Image = None
+
+IMAGE_MIRROR_DIR = 'image-mirror'
+IMAGE_CACHE_FILE = '.image-cache.json'
+VARIANTS_DIR = 'img'
+VARIANT_WIDTHS = (180,)
+LQIP_WIDTH = 16
+CACHE_VERSION = 1
+
+# عرض الصورة في صفحة المنتج (GRID_IMAGE_SIZES في index.html للشبكة)
+PAGE_SIZES = '(min-width: 768px) 500px, 100vw'
+
+VARIANT_NAME_RE = re.compile(r'^[0-9a-f]{16}-\d+\.jpg$')
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def mirror_path(url, mirror_dir=IMAGE_MIRROR_DIR):
+    """مسار الصورة في المرآة المحلية"""
+    parts = urlsplit(url)
+    return os.path.join(mirror_dir, parts.netloc, *unquote(parts.path).lstrip('/').split('/'))
+
+
+def image_size(data):
+    """(العرض، الارتفاع) من رأس الملف، أو None إذا كانت الصيغة غير معروفة"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR':
+        return struct.unpack('>II', data[16:24])
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', data[6:10])
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        chunk = data[12:16]
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', data[26:30])
+            return width & 0x3fff, height & 0x3fff
+        if chunk == b'VP8L':
+            bits = int.from_bytes(data[21:25], 'little')
+            return (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+        if chunk == b'VP8X':
+            return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+        return None
+    if data[:2] == b'\xff\xd8':
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker == 0xFF:
+                i += 1
+            elif marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+                i += 2
+            elif marker in JPEG_SOF_MARKERS:
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            else:
+                i += 2 + int.from_bytes(data[i + 2:i + 4], 'big')
+    return None
+
+
+def analyze_image(data, digest, site_dir='.'):
+    """حساب بيانات صورة واحدة (وكتابة النسخ المصغّرة إن توفرت Pillow)"""
+    size = image_size(data)
+    img = None
+    if Image is not None:
+        try:
+            img = Image.open(io.BytesIO(data))
+            img.load()
+            size = img.size
+        except Exception:
+            img = None
+    if not size:
+        return None
+
+    width, height = size
+    meta = {'width': width, 'height': height}
+    if img is None:
+        return meta
+
+    img = img.convert('RGB')
+    # لون متوسط للشبكة و placeholder مموّه صغير لصفحة المنتج
+    meta['color'] = '#%02x%02x%02x' % img.resize((1, 1), Image.BOX).getpixel((0, 0))
+    thumb = img.resize((LQIP_WIDTH, max(1, round(height * LQIP_WIDTH / width))), Image.BOX)
+    thumb = thumb.filter(ImageFilter.GaussianBlur(1))
+    buf = io.BytesIO()
+    thumb.save(buf, 'JPEG', quality=40, optimize=True)
+    meta['lqip'] = 'data:image/jpeg;base64,' + base64.b64encode(buf.getvalue()).decode('ascii')
+
+    # نسخ مصغّرة باسم مبني على بصمة المحتوى
+    variants = []
+    for variant_width in VARIANT_WIDTHS:
+        if variant_width >= width:
+            continue
+        variant_height = round(height * variant_width / width)
+        path = f"{VARIANTS_DIR}/{digest[:16]}-{variant_width}.jpg"
+        target = os.path.join(site_dir, path)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            buf = io.BytesIO()
+            img.resize((variant_width, variant_height), Image.LANCZOS).save(buf, 'JPEG', quality=80, optimize=True)
+            with open(target, 'wb') as f:
+                f.write(buf.getvalue())
+        variants.append([variant_width, path])
+    if variants:
+        meta['variants'] = variants
+    return meta
+
+
+class ImageMetaCache:
+    """
+    كاش بيانات الصور: get(url) يعيد القاموس أو None
+    save() يحفظ فقط الصور المستخدمة في هذا البناء ويحذف النسخ المصغّرة غير المستخدمة
+    """
+
+    def __init__(self, cache_file=IMAGE_CACHE_FILE, mirror_dir=IMAGE_MIRROR_DIR, site_dir='.'):
+        self.cache_file = cache_file
+        self.mirror_dir = mirror_dir
+        self.site_dir = site_dir
+        self.entries = {}
+        self.used = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                self.entries = data.get('images', {})
+        except (OSError, ValueError):
+            pass
+
+    def get(self, url):
+        if not url:
+            return None
+        if url in self.used:
+            return self.used[url]['meta']
+        try:
+            st = os.stat(mirror_path(url, self.mirror_dir))
+        except OSError:
+            return None
+
+        entry = self.entries.get(url)
+        if (entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+                and self._variants_exist(entry['meta'])):
+            self.hits += 1
+            self.used[url] = entry
+            return entry['meta']
+
+        with open(mirror_path(url, self.mirror_dir), 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry and entry['hash'] == digest and self._variants_exist(entry['meta']):
+            self.hits += 1
+            meta = entry['meta']
+        else:
+            self.misses += 1
+            meta = analyze_image(data, digest, self.site_dir)
+        self.used[url] = {'hash': digest, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'meta': meta}
+        return meta
+
+    def _variants_exist(self, meta):
+        return all(os.path.exists(os.path.join(self.site_dir, path)) for _, path in (meta or {}).get('variants', ()))
+
+    def save(self):
+        """حفظ الكاش إذا تغيّر، يعيد True عند الكتابة"""
+        referenced = {path for entry in self.used.values() for _, path in (entry['meta'] or {}).get('variants', ())}
+        variants_dir = os.path.join(self.site_dir, VARIANTS_DIR)
+        if os.path.isdir(variants_dir):
+            for name in os.listdir(variants_dir):
+                if VARIANT_NAME_RE.match(name) and f"{VARIANTS_DIR}/{name}" not in referenced:
+                    os.remove(os.path.join(variants_dir, name))
+
+        text = json.dumps({'version': CACHE_VERSION, 'images': dict(sorted(self.used.items()))},
+                          ensure_ascii=False, separators=(',', ':'))
+        return write_if_changed(self.cache_file, text)
+
+
+def listing_image(meta):
+    """بيانات الصورة في صف data/listing.js: [width, height, color, variants] بدون القيم الفارغة في آخره"""
+    if not meta:
+        return None
+    row = [meta['width'], meta['height'], meta.get('color'), meta.get('variants')]
+    while row[-1] is None:
+        row.pop()
+    return row
+
+
+def image_attributes(meta, image_url, base='', sizes=PAGE_SIZES):
+    """
+    خصائص <img> الإضافية: width و height و srcset و sizes وخلفية placeholder
+    base: المسار من الصفحة إلى جذر الموقع ('../' لصفحات products/)
+    """
+    if not meta:
+        return ''
+    attrs = [f' width="{meta["width"]}" height="{meta["height"]}"']
+    variants = meta.get('variants')
+    if variants:
+        srcset = ', '.join(f"{base}{path} {width}w" for width, path in variants)
+        srcset += f", {image_url} {meta['width']}w"
+        attrs.append(f' srcset="{escape_html(srcset)}" sizes="{sizes}"')
+    if meta.get('lqip'):
+        attrs.append(f' style="background:{meta.get("color", "")} url({meta["lqip"]}) center/cover no-repeat"')
+    return ''.join(attrs)
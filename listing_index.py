@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+فهرس الشبكة المختصر + أجزاء التفاصيل (detail shards) - Iraq-Store
+
+بدلاً من تحميل products.js كاملاً (كل الأوصاف) قبل عرض أول صفحة، يكتب
+البناء ملفين:
+
+- data/listing.js: فقط الحقول التي تعرضها الشبكة في index.html
+  (id, title, price, sale_price, image_link, slug) بصيغة صفوف مضغوطة
+- data/details/<n>.json: باقي الحقول (الوصف وغيره) مقسّمة إلى أجزاء
+  ثابتة الحجم تُجلب عند الحاجة فقط
+
+ضغط الصفوف:
+- روابط الصور تُخزَّن كـ (رقم البادئة، اللاحقة) لأن أغلبها يبدأ بنفس المسار
+- slug يُحذف (null) إذا كان يساوي slugify(title) بنفس خوارزمية المتصفح
+- عنصر سابع اختياري: أبعاد الصورة ولونها ونسخها المصغّرة (image_meta.py)
+
+الحجم مع كتالوج المتجر الحالي: بيانات أول عرض (data/listing.js مع فهرسي البحث
+والفلاتر) نحو 111 KB (40 KB مضغوطة gzip) بدلاً من 550 KB لـ products.js
+(58 KB مضغوطة)، أي أصغر بنحو 5 أضعاف قبل الضغط لا بمرتبة عشرية كاملة؛
+أغلب الفرق في الأوصاف وهي تنضغط جيداً.
+"""
+
+import hashlib
+import os
+import unicodedata
+
+from build_io import dumps, write_chunks_if_changed, write_if_changed
+
+LISTING_FILE = os.path.join('data', 'listing.js')
+DETAILS_DIR = os.path.join('data', 'details')
+SHARD_SIZE = 100
+LISTING_FIELDS = ('id', 'title', 'price', 'sale_price', 'image_link', 'slug')
+
+# نفس مجموعة \s في JavaScript حتى يطابق slugify هنا نسخة المتصفح
+JS_WHITESPACE = set('\t\n\v\f\r \u00a0\u1680\u2028\u2029\u202f\u205f\u3000\ufeff'
+                    + ''.join(chr(c) for c in range(0x2000, 0x200b)))
+
+
+def slugify(title):
+    """
+    نسخة بايثون من slugify في index.html:
+    title.replace(/[^\\p{L}\\p{N}\\s-]/gu, '').trim().replace(/[\\s_-]+/g, '-').replace(/^-+|-+$/g, '')
+    """
+    kept = ''.join(c for c in title
+                   if unicodedata.category(c)[0] in 'LN' or c in JS_WHITESPACE or c == '-')
+    parts = []
+    word = []
+    for c in kept.strip(''.join(JS_WHITESPACE)):
+        if c in JS_WHITESPACE or c == '-':
+            if word:
+                parts.append(''.join(word))
+                word = []
+        else:
+            word.append(c)
+    if word:
+        parts.append(''.join(word))
+    return '-'.join(parts)
+
+
+def image_prefix(url):
+    """كل ما قبل آخر / في الرابط"""
+    return url[:url.rfind('/') + 1]
+
+
+class ListingIndexBuilder:
+    """
+    بناء الفهرس تدريجياً أثناء قراءة الكتالوج:
+    الصفوف المختصرة تبقى في الذاكرة، وكل جزء تفاصيل يُكتب فور امتلائه
+    """
+
+    def __init__(self, site_dir='.', shard_size=SHARD_SIZE):
+        self.site_dir = site_dir
+        self.details_dir = os.path.join(site_dir, DETAILS_DIR)
+        self.shard_size = shard_size
+        self.rows = []
+        self.prefix_ids = {}
+        self.shard_hashes = []
+        self.pending = []
+        self.written = 0
+
+    def add(self, product, position, image_meta=None):
+        """
+        إضافة منتج (position يبدأ من 1 بنفس ترقيم generate_products.py)
+        image_meta: [width, height, color, variants] من image_meta.listing_image (يُضاف كعنصر سابع)
+        """
+        self.append(self.entry(product, position, image_meta))
+
+    def entry(self, product, position, image_meta=None):
+        """
+        صف المنتج بدون تعديل الفهرس (يرفع الخطأ لمنتج لا يمكن فهرسته)
+        حتى يضيف generate_products.py المنتج للفهارس الثلاثة معاً أو لا يضيفه
+        """
+        image = product.get('image_link')
+        image_ref = (image_prefix(image), image) if image else None
+
+        title = product.get('title') or ''
+        # نفس الاسم الافتراضي الذي يستخدمه generate_products.py عند غياب slug
+        slug = product.get('slug', f'product-{position}')
+        row = [
+            product.get('id'),
+            title,
+            product.get('price'),
+            product.get('sale_price'),
+            image_ref,
+            None if slug == slugify(title) else slug,
+        ]
+        if image_meta:
+            row.append(image_meta)
+        details = {k: v for k, v in product.items() if k not in LISTING_FIELDS}
+        # يُتحقق من الصف هنا (dumps) حتى لا تفشل append
+        dumps([row, details])
+        return row, details
+
+    def append(self, entry):
+        """إضافة صف من entry()"""
+        row, details = entry
+        if row[4]:
+            prefix, image = row[4]
+            prefix_id = self.prefix_ids.setdefault(prefix, len(self.prefix_ids))
+            row[4] = [prefix_id, image[len(prefix):]]
+        # الصف يُحفظ JSON جاهزاً بترميز UTF-8 لأنه أصغر بكثير في الذاكرة من قائمة كائنات
+        self.rows.append(dumps(row).encode('utf-8'))
+
+        self.pending.append(details)
+        if len(self.pending) == self.shard_size:
+            self.flush_shard()
+
+    def flush_shard(self):
+        """كتابة الجزء الحالي (إن تغيّر) وتسجيل بصمته"""
+        text = dumps(self.pending)
+        path = os.path.join(self.details_dir, f"{len(self.shard_hashes)}.json")
+        self.written += write_if_changed(path, text)
+        # بصمة كل جزء تُلحق برابط الجلب (?v=) حتى لا يُستخدم جزء قديم من الكاش
+        self.shard_hashes.append(text_hash(text))
+        self.pending = []
+
+    def iter_listing_js(self):
+        """محتوى data/listing.js على أجزاء bytes (بدون بناء النص كاملاً في الذاكرة)"""
+        header = dumps({
+            'shard_size': self.shard_size,
+            'shards': self.shard_hashes,
+            'image_prefixes': list(self.prefix_ids),
+        })
+        yield ("// فهرس المنتجات المختصر للشبكة - مولّد تلقائياً من generate_products.py\n"
+               f"const productIndex = {header[:-1]},\"rows\":[").encode('utf-8')
+        for n, row in enumerate(self.rows):
+            yield b',' + row if n else row
+        yield b']};\n'
+
+    def finish(self):
+        """كتابة آخر جزء و data/listing.js وحذف الأجزاء الزائدة، يعيد عدد الملفات المكتوبة"""
+        if self.pending:
+            self.flush_shard()
+
+        self.written += write_chunks_if_changed(os.path.join(self.site_dir, LISTING_FILE),
+                                                self.iter_listing_js())
+
+        # حذف الأجزاء الزائدة إذا صغر الكتالوج
+        if os.path.isdir(self.details_dir):
+            for name in os.listdir(self.details_dir):
+                stem, ext = os.path.splitext(name)
+                if ext == '.json' and stem.isdigit() and int(stem) >= len(self.shard_hashes):
+                    os.remove(os.path.join(self.details_dir, name))
+
+        return self.written
+
+
+def text_hash(text):
+    """بصمة قصيرة للمحتوى"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:10]
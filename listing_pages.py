@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+صفحات الشبكة المكتوبة مسبقاً (index.html و page/2.html ...) - Iraq-Store
+
+كانت index.html تبني البطاقات كلها في المتصفح بعد تحميل data/listing.js،
+فلا يظهر أي منتج قبل انتهاء ذلك، ومحركات البحث ترى شبكة فارغة. الآن يكتب
+البناء كل صفحة ترقيم (PRODUCTS_PER_PAGE منتج، نفس productsPerPage في
+المتصفح) من templates/listing.html مع البطاقات جاهزة من
+templates/listing-card.html، وسكريبت الصفحة يربط البحث والترتيب والترقيم
+بها ولا يعيد رسم البطاقات إلا عند استخدامها.
+
+ثمن ذلك حجم الصفحة نفسها: index.html نحو 105 KB منها نحو 72 KB للبطاقات
+الـ 24 (نحو 15 KB مضغوطة gzip)، مقابل 17 KB قبل الرسم المسبق.
+
+البناء تزايدي: بصمة كل صفحة (صفوف منتجاتها كما في data/listing.js، ورقمها
+وعدد الصفحات، ونسخة القالب) تُحفظ في .build-manifest.json، فتغيّر سعر منتج
+يعيد كتابة صفحته فقط.
+
+كل الصفحات تشير إلى data/*.js بأسمائها الثابتة ثم يحدّثها service_worker.py
+إلى الأسماء المبنية على المحتوى كما في السابق (ويكتب نسخ page/ المضغوطة بعدها)،
+فتغيّر الفهرس يعيد كتابة مراجع كل الصفحات لا بطاقاتها.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from urllib.parse import quote
+
+import page_template
+from build_io import dumps, remove_with_siblings, write_page
+from listing_index import slugify
+from page_template import escape_html, load_template
+from product_schema import discount_percent
+
+PRODUCTS_PER_PAGE = 24
+PAGES_DIR = 'page'
+SITE_URL = 'https://sherow1982.github.io/Iraq-Store/'
+WHATSAPP_NUMBER = '201110760081'
+# الأحرف التي لا يرمّزها encodeURIComponent (غير الحروف والأرقام و -_.~)
+URI_COMPONENT_SAFE = "!'()*"
+# نفس GRID_IMAGE_SIZES في templates/listing.html
+GRID_IMAGE_SIZES = '(min-width: 992px) 25vw, (min-width: 768px) 33vw, (min-width: 576px) 50vw, 100vw'
+
+LISTING_TEMPLATE = load_template('listing.html')
+CARD_TEMPLATE = load_template('listing-card.html')
+
+
+def page_name(page):
+    """مسار صفحة الترقيم نسبةً لجذر الموقع"""
+    return 'index.html' if page == 1 else f"{PAGES_DIR}/{page}.html"
+
+
+def decode_row(row, image_prefixes, index):
+    """صف data/listing.js رقم index ← حقول البطاقة (نفس decodeProductIndex في templates/listing.html)"""
+    product = {
+        'index': index,
+        'id': row[0],
+        'title': row[1],
+        'price': row[2],
+        'sale_price': row[3],
+        'slug': slugify(row[1]) if row[5] is None else row[5],
+        'image_link': image_prefixes[row[4][0]] + row[4][1] if row[4] else '',
+    }
+    if len(row) > 6 and row[6]:
+        product['image'] = row[6]
+    return product
+
+
+def format_price(price):
+    """نفس formatPrice في templates/listing.html"""
+    return f"{price or 0:,}"
+
+
+def grid_image_attributes(product, base):
+    """width/height و srcset ولون الخلفية لصورة البطاقة (نفس imageAttributes في templates/listing.html)"""
+    image = product.get('image')
+    if not image:
+        return ''
+    width, height, color, variants = (image + [None, None])[:4]
+    attrs = f' width="{width}" height="{height}"'
+    if variants:
+        srcset = ', '.join(f"{base}{path} {variant_width}w" for variant_width, path in variants)
+        srcset += f", {product['image_link']} {width}w"
+        attrs += f' srcset="{escape_html(srcset)}" sizes="{GRID_IMAGE_SIZES}"'
+    if color:
+        attrs += f' style="background-color: {escape_html(color)}"'
+    return attrs
+
+
+def render_card(product, base=''):
+    """بطاقة منتج واحدة بنفس ترميز displayProducts في المتصفح"""
+    message = (f"مرحباً، أريد طلب المنتج التالي:\n\n📦 {product['title']}\n"
+               f"💰 السعر: {format_price(product['sale_price'])} د.ع")
+    return CARD_TEMPLATE.render({
+        'row': product['index'],
+        'url': f"{base}products/{product['slug']}.html",
+        'title': product['title'],
+        'image_url': product['image_link'],
+        'image_attrs': grid_image_attributes(product, base),
+        'price': product['price'] or 0,
+        'price_text': format_price(product['price']),
+        'sale_price': product['sale_price'] or 0,
+        'sale_price_text': format_price(product['sale_price']),
+        'discount': discount_percent(product),
+        'whatsapp_url': f"https://wa.me/{WHATSAPP_NUMBER}?text={quote(message, safe=URI_COMPONENT_SAFE)}",
+    })
+
+
+def page_link(target, pages, base, rel):
+    """خصائص رابط السابق/التالي: href أو aria-disabled عند عدم وجود الصفحة"""
+    if 1 <= target <= pages:
+        return f' href="{escape_html(base + page_name(target))}" rel="{rel}"'
+    return ' aria-disabled="true"'
+
+
+def render_listing_page(products, page, pages):
+    """صفحة ترقيم كاملة: products هي منتجات هذه الصفحة فقط"""
+    base = '' if page == 1 else '../'
+    return LISTING_TEMPLATE.render({
+        'base': base,
+        'title_suffix': '' if page == 1 else f" - صفحة {page}",
+        'canonical': SITE_URL if page == 1 else SITE_URL + page_name(page),
+        'cards': ''.join(render_card(product, base) for product in products),
+        'page': page,
+        'pages': pages,
+        'prev_attrs': page_link(page - 1, pages, base, 'prev'),
+        'next_attrs': page_link(page + 1, pages, base, 'next'),
+        'listing_page': {'page': page, 'pages': pages, 'per_page': PRODUCTS_PER_PAGE, 'base': base},
+    })
+
+
+# نسخة القالب: أي تعديل على القالبين أو دوال العرض يعيد كتابة كل الصفحات
+LISTING_VERSION = hashlib.sha256(
+    (''.join(LISTING_TEMPLATE.chunks) + ''.join(CARD_TEMPLATE.chunks)
+     + inspect.getsource(decode_row) + inspect.getsource(grid_image_attributes) + inspect.getsource(render_card)
+     + inspect.getsource(page_link) + inspect.getsource(render_listing_page) + inspect.getsource(page_template)
+     ).encode('utf-8')
+).hexdigest()[:16]
+
+
+def page_digest(products, page, pages):
+    """بصمة صفحة ترقيم: تتغير فقط مع منتجاتها أو رقمها أو عدد الصفحات أو القالب"""
+    payload = dumps([LISTING_VERSION, page, pages, products])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def write_listing_pages(rows, image_prefixes, site_dir='.', old_pages=None, force=False):
+    """
+    كتابة صفحات الترقيم المتغيرة فقط وحذف الزائدة منها إذا صغر الكتالوج
+    rows: صفوف data/listing.js (JSON bytes من ListingIndexBuilder.rows)
+    old_pages: {اسم الصفحة: البصمة} من البناء السابق
+    يعيد ({اسم الصفحة: البصمة}، عدد الملفات المكتوبة)
+    """
+    old_pages = old_pages or {}
+    pages = max(1, -(-len(rows) // PRODUCTS_PER_PAGE))
+    new_pages = {}
+    written = 0
+    for page in range(1, pages + 1):
+        start = (page - 1) * PRODUCTS_PER_PAGE
+        products = [decode_row(json.loads(row), image_prefixes, start + i)
+                    for i, row in enumerate(rows[start:start + PRODUCTS_PER_PAGE])]
+        name = page_name(page)
+        digest = new_pages[name] = page_digest(products, page, pages)
+        path = os.path.join(site_dir, *name.split('/'))
+        if not force and old_pages.get(name) == digest and os.path.exists(path):
+            continue
+
+        page_html = render_listing_page(products, page, pages)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        write_page(path, page_html)
+        # بدون نسخ مضغوطة: service_worker.py يعدّل مراجع assets/ فيها بعد الكتابة
+        written += 1
+
+    for name in old_pages:
+        if name not in new_pages:
+            remove_with_siblings(os.path.join(site_dir, *name.split('/')))
+    return new_pages, written
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+قوالب HTML مترجمة مسبقاً - Iraq-Store
+
+القالب (مثل templates/product.html) يُحلَّل مرة واحدة عند التحميل إلى أجزاء
+نصية ثابتة وخانات (slots). إنشاء الصفحة بعد ذلك هو فقط تهريب قيمة كل خانة
+ودمج الأجزاء، بدون إعادة تنسيق آلاف الأحرف الثابتة لكل منتج.
+
+صيغة الخانات:
+- {{ name }}        نص HTML أو قيمة خاصية (تهريب & < > " ')
+- {{ name|url }}    جزء من رابط (ترميز %) ثم تهريب HTML
+- {{ name|json }}   قيمة JSON آمنة داخل <script> (تهريب < > &)
+- {{ name|raw }}    بدون تهريب (لقيم HTML جاهزة وموثوقة فقط)
+"""
+
+import html
+import json
+import os
+import re
+from urllib.parse import quote
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+SLOT_RE = re.compile(r'\{\{\s*(\w+)\s*(?:\|\s*(\w+)\s*)?\}\}')
+
+
+def escape_html(value):
+    """تهريب النص لمحتوى HTML وقيم الخصائص معاً"""
+    return html.escape(str(value), quote=True)
+
+
+def escape_url(value):
+    """ترميز جزء رابط (كل شيء عدا الأحرف الآمنة) ثم تهريب HTML"""
+    return escape_html(quote(str(value), safe=''))
+
+
+def escape_json(value):
+    """JSON مضغوط لا يمكنه إغلاق وسم <script> أو فتح تعليق HTML"""
+    text = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return text.replace('<', '\\u003c').replace('>', '\\u003e').replace('&', '\\u0026')
+
+
+ESCAPERS = {
+    'html': escape_html,
+    'url': escape_url,
+    'json': escape_json,
+    'raw': str,
+}
+
+
+class Template:
+    """
+    قالب مترجم: chunks ثابتة بين الخانات، و slots هي (الاسم، دالة التهريب)
+    len(chunks) == len(slots) + 1 دائماً
+    """
+
+    __slots__ = ('chunks', 'slots', 'names')
+
+    def __init__(self, source, minify=None):
+        if minify is not None:
+            source = minify(source)
+        self.chunks = []
+        self.slots = []
+        pos = 0
+        for match in SLOT_RE.finditer(source):
+            name, kind = match.group(1), match.group(2) or 'html'
+            if kind not in ESCAPERS:
+                raise ValueError(f"نوع خانة غير معروف: {name}|{kind}")
+            self.chunks.append(source[pos:match.start()])
+            self.slots.append((name, ESCAPERS[kind]))
+            pos = match.end()
+        self.chunks.append(source[pos:])
+        self.names = frozenset(name for name, _ in self.slots)
+
+    def render(self, context):
+        """دمج الأجزاء مع قيم الخانات (KeyError إذا نقصت قيمة)"""
+        parts = [self.chunks[0]]
+        for (name, escape), chunk in zip(self.slots, self.chunks[1:]):
+            parts.append(escape(context[name]))
+            parts.append(chunk)
+        return ''.join(parts)
+
+
+def load_template(name, minify=None, templates_dir=TEMPLATES_DIR):
+    """قراءة وترجمة قالب من مجلد templates/"""
+    with open(os.path.join(templates_dir, name), 'r', encoding='utf-8') as f:
+        return Template(f.read(), minify)
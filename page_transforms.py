@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+معالجة صفحات HTML بعد إنشائها في مرور واحد - Iraq-Store
+
+بدلاً من ثلاث أدوات منفصلة تقرأ وتعيد كتابة كل الصفحات كل مرة:
+- fix-images.sh (sed -i على كل الصفحات)
+- add-tracking.ps1 (PowerShell، لا يعمل على أجهزة البناء Linux)
+- fix-schema.py (قراءة وكتابة كاملة ثالثة)
+
+كل تحويل دالة (html, page) ← html، آمنة للتكرار (idempotent): تطبيقها على
+نتيجتها لا يغير شيئاً. التحويلات المختارة تُطبق بالترتيب على نفس النص، فكل
+ملف يُقرأ مرة ويُكتب مرة واحدة فقط إذا تغيّر (مع نسخه المضغوطة .gz/.br إن وُجدت).
+
+الملفات التي لم يتغير حجمها ووقت تعديلها منذ التشغيل السابق بنفس التحويلات
+لا تُقرأ أصلاً (.transform-cache.json).
+
+صفحات generate_products.py (GENERATOR_MARKER) لا تعدّلها التحويلات المرتبطة بالمحتوى
+(التتبع والسكيما موجودان في templates/product.html) حتى تبقى مطابقة لـ .build-manifest.json.
+
+استخدام:
+python page_transforms.py                          # كل التحويلات على products/*.html
+python page_transforms.py --only images,tracking   # تحويلات محددة
+python page_transforms.py --workers 4 --price-anchor 2025-11-01
+python page_transforms.py --profile   # مؤقتات المراحل وأبطأ الملفات في transform-metrics.json
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from html import unescape
+from pathlib import Path
+
+import product_schema
+from build_io import PRECOMPRESSED_SUFFIXES, write_if_changed, write_page, write_precompressed
+from build_profile import BuildProfile, run_profiled
+from product_schema import default_price_anchor, generate_enhanced_schema, parse_price_anchor
+
+TRANSFORM_CACHE_FILE = '.transform-cache.json'
+METRICS_FILE = 'transform-metrics.json'
+CACHE_VERSION = 1
+
+GTM_ID = 'GTM-TVV3GQZZ'
+GA_ID = 'G-CGC2RV7T45'
+
+# نفس المقاطع التي كان يضيفها add-tracking.ps1 (ومطابقة لـ index.html)
+TRACKING_HEAD = f"""    <!-- Google Tag Manager -->
+    <script>(function(w,d,s,l,i){{w[l]=w[l]||[];w[l].push({{'gtm.start':
+    new Date().getTime(),event:'gtm.js'}});var f=d.getElementsByTagName(s)[0],
+    j=d.createElement(s),dl=l!='dataLayer'?'&l='+l:'';j.async=true;j.src=
+    'https://www.googletagmanager.com/gtm.js?id='+i+dl;f.parentNode.insertBefore(j,f);
+    }})(window,document,'script','dataLayer','{GTM_ID}');</script>
+    <!-- End Google Tag Manager -->
+
+    <!-- Google tag (gtag.js) -->
+    <script async src="https://www.googletagmanager.com/gtag/js?id={GA_ID}"></script>
+    <script>
+      window.dataLayer = window.dataLayer || [];
+      function gtag(){{dataLayer.push(arguments);}}
+      gtag('js', new Date());
+      gtag('config', '{GA_ID}');
+    </script>
+"""
+
+TRACKING_BODY = f"""    <!-- Google Tag Manager (noscript) -->
+    <noscript><iframe src="https://www.googletagmanager.com/ns.html?id={GTM_ID}"
+    height="0" width="0" style="display:none;visibility:hidden"></iframe></noscript>
+    <!-- End Google Tag Manager (noscript) -->
+"""
+
+HEAD_RE = re.compile(r'<head(?:\s[^>]*)?>')
+BODY_RE = re.compile(r'<body(?:\s[^>]*)?>')
+RELATIVE_CDN_RE = re.compile(r'((?:src|href)=")\.\./(https?://)')
+
+# علامة صفحات generate_products.py (templates/product.html): سكيما مبنية من الكتالوج نفسه
+GENERATOR_MARKER = '<meta name="generator" content="generate_products.py">'
+
+# إزالة السكيما القديمة مع المسافة البادئة والسطر الخاص بها حتى تبقى العملية idempotent
+LD_JSON_RE = re.compile(r'[ \t]*<script type="application/ld\+json">.*?</script>\n?', re.DOTALL)
+
+
+def extract_product_info(html_content, filename=''):
+    """استخراج بيانات المنتج من HTML بنفس شكل سطر catalog.jsonl (النصوص بعد فك &quot; وغيرها)"""
+    data = {'slug': filename.replace('.html', '')}
+
+    # استخراج العنوان
+    title_match = re.search(r'<title>([^<]+)</title>', html_content)
+    if title_match:
+        full_title = title_match.group(1).strip()
+        # إزالة " - متجر العراق"
+        data['title'] = unescape(full_title.replace(' - متجر العراق', '')).strip()
+
+    # استخراج الوصف من meta description
+    desc_match = re.search(r'<meta name="description" content="([^"]+)"', html_content)
+    if desc_match:
+        data['description'] = unescape(desc_match.group(1)).strip()
+
+    # استخراج السعر القديم
+    old_price_match = re.search(r'<span class="old-price">([\d,]+)\s*د\.ع</span>', html_content)
+    if old_price_match:
+        data['price'] = int(old_price_match.group(1).replace(',', ''))
+
+    # استخراج السعر الجديد
+    new_price_match = re.search(r'<div class="new-price">([\d,]+)\s*د\.ع</div>', html_content)
+    if new_price_match:
+        data['sale_price'] = int(new_price_match.group(1).replace(',', ''))
+
+    # استخراج رابط الصورة (أي ترتيب للخصائص، مع loading="lazy" أو بدونها)
+    img_match = re.search(r'<img src="([^"]+)"[^>]*class="product-image"', html_content)
+    if img_match:
+        data['image_link'] = unescape(img_match.group(1))
+
+    return data
+
+
+def fix_image_paths(html, page):
+    """روابط CDN المكتوبة كمسار نسبي: src="../https://..." ← src="https://..." (fix-images.sh)"""
+    return RELATIVE_CDN_RE.sub(r'\1\2', html)
+
+
+def inject_tracking(html, page):
+    """
+    Google Tag Manager و gtag بعد <head> و noscript بعد <body>، مرة واحدة فقط (add-tracking.ps1)
+    صفحات generate_products.py تبقى كما هي: التتبع في templates/product.html نفسه
+    وبصمتها في .build-manifest.json يجب أن تطابق ما على القرص
+    """
+    if GTM_ID in html or GENERATOR_MARKER in html:
+        return html
+    html = HEAD_RE.sub(lambda match: f"{match.group(0)}\n{TRACKING_HEAD}", html, count=1)
+    return BODY_RE.sub(lambda match: f"{match.group(0)}\n{TRACKING_BODY}", html, count=1)
+
+
+def refresh_schema(html, page):
+    """
+    JSON-LD المحسّن من بيانات الصفحة نفسها قبل </head> (fix-schema.py)
+    index.html بدون سكيما منتج، وصفحات generate_products.py تبقى كما هي
+    """
+    if page['name'] == 'index.html' or GENERATOR_MARKER in html:
+        return html
+    content = LD_JSON_RE.sub('', html)
+    schema = generate_enhanced_schema(extract_product_info(content, page['name']), page['price_anchor'])
+    return content.replace('</head>', f'{schema}\n</head>')
+
+
+# الاسم في --only ← الدالة، بترتيب التطبيق
+TRANSFORMS = {
+    'images': fix_image_paths,
+    'tracking': inject_tracking,
+    'schema': refresh_schema,
+}
+
+
+def apply_transforms(html, names, page):
+    """تطبيق التحويلات بالترتيب، يعيد (النص الجديد، أسماء التحويلات التي غيّرت شيئاً)"""
+    applied = []
+    for name in names:
+        new_html = TRANSFORMS[name](html, page)
+        if new_html != html:
+            applied.append(name)
+            html = new_html
+    return html, applied
+
+
+def transform_file(path, names, price_anchor):
+    """
+    قراءة ملف واحد وتطبيق التحويلات وكتابته مرة واحدة إذا تغيّر
+    يعيد (الحالة، التحويلات المطبقة، التوقيتات، (الحجم، وقت التعديل) بعد الكتابة)
+    تُستدعى مباشرة أو داخل عمليات الـ process pool
+    """
+    timings = {}
+    applied = []
+    t = time.perf_counter()
+    try:
+        # أسطر \r\n تصبح \n عند القراءة (كما في fix-schema.py) حتى لا تختلط نهايات الأسطر
+        with open(path, 'r', encoding='utf-8') as f:
+            original = f.read()
+        now = time.perf_counter()
+        timings['read'] = now - t
+
+        html, applied = apply_transforms(original, names, {'name': os.path.basename(path),
+                                                           'price_anchor': price_anchor})
+        t = time.perf_counter()
+        timings['transform'] = t - now
+
+        status = 'unchanged'
+        if applied:
+            write_page(path, html)
+            # النسخ المضغوطة الموجودة يجب أن تطابق الصفحة الجديدة
+            if any(os.path.exists(path + suffix) for suffix in PRECOMPRESSED_SUFFIXES):
+                write_precompressed(path, html.encode('utf-8'))
+            timings['write'] = time.perf_counter() - t
+            status = 'changed'
+        st = os.stat(path)
+        return status, applied, timings, (st.st_size, st.st_mtime_ns)
+    except Exception as e:
+        print(f"❌ خطأ في {os.path.basename(path)}: {e}")
+        return 'error', applied, timings, None
+
+
+def transforms_signature(names, price_anchor):
+    """بصمة التحويلات المختارة وكودها: أي تغيير فيها يلغي كاش stat"""
+    digest = hashlib.sha256(json.dumps([names, price_anchor.isoformat()]).encode('utf-8'))
+    digest.update(inspect.getsource(sys.modules[__name__]).encode('utf-8'))
+    if 'schema' in names:
+        digest.update(inspect.getsource(product_schema).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_cache(cache_file, signature):
+    """{المسار: [الحجم، وقت التعديل]} من التشغيل السابق بنفس التحويلات"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != CACHE_VERSION or data.get('signature') != signature:
+        return {}
+    return data.get('files', {})
+
+
+def transform_pages(paths, names, price_anchor=None, workers=1, cache_file=TRANSFORM_CACHE_FILE, profile=None):
+    """
+    تطبيق التحويلات names على الملفات paths
+    يعيد (عدد كل حالة، عدد الملفات التي غيّرها كل تحويل، التوقيت لكل مرحلة)
+    الحالات: changed و unchanged و skipped (لم يتغير stat منذ التشغيل السابق) و error
+    """
+    price_anchor = price_anchor or default_price_anchor()
+    unknown = [name for name in names if name not in TRANSFORMS]
+    if unknown:
+        raise ValueError(f"تحويلات غير معروفة: {', '.join(unknown)} (المتاح: {', '.join(TRANSFORMS)})")
+    names = [name for name in TRANSFORMS if name in names]
+
+    t = time.perf_counter()
+    signature = transforms_signature(names, price_anchor)
+    cached = load_cache(cache_file, signature) if cache_file else {}
+    files = {}
+    pending = []
+    for path in map(str, paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if cached.get(path) == [st.st_size, st.st_mtime_ns]:
+            files[path] = cached[path]
+        else:
+            pending.append(path)
+    stage_times = {'scan': time.perf_counter() - t}
+
+    counts = {'changed': 0, 'unchanged': 0, 'skipped': len(files), 'error': 0}
+    applied_counts = dict.fromkeys(names, 0)
+    t = time.perf_counter()
+    worker = partial(transform_file, names=names, price_anchor=price_anchor)
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(pending) // (workers * 4))
+            results = list(executor.map(worker, pending, chunksize=chunksize))
+    else:
+        results = map(worker, pending)
+
+    for path, (status, applied, timings, stat) in zip(pending, results):
+        counts[status] += 1
+        for name in applied:
+            applied_counts[name] += 1
+        for stage, seconds in timings.items():
+            stage_times[stage] = stage_times.get(stage, 0.0) + seconds
+        if profile is not None:
+            profile.add_file(os.path.basename(path), timings)
+        if stat is not None:
+            files[path] = list(stat)
+    stage_times['process'] = time.perf_counter() - t
+
+    if cache_file:
+        write_if_changed(cache_file, json.dumps({'version': CACHE_VERSION, 'signature': signature,
+                                                 'files': dict(sorted(files.items()))},
+                                                ensure_ascii=False, separators=(',', ':')))
+    if profile is not None:
+        profile.add('scan', stage_times['scan'])
+    return counts, applied_counts, stage_times
+
+
+def parse_names(text):
+    return [name.strip() for name in text.split(',') if name.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='معالجة صفحات HTML بعد الإنشاء في مرور واحد')
+    parser.add_argument('files', nargs='*', help='ملفات HTML محددة (الافتراضي: كل صفحات --products-dir)')
+    parser.add_argument('--products-dir', default='products', help='مجلد صفحات المنتجات')
+    parser.add_argument('--only', type=parse_names, default=list(TRANSFORMS),
+                        help=f"التحويلات مفصولة بفواصل (الافتراضي: {','.join(TRANSFORMS)})")
+    parser.add_argument('--price-anchor', type=parse_price_anchor, default=None,
+                        help='تاريخ بداية صلاحية السعر في السكيما YYYY-MM-DD (الافتراضي: أول الشهر الحالي)')
+    parser.add_argument('--workers', type=int, default=1, help='عدد العمليات المتوازية (0 = عدد الأنوية)')
+    parser.add_argument('--cache', default=TRANSFORM_CACHE_FILE,
+                        help='كاش حجم/وقت تعديل الملفات المعالجة ("" لمعالجة كل الملفات)')
+    parser.add_argument('--profile', action='store_true',
+                        help='مؤقتات المراحل وأبطأ الملفات مع ملخص مختصر')
+    parser.add_argument('--metrics', default=METRICS_FILE, help='ملف المقاييس JSON (مع --profile)')
+    parser.add_argument('--slowest', type=int, default=10, help='عدد أبطأ الملفات في التقرير (مع --profile)')
+    parser.add_argument('--cprofile', metavar='FILE',
+                        help='التشغيل تحت cProfile وحفظ النتيجة في FILE (العملية الرئيسية فقط)')
+    args = parser.parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+    price_anchor = args.price_anchor or default_price_anchor()
+
+    paths = args.files or sorted(Path(args.products_dir).glob('*.html'))
+    if not paths:
+        print(f"❌ لا توجد ملفات HTML في {args.products_dir}/")
+        return 1
+
+    profile = BuildProfile('page_transforms', args.slowest) if args.profile else None
+    try:
+        counts, applied, _ = run_profiled(
+            lambda: transform_pages(paths, args.only, price_anchor, workers, args.cache, profile), args.cprofile)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if profile is not None:
+        metrics = profile.write(args.metrics, counts=counts, transforms=applied, files=len(paths),
+                                workers=workers, price_anchor=price_anchor.isoformat())
+        profile.print_summary(metrics)
+
+    print(f"🔧 {len(paths)} ملف ({', '.join(applied)}): {counts['changed']} معدّل، "
+          f"{counts['unchanged']} بدون تغيير، {counts['skipped']} لم يتغير منذ التشغيل السابق، "
+          f"{counts['error']} أخطاء")
+    for name, count in applied.items():
+        if count:
+            print(f"   ✅ {name}: {count} ملف")
+    return 1 if counts['error'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+"""
+وضع المراقبة مع خادم معاينة محلي - Iraq-Store
+
+بدلاً من تشغيل generate_products.py كاملاً بعد كل تعديل ثم فتح الملفات يدوياً:
+
+python preview.py   # ثم افتح http://127.0.0.1:8000/
+
+- يراقب catalog.jsonl و templates/product.html (فحص stat كل 20 ms)
+- عند تغيّر الكتالوج يقارن الملف الجديد بالقديم ويحدد المنطقة المتغيرة فقط
+  (بداية ونهاية مشتركة)، فيحلل الأسطر المتغيرة فقط مهما كبر الكتالوج
+- يحدد صفحات الـ slugs المتأثرة: المعدّلة، والمحذوفة، والمُعاد تسميتها
+  (الـ slug القديم يُحوَّل إلى الجديد)، مع نفس قاعدة "آخر منتج يفوز" عند التكرار
+- الصفحات تُنشأ عند أول طلب وتُحفظ في الذاكرة، ولا يُكتب أي ملف على القرص
+- الصفحة المفتوحة في المتصفح تُحدَّث تلقائياً عند تغيّر منتجها أو القالب
+
+باقي الملفات (index.html و page/ و data/ و الصور) تُقدَّم من جذر الموقع كما هي
+حتى تشغيل generate_products.py التالي. sw.js يُستبدل بنسخة تلغي التسجيل
+وتحذف الكاش حتى لا تعرض المعاينة صفحات محفوظة من قبل.
+"""
+
+import argparse
+import bisect
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+import generate_products
+from catalog import CATALOG_FILE
+from generate_products import (OUTPUT_DIR, PRODUCT_CSS_FILE, PRODUCT_CSS_MIN, create_product_page, minify_html,
+                               product_slug)
+from image_meta import IMAGE_CACHE_FILE, IMAGE_MIRROR_DIR, ImageMetaCache
+from page_template import TEMPLATES_DIR, escape_json, load_template
+from service_worker import SERVICE_WORKER_FILE, UNREGISTER_WORKER
+
+POLL_INTERVAL = 0.02
+WAIT_TIMEOUT = 25
+BLOCK_SIZE = 1 << 16
+TEMPLATE_NAME = 'product.html'
+
+LIVE_RELOAD = ('<script>(function poll(){fetch("/__preview/wait?page="+encodeURIComponent(%s)+"&v=%d")'
+               '.then(function(r){if(r.status===205)location.reload();else poll();},'
+               'function(){setTimeout(poll,1000);});})();</script>')
+
+
+def common_prefix(a, b, limit):
+    """طول البداية المشتركة بين a و b (أول limit بايت)، بمقارنة كتل ثم بحث ثنائي"""
+    view = memoryview(a)
+    i = 0
+    while i < limit:
+        end = min(i + BLOCK_SIZE, limit)
+        if not b.startswith(view[i:end], i):
+            break
+        i = end
+    else:
+        return limit
+    lo, hi = i, end - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if b.startswith(view[i:mid], i):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def common_suffix(a, a_len, b, b_len, limit):
+    """طول النهاية المشتركة بين a[:a_len] و b[:b_len] (حتى limit بايت)"""
+    view = memoryview(a)
+    n = 0
+    while n < limit:
+        step = min(BLOCK_SIZE, limit - n)
+        if not b.endswith(view[a_len - n - step:a_len - n], 0, b_len - n):
+            break
+        n += step
+    else:
+        return limit
+    lo, hi = n, n + step - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if b.endswith(view[a_len - mid:a_len - n], 0, b_len - n):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+class CatalogIndex:
+    """
+    الكتالوج (JSON Lines) في الذاكرة كما هو: المحتوى + بداية كل سطر + slug كل سطر
+    update() يعيد قراءة الملف ويعيد {slug: (السطر القديم، السطر الجديد)} للصفحات المتغيرة
+    (None للسطر القديم = صفحة جديدة، وللجديد = صفحة محذوفة)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.content = bytearray()
+        self.size = 0
+        self.spare = bytearray()
+        self.starts = [0]
+        self.keys = [None]
+        self.positional = 0
+
+    def line(self, i, content=None, starts=None, size=None):
+        """محتوى السطر رقم i (من الحالة الحالية أو من حالة جديدة قبل اعتمادها)"""
+        if content is None:
+            content, starts, size = self.content, self.starts, self.size
+        end = starts[i + 1] - 1 if i + 1 < len(starts) else size
+        return bytes(content[starts[i]:end])
+
+    def find(self, slug, keys=None):
+        """رقم آخر سطر بهذا الـ slug (آخر منتج يفوز كما في البناء) أو None"""
+        keys = self.keys if keys is None else keys
+        try:
+            return len(keys) - 1 - keys[::-1].index(slug)
+        except ValueError:
+            return None
+
+    def product_line(self, slug):
+        i = self.find(slug)
+        return None if i is None else self.line(i)
+
+    def read(self):
+        """قراءة الملف في المخزن الاحتياطي (بدون حجز ذاكرة جديدة في كل مرة)، يعيد الحجم"""
+        with open(self.path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            while True:
+                if len(self.spare) <= size:
+                    self.spare = bytearray(size + size // 4 + 4096)
+                size = f.readinto(self.spare)
+                if size < len(self.spare):
+                    return size
+                f.seek(0)
+
+    def update(self):
+        """مقارنة الملف الجديد بالقديم وتحليل المنطقة المتغيرة فقط"""
+        new_size = self.read()
+        new, old, old_size = self.spare, self.content, self.size
+
+        limit = min(old_size, new_size)
+        prefix = common_prefix(old, new, limit)
+        if prefix == limit and old_size == new_size:
+            return {}
+        suffix = common_suffix(old, old_size, new, new_size, limit - prefix)
+
+        # المنطقة المتغيرة موسّعة إلى أسطر كاملة (نفس البداية في الملفين)
+        start = new.rfind(b'\n', 0, prefix) + 1
+        old_end = old.find(b'\n', old_size - suffix, old_size)
+        old_end = old_size if old_end == -1 else old_end
+        new_end = new.find(b'\n', new_size - suffix, new_size)
+        new_end = new_size if new_end == -1 else new_end
+
+        region_keys = []
+        region_starts = []
+        pos = start
+        for line in bytes(new[start:new_end]).split(b'\n'):
+            region_starts.append(pos)
+            pos += len(line) + 1
+            if not line.strip():
+                region_keys.append(None)
+                continue
+            product = json.loads(line)
+            if 'slug' not in product:
+                region_keys.append(False)
+            else:
+                region_keys.append(product_slug(product, 0))
+        # slug الافتراضي product-<ترتيب المنتج> يتغير مع أي إضافة أو حذف قبله: تحليل كامل
+        if self.positional or False in region_keys:
+            return self.rescan(new, new_size)
+
+        a = bisect.bisect_right(self.starts, start) - 1
+        b = a + old.count(b'\n', start, old_end) + 1
+        delta = new_end - old_end
+        keys = self.keys[:a] + region_keys + self.keys[b:]
+        starts = self.starts[:a] + region_starts + [s + delta for s in self.starts[b:]]
+
+        changed = {}
+        for slug in {k for k in self.keys[a:b] + region_keys if k is not None}:
+            j = self.find(slug, keys)
+            before = self.product_line(slug)
+            after = None if j is None else self.line(j, new, starts, new_size)
+            if before != after:
+                changed[slug] = (before, after)
+
+        self.keys, self.starts = keys, starts
+        self.content, self.spare, self.size = new, old, new_size
+        return changed
+
+    def rescan(self, content=None, size=None):
+        """تحليل كامل (عند البدء أو مع slugs افتراضية)، يعيد التغييرات بنفس صيغة update()"""
+        if content is None:
+            size = self.read()
+            content = self.spare
+        keys, starts = [], []
+        positional = 0
+        ordinal = 0
+        pos = 0
+        while True:
+            end = content.find(b'\n', pos, size)
+            end = size if end == -1 else end
+            starts.append(pos)
+            line = bytes(content[pos:end])
+            if line.strip():
+                ordinal += 1
+                try:
+                    product = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"سطر {len(starts)}: {e}") from None
+                positional += 'slug' not in product
+                keys.append(product_slug(product, ordinal))
+            else:
+                keys.append(None)
+            if end == size:
+                break
+            pos = end + 1
+
+        before = self.winners()
+        self.keys, self.starts, self.positional = keys, starts, positional
+        self.content, self.spare, self.size = content, self.content, size
+        after = self.winners()
+        changed = {}
+        for slug in before.keys() | after.keys():
+            old_line, new_line = before.get(slug), after.get(slug)
+            if old_line != new_line:
+                changed[slug] = (old_line, new_line)
+        return changed
+
+    def winners(self):
+        """{slug: سطر آخر منتج بهذا الـ slug} للكتالوج كاملاً في مرور واحد"""
+        last = {}
+        for i, slug in enumerate(self.keys):
+            if slug is not None:
+                last[slug] = i
+        return {slug: self.line(i) for slug, i in last.items()}
+
+
+class PreviewSite:
+    """حالة المعاينة: الكتالوج، الصفحات المنشأة في الذاكرة، وإصدارات التحديث التلقائي"""
+
+    def __init__(self, catalog_file=CATALOG_FILE, site_dir='.', image_mirror=IMAGE_MIRROR_DIR,
+                 image_cache=IMAGE_CACHE_FILE, templates_dir=TEMPLATES_DIR):
+        self.catalog = CatalogIndex(catalog_file)
+        self.site_dir = site_dir
+        self.templates_dir = templates_dir
+        self.template_path = os.path.join(templates_dir, TEMPLATE_NAME)
+        # بيانات الصور من نفس كاش البناء (المعاينة لا تحفظه)
+        self.images = ImageMetaCache(image_cache, image_mirror, site_dir)
+        self.pages = {}
+        self.renamed = {}
+        self.version = 0
+        self.changed_at = {}
+        self.reset_at = 0
+        self.condition = threading.Condition()
+        self.catalog.rescan()
+        # تهيئة المخزن الاحتياطي الآن حتى لا يدفع أول تعديل ثمن حجز الذاكرة
+        self.catalog.read()
+
+    def stamps(self):
+        """(mtime، الحجم) للكتالوج والقالب"""
+        result = []
+        for path in (self.catalog.path, self.template_path):
+            try:
+                st = os.stat(path)
+                result.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                result.append(None)
+        return result
+
+    def page(self, slug):
+        """(html، الإصدار) من الذاكرة أو بإنشائها الآن، أو None إذا لم يعد الـ slug في الكتالوج"""
+        with self.condition:
+            cached = self.pages.get(slug)
+            if cached is None:
+                line = self.catalog.product_line(slug)
+                if line is None:
+                    return None
+                cached = self.render(slug, line)
+            return cached
+
+    def render(self, slug, line):
+        """إنشاء صفحة من سطر الكتالوج وحفظها في الذاكرة"""
+        product = json.loads(line)
+        page_html = create_product_page(product, self.images.get(product.get('image_link')))
+        self.pages[slug] = (page_html, self.version)
+        return self.pages[slug]
+
+    def reload_catalog(self):
+        """
+        تحديث الصفحات المتغيرة فقط (الصفحات المفتوحة تُنشأ من جديد فوراً)
+        يعيد (محدّثة، محذوفة، إعادة تسمية)
+        """
+        with self.condition:
+            changed = self.catalog.update()
+            if not changed:
+                return 0, 0, 0
+            self.version += 1
+            # إعادة تسمية: slug حُذف وظهر slug جديد لنفس المنتج (نفس id)
+            added = {json.loads(after).get('id'): slug for slug, (before, after) in changed.items()
+                     if before is None and after is not None}
+            removed = 0
+            for slug, (before, after) in changed.items():
+                self.changed_at[slug] = self.version
+                self.renamed.pop(slug, None)
+                cached = self.pages.pop(slug, None)
+                if after is None:
+                    removed += 1
+                    new_slug = added.get(json.loads(before).get('id'))
+                    if new_slug:
+                        self.renamed[slug] = new_slug
+                elif cached is not None:
+                    self.render(slug, after)
+            self.condition.notify_all()
+        return len(changed) - removed, removed, sum(slug in self.renamed for slug in changed)
+
+    def reload_template(self):
+        """إعادة تحميل القالب: كل الصفحات تُنشأ من جديد عند طلبها"""
+        template = load_template(TEMPLATE_NAME, minify_html, self.templates_dir)
+        with self.condition:
+            generate_products.PRODUCT_TEMPLATE = template
+            self.version += 1
+            self.reset_at = self.version
+            self.pages.clear()
+            self.condition.notify_all()
+
+    def wait(self, slug, version, timeout=WAIT_TIMEOUT):
+        """انتظار تغيّر الصفحة (long-poll)، يعيد True إذا يجب تحديثها"""
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: self.changed_at.get(slug, 0) > version or self.reset_at > version, timeout)
+
+    def watch(self, interval=POLL_INTERVAL):
+        """حلقة المراقبة: فحص stat ثم تحديث ما تغيّر فقط"""
+        stamps = self.stamps()
+        while True:
+            time.sleep(interval)
+            current = self.stamps()
+            if current == stamps:
+                continue
+            started = time.perf_counter()
+            try:
+                if current[1] != stamps[1]:
+                    self.reload_template()
+                    print(f"🎨 {TEMPLATE_NAME}: كل الصفحات ستُنشأ من جديد "
+                          f"({(time.perf_counter() - started) * 1000:.1f} ms)")
+                if current[0] != stamps[0]:
+                    updated, removed, renamed = self.reload_catalog()
+                    print(f"🔄 {self.catalog.path}: {updated} صفحة محدّثة، {removed} محذوفة، "
+                          f"{renamed} إعادة تسمية ({(time.perf_counter() - started) * 1000:.1f} ms)")
+            except (OSError, ValueError) as e:
+                # حفظ جزئي أو JSON غير صالح أثناء التعديل: نبقي الحالة السابقة حتى الحفظ التالي
+                print(f"⚠️ {e}")
+            stamps = current
+
+
+def make_handler(site):
+    """معالج HTTP: صفحات المنتجات من الذاكرة، وباقي الملفات من جذر الموقع"""
+    pages_prefix = f"/{OUTPUT_DIR}/"
+
+    class PreviewHandler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            path = unquote(parts.path)
+            if path == '/__preview/wait':
+                query = parse_qs(parts.query)
+                changed = site.wait(query.get('page', [''])[0], int(query.get('v', ['0'])[0]))
+                self.send_response(205 if changed else 204)
+                self.end_headers()
+                return
+            if path == f"/{SERVICE_WORKER_FILE}":
+                # بدون كاش أثناء المعاينة حتى تظهر التعديلات مباشرة
+                return self.send_bytes(UNREGISTER_WORKER.encode('utf-8'), 'text/javascript; charset=utf-8')
+            if path == f"/assets/{PRODUCT_CSS_FILE}":
+                return self.send_bytes(PRODUCT_CSS_MIN.encode('utf-8'), 'text/css; charset=utf-8')
+            if path.startswith(pages_prefix) and path.endswith('.html') and path != f"{pages_prefix}index.html":
+                slug = path[len(pages_prefix):-len('.html')]
+                cached = site.page(slug)
+                if cached is not None:
+                    page_html, version = cached
+                    page_html = page_html.replace('</body>', LIVE_RELOAD % (escape_json(slug), version) + '</body>', 1)
+                    return self.send_bytes(page_html.encode('utf-8'), 'text/html; charset=utf-8')
+                new_slug = site.renamed.get(slug)
+                if new_slug:
+                    self.send_response(302)
+                    self.send_header('Location', quote(f"{pages_prefix}{new_slug}.html"))
+                    self.end_headers()
+                    return
+                self.send_error(404, explain='المنتج غير موجود في الكتالوج')
+                return
+            super().do_GET()
+
+        def send_bytes(self, data, content_type):
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return functools.partial(PreviewHandler, directory=site.site_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='مراقبة الكتالوج والقالب مع خادم معاينة محلي')
+    parser.add_argument('--catalog', default=CATALOG_FILE, help='الكتالوج (JSON Lines)')
+    parser.add_argument('--site-dir', default='.', help='جذر الموقع (index.html و data/ ...)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='فترة فحص الملفات بالثواني')
+    parser.add_argument('--image-mirror', default=IMAGE_MIRROR_DIR, help='مرآة محلية للصور')
+    parser.add_argument('--image-cache', default=IMAGE_CACHE_FILE, help='كاش بيانات الصور')
+    args = parser.parse_args(argv)
+
+    if not args.catalog.endswith(('.jsonl', '.ndjson')):
+        print("❌ وضع المراقبة يحتاج كتالوج JSON Lines (catalog.jsonl)")
+        return 1
+
+    started = time.perf_counter()
+    site = PreviewSite(args.catalog, args.site_dir, args.image_mirror, args.image_cache)
+    products = sum(k is not None for k in site.catalog.keys)
+    print(f"📚 {args.catalog}: {products} منتج ({(time.perf_counter() - started) * 1000:.0f} ms)")
+
+    threading.Thread(target=site.watch, args=(args.interval,), daemon=True).start()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(site))
+    server.daemon_threads = True
+    print(f"👀 المعاينة: http://{args.host}:{args.port}/  (Ctrl+C للإيقاف)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 تم الإيقاف")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+JSON-LD Schema المحسّن لصفحات المنتجات - Iraq-Store
+
+يُستدعى من generate_products.py أثناء إنشاء الصفحة (مرور واحد على الكتالوج)
+ومن fix-schema.py لتحديث الصفحات القديمة المكتوبة يدوياً.
+
+المدخل هو قاموس المنتج بنفس شكل سطر catalog.jsonl:
+title, description, price, sale_price, image_link, slug
+"""
+
+import hashlib
+import json
+import math
+import os
+from datetime import date, datetime, timedelta, timezone
+
+SITE_URL = "https://sherow1982.github.io/Iraq-Store/"
+STORE_NAME = "متجر العراق"
+PLACEHOLDER_IMAGE = "https://via.placeholder.com/500"
+DEFAULT_DESCRIPTION = "منتج عالي الجودة من متجر العراق"
+PRICE_VALID_DAYS = 90
+
+
+def default_price_anchor(today=None):
+    """
+    تاريخ بداية صلاحية السعر: SOURCE_DATE_EPOCH إن وُجد، وإلا أول يوم في الشهر الحالي
+    ثابت طوال الشهر حتى لا يتغير محتوى الصفحات مع كل تشغيل
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), tz=timezone.utc).date()
+    return (today or date.today()).replace(day=1)
+
+
+def parse_price_anchor(value):
+    """تحويل YYYY-MM-DD إلى date (للاستخدام مع argparse)"""
+    return date.fromisoformat(value)
+
+
+def stable_gtin(filename):
+    """
+    GTIN-13 ثابت لكل ملف: 12 رقماً من sha256 لاسم الملف + رقم التحقق
+    (hash() المدمج في بايثون يتغير مع كل عملية فلا يصلح هنا)
+    """
+    digest = int.from_bytes(hashlib.sha256(filename.encode('utf-8')).digest()[:8], 'big')
+    body = f"{digest % 10**12:012d}"
+    total = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(body))
+    return f"{body}{(10 - total % 10) % 10}"
+
+
+def discount_percent(product):
+    """
+    نسبة الخصم لصفحة المنتج والسكيما وبطاقات الشبكة وترتيب data/facets.js
+    التقريب للأعلى عند النصف مثل Math.round في المتصفح (round في بايثون يقرّب للزوجي)
+    """
+    price = product.get('price')
+    sale_price = product.get('sale_price')
+    if not price or not sale_price:
+        return 0
+    return math.floor((price - sale_price) / price * 100 + 0.5)
+
+
+def rating_for_discount(discount):
+    """التقييم وعدد المراجعات (مبني على الخصم)"""
+    if discount >= 20:
+        return "4.7", "156"
+    if discount >= 15:
+        return "4.5", "127"
+    if discount >= 10:
+        return "4.3", "98"
+    return "4.2", "73"
+
+
+def build_schema(product, price_anchor=None):
+    """بناء قاموس Schema للمنتج"""
+    name = product.get('title') or 'منتج'
+    description = (product.get('description') or DEFAULT_DESCRIPTION)[:160]
+    price = str(product.get('sale_price') or 0)
+    image = product.get('image_link') or PLACEHOLDER_IMAGE
+    filename = f"{product.get('slug', '')}.html"
+
+    rating, review_count = rating_for_discount(discount_percent(product))
+
+    # إنشاء URL للمنتج
+    product_url = f"{SITE_URL}products/{filename}"
+
+    # حساب تاريخ انتهاء السعر (3 أشهر من تاريخ البداية الثابت)
+    anchor = price_anchor or default_price_anchor()
+    valid_until = (anchor + timedelta(days=PRICE_VALID_DAYS)).strftime('%Y-%m-%d')
+
+    # SKU فريد لكل منتج (بناءً على اسم الملف)
+    sku = f"IQ-{filename.replace('.html', '').replace(' ', '-')[:30]}"
+
+    # GTIN (اختياري) - ثابت بين التشغيلات
+    gtin = stable_gtin(filename)
+
+    return {
+        "@context": "https://schema.org/",
+        "@type": "Product",
+        "name": name,
+        "description": description,
+        "image": [image],
+        "sku": sku,
+        "mpn": sku,
+        "gtin13": gtin,
+        "brand": {"@type": "Brand", "name": STORE_NAME},
+        "offers": {
+            "@type": "Offer",
+            "url": product_url,
+            "priceCurrency": "IQD",
+            "price": price,
+            "priceValidUntil": valid_until,
+            "availability": "https://schema.org/InStock",
+            "itemCondition": "https://schema.org/NewCondition",
+            "seller": {
+                "@type": "Organization",
+                "name": STORE_NAME,
+                "url": SITE_URL,
+                "logo": f"{SITE_URL}logo.png",
+                "telephone": "+201110760081",
+                "address": {
+                    "@type": "PostalAddress",
+                    "addressCountry": "IQ",
+                    "addressLocality": "بغداد",
+                },
+            },
+            "shippingDetails": {
+                "@type": "OfferShippingDetails",
+                "shippingRate": {"@type": "MonetaryAmount", "value": "5000", "currency": "IQD"},
+                "shippingDestination": {"@type": "DefinedRegion", "addressCountry": "IQ"},
+                "deliveryTime": {
+                    "@type": "ShippingDeliveryTime",
+                    "handlingTime": {"@type": "QuantitativeValue", "minValue": 1, "maxValue": 2, "unitCode": "DAY"},
+                    "transitTime": {"@type": "QuantitativeValue", "minValue": 3, "maxValue": 7, "unitCode": "DAY"},
+                },
+            },
+            "hasMerchantReturnPolicy": {
+                "@type": "MerchantReturnPolicy",
+                "returnPolicyCategory": "https://schema.org/MerchantReturnFiniteReturnWindow",
+                "merchantReturnDays": 7,
+                "returnMethod": "https://schema.org/ReturnByMail",
+                "returnFees": "https://schema.org/FreeReturn",
+            },
+        },
+        "aggregateRating": {
+            "@type": "AggregateRating",
+            "ratingValue": rating,
+            "reviewCount": review_count,
+            "bestRating": "5",
+            "worstRating": "1",
+        },
+        "review": [
+            {
+                "@type": "Review",
+                "reviewRating": {"@type": "Rating", "ratingValue": rating, "bestRating": "5"},
+                "author": {"@type": "Person", "name": "عميل متجر العراق"},
+                "reviewBody": "منتج ممتاز وجودة عالية، أنصح بالشراء",
+            }
+        ],
+    }
+
+
+def generate_enhanced_schema(product, price_anchor=None):
+    """توليد وسم <script type="application/ld+json"> للمنتج (نفس المدخل = نفس البايتات)"""
+    body = json.dumps(build_schema(product, price_anchor), ensure_ascii=False, indent=2)
+    # منع إغلاق وسم script مبكراً إذا احتوى النص على "</"
+    body = body.replace('</', '<\\/')
+    body = body.replace('\n', '\n    ')
+    return f'    <script type="application/ld+json">\n    {body}\n    </script>'
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+فهرس البحث المبني مسبقاً لصندوق البحث في index.html - Iraq-Store
+
+بدلاً من فحص كل العناوين مع كل ضغطة زر، يكتب البناء data/search.js:
+
+- vocab: كل الكلمات (بعد التطبيع) مرتبة أبجدياً
+- postings: لكل كلمة قائمة أرقام صفوف المنتجات في data/listing.js
+  (مرمّزة بالفروق delta لتصغير الحجم)
+
+المتصفح يطبّع كلمات البحث بنفس الطريقة، ويجد الكلمات التي تبدأ بكل كلمة
+بحث عبر binary search في vocab، ثم يأخذ تقاطع القوائم. تكلفة كل ضغطة
+تعتمد على حجم النتائج لا على حجم الكتالوج.
+
+التطبيع العربي:
+- حذف التشكيل والتطويل
+- أ/إ/آ/ٱ ← ا، ى ← ي، ة ← ه
+- الأرقام العربية ← أرقام لاتينية
+- كل ما ليس حرفاً أو رقماً ← مسافة
+- الكلمات التي تبدأ بسوابق مثل ال/بال/لل/و/ب تُفهرس أيضاً بدونها
+  (خلاط / الخلاط، ضمان / بضمان)، والمتصفح يحذف ال/بال/لل... من كلمات البحث
+"""
+
+import os
+import re
+from array import array
+
+from build_io import dumps, write_chunks_if_changed
+
+SEARCH_FILE = os.path.join('data', 'search.js')
+
+TASHKEEL_RE = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+NON_WORD_RE = re.compile(r'[\W_]+')
+CHAR_MAP = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي',
+    'ة': 'ه',
+    **{chr(0x0660 + d): str(d) for d in range(10)},
+    **{chr(0x06f0 + d): str(d) for d in range(10)},
+})
+# السوابق التي تُحذف من الكلمة (الأطول أولاً)، بشرط أن يبقى 3 أحرف على الأقل
+INDEX_PROCLITICS = ('وال', 'بال', 'كال', 'فال', 'لل', 'ال', 'و', 'ب')
+# نفس القائمة بدون الحروف المفردة (QUERY_PROCLITICS في index.html)
+QUERY_PROCLITICS = ('وال', 'بال', 'كال', 'فال', 'لل', 'ال')
+MIN_STEM = 3
+
+
+def normalize_arabic(text):
+    """تطبيع النص للبحث (يجب أن يطابق normalizeArabic في index.html)"""
+    text = TASHKEEL_RE.sub('', text.lower()).translate(CHAR_MAP)
+    return NON_WORD_RE.sub(' ', text).strip()
+
+
+def index_terms(title):
+    """الكلمات التي يُفهرس بها العنوان"""
+    terms = set()
+    for word in normalize_arabic(title).split():
+        terms.add(word)
+        for prefix in INDEX_PROCLITICS:
+            if word.startswith(prefix) and len(word) - len(prefix) >= MIN_STEM:
+                terms.add(word[len(prefix):])
+    return terms
+
+
+class SearchIndexBuilder:
+    """بناء الفهرس تدريجياً بنفس ترتيب صفوف data/listing.js"""
+
+    def __init__(self):
+        self.postings = {}
+        self.rows = 0
+
+    def add(self, product):
+        self.append(self.entry(product))
+
+    def entry(self, product):
+        """كلمات المنتج بدون تعديل الفهرس (انظر ListingIndexBuilder.entry)"""
+        return index_terms(product.get('title') or '')
+
+    def append(self, terms):
+        # array('I') بدلاً من list حتى تبقى الذاكرة صغيرة مع الكتالوجات الكبيرة
+        for term in terms:
+            rows = self.postings.get(term)
+            if rows is None:
+                rows = self.postings[term] = array('I')
+            rows.append(self.rows)
+        self.rows += 1
+
+    def iter_encoded(self):
+        """(الكلمة، قائمة الصفوف مرمّزة بالفروق) بترتيب أبجدي"""
+        for term in sorted(self.postings):
+            rows = self.postings[term]
+            yield term, [rows[0]] + [b - a for a, b in zip(rows, rows[1:])]
+
+    def iter_search_js(self):
+        """محتوى data/search.js على أجزاء bytes"""
+        yield '// فهرس البحث - مولّد تلقائياً من generate_products.py\nconst searchIndex = {"vocab":['.encode('utf-8')
+        for n, term in enumerate(sorted(self.postings)):
+            yield (',' if n else '').encode('utf-8') + dumps(term).encode('utf-8')
+        yield b'],"postings":['
+        for n, (_, encoded) in enumerate(self.iter_encoded()):
+            yield (b',' if n else b'') + dumps(encoded).encode('utf-8')
+        yield b']};\n'
+
+    def finish(self, site_dir='.'):
+        """كتابة data/search.js إذا تغيّر، يعيد True عند الكتابة"""
+        return write_chunks_if_changed(os.path.join(site_dir, SEARCH_FILE), self.iter_search_js())
+
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+أسماء ملفات مبنية على المحتوى و service worker - Iraq-Store
+
+index.html كان يحمّل data/listing.js و data/search.js بأسماء ثابتة، فكل
+زيارة تعيد التحقق منها على الشبكة، ونسخة قديمة في الكاش تعني أسعاراً قديمة.
+بعد كل بناء (generate_products.py):
+
+- fingerprint_assets: لكل ملف في FINGERPRINTED نسخة في assets/ باسم
+  <الاسم>.<hash>.js (مع .gz و .br)، والنسخ القديمة تُحذف. الاسم يتغير مع
+  المحتوى فيمكن تخزينه في الكاش بلا حدود (مثل assets/product.<hash>.css)
+- rewrite_references: index.html و page/<n>.html (من listing_pages.py) و products/index.html
+  (مكتوبة يدوياً) تشير إلى الأسماء الجديدة (المرجع الأصلي data/listing.js أو أي اسم سابق)،
+  ونسخ page/ المضغوطة تُكتب بعد ذلك
+- write_service_worker: sw.js من templates/sw.js مع قائمة precache ونسخة الموقع
+  (VERSION). الصفحة الرئيسية وملفاتها وأول صفحات الترقيم من الكاش مباشرة في
+  الزيارات التالية، وصفحات المنتجات وباقي page/ تُحفظ عند أول زيارة وتُحذف كلها
+  عند تغيّر VERSION
+
+الملفات بالأسماء الثابتة تبقى كما هي للأدوات الأخرى.
+"""
+
+import hashlib
+import os
+import re
+
+from build_io import (PRECOMPRESSED_SUFFIXES, file_digest, remove_with_siblings, sync_precompressed,
+                      write_chunks_if_changed, write_if_changed, write_page)
+from facet_index import FACETS_FILE
+from listing_index import LISTING_FILE
+from page_template import load_template
+from search_index import SEARCH_FILE
+
+ASSETS_DIR = 'assets'
+SERVICE_WORKER_FILE = 'sw.js'
+HASH_LENGTH = 10
+
+# (المسار نسبةً لجذر الموقع، precache؟): products.js كبير ولا تحتاجه الصفحة الرئيسية
+FINGERPRINTED = (
+    (LISTING_FILE.replace(os.sep, '/'), True),
+    (SEARCH_FILE.replace(os.sep, '/'), True),
+    (FACETS_FILE.replace(os.sep, '/'), True),
+    ('products.js', False),
+)
+REWRITTEN_PAGES = ('index.html', 'products/index.html')
+# صفحات الترقيم page/2.html ... التي تُحمَّل مع التثبيت (كلها قد تكون مئات الصفحات مع كتالوج كبير)
+PRECACHED_LISTING_PAGES = 4
+
+# للمعاينة المحلية: يحذف الكاش ويلغي تسجيل أي service worker سابق حتى لا تُعرض صفحات قديمة
+UNREGISTER_WORKER = """self.addEventListener('install', () => self.skipWaiting());
+self.addEventListener('activate', event => event.waitUntil(caches.keys()
+    .then(keys => Promise.all(keys.map(key => caches.delete(key))))
+    .then(() => self.registration.unregister())));
+"""
+
+
+def hashed_name(path, digest):
+    """data/listing.js ← assets/listing.<hash>.js"""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    return f"{ASSETS_DIR}/{stem}.{digest[:HASH_LENGTH]}{ext}"
+
+
+def copy_file(source, target):
+    """نسخ ملف على أجزاء إذا اختلف المحتوى، يعيد True عند الكتابة"""
+    with open(source, 'rb') as f:
+        return write_chunks_if_changed(target, iter(lambda: f.read(1 << 16), b''))
+
+
+def fingerprint_assets(site_dir='.'):
+    """
+    كتابة النسخ ذات الأسماء المبنية على المحتوى وحذف القديمة منها
+    يعيد ({المسار الأصلي: المسار الجديد}، عدد الملفات المكتوبة)
+    """
+    mapping = {}
+    written = 0
+    for name, _ in FINGERPRINTED:
+        source = os.path.join(site_dir, *name.split('/'))
+        digest = file_digest(source)
+        if digest is None:
+            continue
+        mapping[name] = hashed_name(name, digest)
+        target = os.path.join(site_dir, *mapping[name].split('/'))
+        # نفس الاسم = نفس المحتوى: لا حاجة للمقارنة إذا كانت كل النسخ موجودة
+        for suffix in ('', *PRECOMPRESSED_SUFFIXES):
+            if os.path.exists(source + suffix) and not os.path.exists(target + suffix):
+                written += copy_file(source + suffix, target + suffix)
+
+        stem, ext = os.path.splitext(os.path.basename(name))
+        stale_re = re.compile(rf'^{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(ext)}$')
+        assets_dir = os.path.dirname(target)
+        for filename in os.listdir(assets_dir):
+            if stale_re.match(filename) and f"{ASSETS_DIR}/{filename}" != mapping[name]:
+                remove_with_siblings(os.path.join(assets_dir, filename))
+    return mapping, written
+
+
+def references_re(names):
+    """
+    مرجع لأحد الملفات في src/href: الاسم الأصلي أو أي نسخة مبنية على المحتوى، مع ../ اختيارية
+    المجموعة ref<n> تحدد الملف names[n]
+    """
+    alternatives = []
+    for n, name in enumerate(names):
+        stem, ext = os.path.splitext(os.path.basename(name))
+        hashed = rf'{ASSETS_DIR}/{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(ext)}'
+        alternatives.append(f'(?P<ref{n}>{re.escape(name)}|{hashed})')
+    # تعبير واحد لكل الملفات يبدأ بعلامة التنصيص (لا lookbehind يُجرَّب عند كل حرف):
+    # أسرع بعدة مرات مع مئات صفحات page/ في كتالوج كبير
+    return re.compile(rf'''(["'](?:\.\./)*)(?:{'|'.join(alternatives)})(?=["'])''')
+
+
+def rewrite_references(path, mapping):
+    """تحديث المراجع في صفحة HTML إلى الأسماء الجديدة، يعيد True عند الكتابة"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        page_html = f.read()
+    names = list(mapping)
+    new_html = references_re(names).sub(
+        lambda match: match.group(1) + mapping[names[int(match.lastgroup[len('ref'):])]], page_html)
+    if new_html == page_html:
+        return False
+    write_page(path, new_html)
+    return True
+
+
+def precache_entries(site_dir, mapping, extra=(), listing_pages=()):
+    """
+    [[المسار، revision]] للصفحة الرئيسية وملفاتها وأول PRECACHED_LISTING_PAGES صفحة ترقيم
+    (revision = None للأسماء المبنية على المحتوى)
+    """
+    entries = [['./', file_digest(os.path.join(site_dir, 'index.html'))[:HASH_LENGTH]]]
+    entries += [[mapping[name], None] for name, precache in FINGERPRINTED if precache and name in mapping]
+    entries += [[path, None] for path in extra]
+    for name in listing_pages[:PRECACHED_LISTING_PAGES]:
+        digest = file_digest(os.path.join(site_dir, *name.split('/')))
+        if digest is not None:
+            entries.append([name, digest[:HASH_LENGTH]])
+    return entries
+
+
+def site_version(precache, pages_digest):
+    """نسخة الموقع: تتغير مع أي ملف في precache أو أي صفحة منتج"""
+    digest = hashlib.sha256(repr(precache).encode('utf-8'))
+    digest.update(pages_digest.encode('utf-8'))
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def write_service_worker(site_dir, precache, pages_digest):
+    """كتابة sw.js إذا تغيّر، يعيد True عند الكتابة"""
+    text = load_template(SERVICE_WORKER_FILE).render({
+        'version': site_version(precache, pages_digest),
+        'precache': precache,
+    })
+    return write_if_changed(os.path.join(site_dir, SERVICE_WORKER_FILE), text)
+
+
+def sync_site(site_dir, pages_digest, extra_precache=(), listing_pages=(), rewrite_listing=True):
+    """
+    الخطوات الثلاث بعد كتابة ملفات الفهرس: النسخ المبنية على المحتوى، ثم المراجع
+    في index.html و products/index.html وصفحات الترقيم، ثم sw.js
+    listing_pages: مسارات page/<n>.html بالترتيب (من listing_pages.write_listing_pages)
+    rewrite_listing=False: مراجعها محدّثة من بناء سابق (لم يتغير الفهرس ولا الصفحات)، تُستخدم لـ precache فقط
+    يعيد ({الأصلي: الجديد}، عدد الملفات المكتوبة)
+    """
+    mapping, written = fingerprint_assets(site_dir)
+    for page in REWRITTEN_PAGES:
+        path = os.path.join(site_dir, *page.split('/'))
+        if os.path.exists(path):
+            written += rewrite_references(path, mapping)
+    for page in listing_pages if rewrite_listing else ():
+        path = os.path.join(site_dir, *page.split('/'))
+        if os.path.exists(path):
+            changed = rewrite_references(path, mapping)
+            written += changed + sync_precompressed(path, changed)
+    if os.path.exists(os.path.join(site_dir, 'index.html')):
+        precache = precache_entries(site_dir, mapping, extra_precache, list(listing_pages))
+        written += write_service_worker(site_dir, precache, pages_digest)
+    return mapping, written
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+الموقع كاملاً في أرشيف واحد (tar أو tar.gz أو zip) - Iraq-Store
+
+بدلاً من كتابة آلاف الملفات الصغيرة ثم فحص git وخطوة النشر لكل واحد منها،
+يكتب generate_products.py --archive site.tar.gz الصفحات (ونسخها المضغوطة)
+في ملف مؤقت واحد (spool) أثناء البناء، ثم يكتب الأرشيف مرة واحدة في النهاية
+مع ملفات الفهرس وخريطة الموقع والملفات الثابتة.
+
+الأرشيف قابل للتكرار (نفس المدخلات = نفس البايتات):
+- المدخلات مرتبة بالاسم، ووقت التعديل ثابت (SOURCE_DATE_EPOCH أو 1980-01-01)
+- بدون مالك أو مجموعة، صلاحيات 0644، ورأس gzip بدون اسم ملف أو وقت
+- أول مدخل site-manifest.json: [الاسم، الحجم، sha256] لكل ملف
+
+المزامنة تكتب فقط الملفات التي يختلف محتواها عن الموجود على القرص:
+python site_archive.py sync site.tar.gz --target . [--delete]
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+
+from build_io import PRECOMPRESSED_SUFFIXES, write_chunks_if_changed
+
+ARCHIVE_MANIFEST = 'site-manifest.json'
+ARCHIVE_VERSION = 1
+DEFAULT_EPOCH = 315532800  # 1980-01-01: أقدم تاريخ يقبله zip
+ARCHIVE_FORMATS = (('.tar.gz', 'tgz'), ('.tgz', 'tgz'), ('.tar', 'tar'), ('.zip', 'zip'))
+
+# ملفات مضغوطة أصلاً: تُخزَّن في zip بدون ضغط ثانٍ
+STORED_SUFFIXES = ('.gz', '.br', '.jpg', '.png', '.webp')
+
+# صفحات مكتوبة يدوياً لا يحذفها sync --delete حتى لو لم تكن في الأرشيف
+KEEP_FILES = frozenset({'products/index.html'})
+
+
+def archive_format(path):
+    """'tar' أو 'tgz' أو 'zip' حسب امتداد الملف"""
+    for suffix, kind in ARCHIVE_FORMATS:
+        if path.endswith(suffix):
+            return kind
+    raise ValueError(f"امتداد أرشيف غير معروف: {path} (المدعوم: .tar .tar.gz .tgz .zip)")
+
+
+def archive_mtime():
+    """وقت التعديل الثابت لكل المدخلات"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    return max(int(epoch), DEFAULT_EPOCH) if epoch else DEFAULT_EPOCH
+
+
+def check_name(name):
+    """اسم مدخل نسبي بصيغة posix لا يخرج من مجلد الاستخراج"""
+    parts = name.split('/')
+    if not name or name.startswith('/') or '\\' in name or any(part in ('', '.', '..') for part in parts):
+        raise ValueError(f"اسم غير صالح في الأرشيف: {name!r}")
+    return parts
+
+
+class SiteArchive:
+    """
+    أرشيف يُبنى تدريجياً: add_bytes/add_path تكتب المحتوى في spool مؤقت
+    (آخر إضافة لنفس الاسم تفوز، كما عند الكتابة فوق الملف)، و close() يكتب
+    الأرشيف مرتباً. لا يبقى في الذاكرة إلا فهرس الأسماء.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.format = archive_format(path)
+        self.spool = tempfile.TemporaryFile()
+        self.entries = {}
+
+    def add_bytes(self, name, data):
+        check_name(name)
+        if name == ARCHIVE_MANIFEST:
+            raise ValueError(f"{ARCHIVE_MANIFEST} اسم محجوز في الأرشيف")
+        offset = self.spool.seek(0, io.SEEK_END)
+        self.spool.write(data)
+        self.entries[name] = (offset, len(data), hashlib.sha256(data).hexdigest())
+
+    def add_file(self, name, path):
+        with open(path, 'rb') as f:
+            self.add_bytes(name, f.read())
+
+    def add_path(self, path, name):
+        """ملف (مع نسخه المضغوطة .gz/.br إن وُجدت) أو مجلد كامل تحت الاسم name"""
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for filename in sorted(files):
+                    if filename.endswith('.tmp'):
+                        continue
+                    full = os.path.join(root, filename)
+                    self.add_file(f"{name}/{os.path.relpath(full, path).replace(os.sep, '/')}", full)
+            return
+        for suffix in ('', *PRECOMPRESSED_SUFFIXES):
+            if os.path.isfile(path + suffix):
+                self.add_file(name + suffix, path + suffix)
+
+    def manifest(self):
+        files = [[name, size, digest] for name, (_, size, digest) in sorted(self.entries.items())]
+        text = json.dumps({'version': ARCHIVE_VERSION, 'files': files}, ensure_ascii=False, separators=(',', ':'))
+        return text.encode('utf-8')
+
+    def iter_entries(self):
+        yield ARCHIVE_MANIFEST, self.manifest()
+        for name in sorted(self.entries):
+            offset, size, _ = self.entries[name]
+            self.spool.seek(offset)
+            yield name, self.spool.read(size)
+
+    def close(self):
+        """كتابة الأرشيف (ملف مؤقت ثم os.replace) وحذف الـ spool، يعيد عدد الملفات"""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        try:
+            with open(tmp_path, 'wb') as raw:
+                if self.format == 'zip':
+                    write_zip(raw, self.iter_entries())
+                else:
+                    write_tar(raw, self.iter_entries(), compress=self.format == 'tgz')
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            self.spool.close()
+        return len(self.entries)
+
+
+def write_tar(raw, entries, compress=False, mtime=None):
+    """كتابة tar (أو tar.gz) متسلسل من (الاسم، المحتوى)"""
+    mtime = archive_mtime() if mtime is None else mtime
+    stream = gzip.GzipFile(filename='', mode='wb', fileobj=raw, compresslevel=9, mtime=0) if compress else raw
+    with tarfile.open(fileobj=stream, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+        for name, data in entries:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+    if compress:
+        stream.close()
+
+
+def write_zip(raw, entries, mtime=None):
+    """كتابة zip من (الاسم، المحتوى)"""
+    date_time = time.gmtime(archive_mtime() if mtime is None else mtime)[:6]
+    with zipfile.ZipFile(raw, 'w') as zf:
+        for name, data in entries:
+            info = zipfile.ZipInfo(name, date_time)
+            info.create_system = 3
+            info.external_attr = 0o644 << 16
+            if name.endswith(STORED_SUFFIXES):
+                zf.writestr(info, data, zipfile.ZIP_STORED)
+            else:
+                zf.writestr(info, data, zipfile.ZIP_DEFLATED, 9)
+
+
+def iter_archive(path):
+    """(الاسم، المحتوى) لكل ملف في الأرشيف بترتيبه (tar يُقرأ متسلسلاً)"""
+    if archive_format(path) == 'zip':
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if not info.is_dir():
+                    yield info.filename, zf.read(info)
+        return
+    with tarfile.open(path, 'r|*') as tar:
+        for member in tar:
+            if member.isfile():
+                yield member.name, tar.extractfile(member).read()
+
+
+def same_content(path, data):
+    """هل الملف على القرص مطابق للمحتوى؟ (الحجم أولاً، ثم المقارنة)"""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def sync_archive(path, target_dir='.', delete=False, keep=KEEP_FILES):
+    """
+    استخراج الأرشيف إلى target_dir مع كتابة الملفات المتغيرة فقط
+    كل ملف يُتحقق منه مقابل site-manifest.json قبل كتابته
+    delete=True يحذف من المجلدات الموجودة في الأرشيف الملفات التي لم تعد فيه (عدا keep)
+    يعيد {'written', 'unchanged', 'deleted'}
+    """
+    stats = {'written': 0, 'unchanged': 0, 'deleted': 0}
+    expected = None
+    names = set()
+    for name, data in iter_archive(path):
+        if name == ARCHIVE_MANIFEST:
+            expected = {entry[0]: entry[2] for entry in json.loads(data)['files']}
+            continue
+        parts = check_name(name)
+        if expected is not None and expected.get(name) != hashlib.sha256(data).hexdigest():
+            raise ValueError(f"{name}: المحتوى لا يطابق {ARCHIVE_MANIFEST}")
+        names.add(name)
+        target = os.path.join(target_dir, *parts)
+        if same_content(target, data):
+            stats['unchanged'] += 1
+        else:
+            write_chunks_if_changed(target, [data])
+            stats['written'] += 1
+    if expected is not None and names != expected.keys():
+        raise ValueError(f"الأرشيف ناقص: {len(expected.keys() - names)} ملف في {ARCHIVE_MANIFEST} غير موجود")
+
+    if delete:
+        for directory in sorted({name.rsplit('/', 1)[0] for name in names if '/' in name}):
+            full = os.path.join(target_dir, *directory.split('/'))
+            for filename in os.listdir(full):
+                name = f"{directory}/{filename}"
+                if name not in names and name not in keep and os.path.isfile(os.path.join(full, filename)):
+                    os.remove(os.path.join(full, filename))
+                    stats['deleted'] += 1
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='استخراج أرشيف الموقع المولّد')
+    commands = parser.add_subparsers(dest='command', required=True)
+    sync_parser = commands.add_parser('sync', help='كتابة الملفات المتغيرة فقط من الأرشيف')
+    sync_parser.add_argument('archive', help='site.tar أو site.tar.gz أو site.zip')
+    sync_parser.add_argument('--target', default='.', help='جذر الموقع')
+    sync_parser.add_argument('--delete', action='store_true',
+                             help='حذف الملفات التي لم تعد في الأرشيف من مجلداته (products/ و data/ ...)')
+    args = parser.parse_args(argv)
+
+    stats = sync_archive(args.archive, args.target, args.delete)
+    print(f"✅ {args.archive} → {args.target}: {stats['written']} ملف مكتوب، "
+          f"{stats['unchanged']} بدون تغيير، {stats['deleted']} محذوف")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
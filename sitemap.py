@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+خريطة الموقع (sitemap) المولّدة من البناء - Iraq-Store
+
+بدلاً من sitemap.xml المكتوب يدوياً، يكتب generate_products.py:
+
+- sitemap.xml: فهرس (sitemapindex) يشير إلى الخرائط الفرعية
+- sitemaps/sitemap-<n>.xml و sitemaps/sitemap-<n>.xml.gz: الروابط نفسها
+  (الصفحة الرئيسية ثم صفحات الترقيم page/<n>.html ثم صفحات المنتجات)
+  مقسّمة بحيث لا تتجاوز أي خريطة 50,000 رابط أو 50 MB (حدود البروتوكول)
+
+lastmod لكل صفحة يأتي من بصمة محتواها في .build-manifest.json: يتغير
+فقط عندما تتغير بيانات المنتج أو القالب (أو منتجات صفحة الترقيم)، فتعيد محركات البحث زيارة الصفحات
+المتغيرة فقط. الملفات غير المتغيرة لا تُعاد كتابتها.
+"""
+
+import os
+from datetime import date, datetime, timezone
+from urllib.parse import quote
+
+from build_io import iter_gzip, write_chunks_if_changed, write_if_changed
+from product_schema import SITE_URL
+
+SITEMAP_FILE = 'sitemap.xml'
+SITEMAPS_DIR = 'sitemaps'
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+
+URLSET_HEAD = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+               '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n').encode('utf-8')
+URLSET_TAIL = b'</urlset>\n'
+
+
+def build_date(today=None):
+    """تاريخ البناء: SOURCE_DATE_EPOCH إن وُجد (بناء قابل للتكرار)، وإلا تاريخ اليوم"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), tz=timezone.utc).date()
+    return today or date.today()
+
+
+def page_url(slug):
+    """رابط صفحة المنتج كما يجب أن يظهر في <loc> (مع ترميز الأحرف العربية)"""
+    return f"{SITE_URL}products/{quote(slug)}.html"
+
+
+def url_entry(loc, lastmod, changefreq='weekly', priority='0.8'):
+    """سطر <url> واحد بنفس تنسيق sitemap.xml القديم"""
+    return (f"<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod>"
+            f"<changefreq>{changefreq}</changefreq><priority>{priority}</priority></url>\n").encode('utf-8')
+
+
+def iter_entries(pages, listing_pages=()):
+    """
+    (سطر <url>، lastmod): الصفحة الرئيسية ثم صفحات الترقيم ثم صفحات المنتجات بالترتيب المعطى
+    listing_pages: قائمة (مسار الصفحة نسبةً لجذر الموقع مثل page/2.html، lastmod)
+    """
+    # الصفحة الرئيسية تعرض كل المنتجات: تتغير مع آخر منتج أو صفحة ترقيم تغيّرت
+    newest = max((lastmod for _, lastmod in (*pages, *listing_pages)), default=build_date().isoformat())
+    yield url_entry(SITE_URL, newest, 'daily', '1.0'), newest
+    for name, lastmod in listing_pages:
+        yield url_entry(f"{SITE_URL}{quote(name)}", lastmod, 'daily', '0.6'), lastmod
+    for slug, lastmod in pages:
+        yield url_entry(page_url(slug), lastmod), lastmod
+
+
+def split_sitemaps(entries, max_urls=MAX_URLS, max_bytes=MAX_BYTES):
+    """
+    تقسيم الأسطر إلى خرائط فرعية ضمن حدود البروتوكول
+    يعيد (الأسطر، أحدث lastmod) لكل خريطة فور امتلائها، فلا تبقى في الذاكرة إلا خريطة واحدة
+    """
+    limit = max_bytes - len(URLSET_HEAD) - len(URLSET_TAIL)
+    current, size, newest = [], 0, ''
+    for entry, lastmod in entries:
+        if current and (len(current) == max_urls or size + len(entry) > limit):
+            yield current, newest
+            current, size, newest = [], 0, ''
+        current.append(entry)
+        size += len(entry)
+        newest = max(newest, lastmod)
+    if current:
+        yield current, newest
+
+
+def write_sitemaps(pages, site_dir='.', max_urls=MAX_URLS, max_bytes=MAX_BYTES, listing_pages=()):
+    """
+    كتابة الخرائط الفرعية (.xml و .xml.gz) وفهرس sitemap.xml وحذف الخرائط الزائدة
+    pages: قائمة (slug، lastmod بصيغة YYYY-MM-DD) بالترتيب المطلوب
+    listing_pages: قائمة (page/<n>.html، lastmod) لصفحات الترقيم (index.html هي الصفحة الرئيسية)
+    يعيد عدد الملفات التي كُتبت
+    """
+    sitemaps_dir = os.path.join(site_dir, SITEMAPS_DIR)
+    written = 0
+    count = 0
+    index = ['<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+    for n, (entries, newest) in enumerate(split_sitemaps(iter_entries(pages, listing_pages), max_urls, max_bytes), 1):
+        count = n
+        path = os.path.join(sitemaps_dir, f"sitemap-{n}.xml")
+        chunks = [URLSET_HEAD, *entries, URLSET_TAIL]
+        written += write_chunks_if_changed(path, iter(chunks))
+        written += write_chunks_if_changed(f"{path}.gz", iter_gzip(chunks))
+        index.append(f"<sitemap><loc>{SITE_URL}{SITEMAPS_DIR}/sitemap-{n}.xml.gz</loc>"
+                     f"<lastmod>{newest}</lastmod></sitemap>\n")
+    index.append('</sitemapindex>\n')
+    written += write_if_changed(os.path.join(site_dir, SITEMAP_FILE), ''.join(index))
+
+    # حذف الخرائط الزائدة إذا صغر الكتالوج
+    if os.path.isdir(sitemaps_dir):
+        for name in os.listdir(sitemaps_dir):
+            stem = name.split('.', 1)[0]
+            number = stem[len('sitemap-'):]
+            if stem.startswith('sitemap-') and number.isdigit() and int(number) > count:
+                os.remove(os.path.join(sitemaps_dir, name))
+
+    return written
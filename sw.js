@@ -0,0 +1,72 @@
+// Service worker متجر العراق - يولّده generate_products.py (service_worker.py)، لا تعدّله يدوياً
+// VERSION يتغير مع أي تغيّر في الكتالوج أو القالب أو ملفات PRECACHE
+const VERSION = "9bb5c8f9a3";
+const CACHE = 'iraq-store-' + VERSION;
+const CACHE_PREFIX = 'iraq-store-';
+
+// [المسار نسبةً لجذر الموقع، revision]؛ revision = null للملفات ذات الأسماء المبنية على المحتوى
+const PRECACHE = [["./","7148d1650a"],["assets/listing.083a380af0.js",null],["assets/search.00c87d1888.js",null],["assets/facets.11a2100ef0.js",null],["assets/product.d0a4ffb809.css",null],["page/2.html","19d9ba0eef"],["page/3.html","6e12b6105f"],["page/4.html","1439ca1f61"],["page/5.html","1885323d0c"]];
+
+// ملفات لا يتغير محتواها أبداً تحت نفس الرابط: assets/ و img/ وأجزاء التفاصيل ?v=
+const IMMUTABLE = /^(?:assets\/[\w-]+\.[0-9a-f]{10}\.(?:js|css)|img\/[0-9a-f]{16}-\d+\.jpg|data\/details\/\d+\.json\?v=[0-9a-f]+)$/;
+const PAGE = /^(?:products\/[^/?#]+|page\/\d+)\.html$/;
+
+function scoped(url) {
+    const scope = self.registration.scope;
+    return url.startsWith(scope) ? url.slice(scope.length) : null;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil(caches.open(CACHE).then(cache => Promise.all(PRECACHE.map(([path, revision]) => {
+        const url = new URL(path, self.registration.scope).href;
+        // الملفات ذات الأسماء المبنية على المحتوى تُنقل من كاش النسخة السابقة بدون تحميل
+        const cached = revision === null ? caches.match(url) : Promise.resolve(undefined);
+        return cached.then(response => response
+            ? cache.put(url, response)
+            : fetch(url, {cache: 'reload'}).then(fresh => {
+                if (!fresh.ok) {
+                    throw new Error(`${path}: ${fresh.status}`);
+                }
+                return cache.put(url, fresh);
+            }));
+    }))).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(caches.keys()
+        .then(keys => Promise.all(keys
+            .filter(key => key.startsWith(CACHE_PREFIX) && key !== CACHE)
+            .map(key => caches.delete(key))))
+        .then(() => self.clients.claim()));
+});
+
+// من الكاش أولاً؛ عند عدم وجوده من الشبكة مع حفظ النسخة للزيارة التالية
+function cacheFirst(request, key) {
+    return caches.open(CACHE).then(cache => cache.match(key).then(cached => cached || fetch(request).then(response => {
+        if (response.ok) {
+            cache.put(key, response.clone());
+        }
+        return response;
+    })));
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') {
+        return;
+    }
+    const path = scoped(request.url);
+    if (path === null) {
+        return;
+    }
+    const page = path.split(/[?#]/)[0];
+    if (request.mode === 'navigate' && (page === '' || page === 'index.html')) {
+        // الصفحة الرئيسية (مع أي ?q= للبحث) من الـ precache
+        event.respondWith(cacheFirst(request, new URL('./', self.registration.scope).href));
+    } else if (IMMUTABLE.test(path)) {
+        event.respondWith(cacheFirst(request, request.url));
+    } else if (PAGE.test(page)) {
+        // صفحات المنتجات وصفحات الترقيم page/: كاش النسخة الحالية يُحذف عند أي تغيّر في الكتالوج (VERSION)
+        event.respondWith(cacheFirst(request, new URL(page, self.registration.scope).href));
+    }
+});
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+البناء الكامل (generate_products.build) على كتالوج فيه صفوف غير صالحة،
+قراءة الكتالوج بصيغتيه، وقابلية تكرار الأرشيف (site_archive.py)
+
+python -m pytest tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import iter_products  # noqa: E402
+from generate_products import build  # noqa: E402
+from site_archive import SiteArchive, iter_archive  # noqa: E402
+
+PRODUCTS = [
+    {'id': 1, 'title': 'خلاط كهربائي', 'price': 90000, 'sale_price': 70000, 'slug': 'خلاط-كهربائي',
+     'description': 'خلاط بقوة 500 واط'},
+    {'id': 2, 'title': None, 'description': None, 'price': 80000, 'sale_price': 60000, 'slug': 'بدون-عنوان'},
+    {'id': 3, 'title': 'مكواة', 'price': 50000, 'sale_price': 45000.5, 'slug': 'مكواة'},
+    {'id': 4, 'title': 'سماعة', 'price': 1, 'sale_price': 500000, 'slug': 'سماعة'},
+    {'id': 5, 'title': 'خارج المجلد', 'price': 1000, 'sale_price': 900, 'slug': '../escaped'},
+    {'id': 6, 'title': 'مجلد فرعي', 'price': 1000, 'sale_price': 900, 'slug': 'a/b'},
+    {'id': 7, 'title': 'ملف مخفي', 'price': 1000, 'sale_price': 900, 'slug': '.hidden'},
+    {'id': 8, 'title': 'صفحة المنتجات', 'price': 1000, 'sale_price': 900, 'slug': 'index'},
+    7,
+    {'id': 10, 'title': 'شاحن', 'price': 20000, 'sale_price': 15000, 'slug': 'شاحن'},
+]
+VALID_SLUGS = {'خلاط-كهربائي', 'بدون-عنوان', 'مكواة', 'سماعة', 'شاحن'}
+
+
+def write_jsonl(path, products):
+    with open(path, 'w', encoding='utf-8') as f:
+        for product in products:
+            f.write(json.dumps(product, ensure_ascii=False) + '\n')
+
+
+def read_js_object(path, name):
+    """const <name> = {...}; ← القاموس"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start = text.index(f"const {name} = ") + len(f"const {name} = ")
+    return json.loads(text[start:text.rindex(';')])
+
+
+class BuildTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.site = os.path.join(self.tmp.name, 'site')
+        self.output = os.path.join(self.site, 'products')
+        self.catalog = os.path.join(self.tmp.name, 'catalog.jsonl')
+        write_jsonl(self.catalog, PRODUCTS)
+
+    def build(self, **kwargs):
+        return build(self.catalog, self.output, os.path.join(self.tmp.name, 'manifest.json'), site_dir=self.site,
+                     verbose=False, image_mirror=os.path.join(self.tmp.name, 'img'),
+                     image_cache=os.path.join(self.tmp.name, 'image-cache.json'),
+                     lint_file=os.path.join(self.tmp.name, 'lint.json'), **kwargs)
+
+    def test_bad_rows_are_errors(self):
+        stats, errors = self.build()
+        self.assertEqual(stats['total'], len(PRODUCTS))
+        self.assertEqual(stats['created'], len(VALID_SLUGS))
+        failed = {product_id for product_id, _ in errors}
+        self.assertTrue({5, 6, 7, 8, 9} <= failed, errors)
+        self.assertFalse(failed & {1, 2, 3, 4, 10}, errors)
+
+        pages = {name[:-len('.html')] for name in os.listdir(self.output) if name.endswith('.html')}
+        self.assertEqual(pages, VALID_SLUGS)
+        # لا شيء خارج products/ أو بداخل مجلد فرعي منه
+        self.assertFalse(os.path.exists(os.path.join(self.site, 'escaped.html')))
+        self.assertFalse(os.path.exists(os.path.join(self.output, 'a')))
+
+    def test_index_rows_aligned(self):
+        self.build()
+        listing = read_js_object(os.path.join(self.site, 'data', 'listing.js'), 'productIndex')
+        facets = read_js_object(os.path.join(self.site, 'data', 'facets.js'), 'facetIndex')
+        search = read_js_object(os.path.join(self.site, 'data', 'search.js'), 'searchIndex')
+        self.assertEqual([row[0] for row in listing['rows']], [1, 2, 3, 4, 10])
+        self.assertEqual(facets['rows'], len(listing['rows']))
+        # آخر صف في قوائم البحث (مرمّزة بالفروق) ضمن صفوف data/listing.js
+        self.assertLess(max(sum(rows) for rows in search['postings']), len(listing['rows']))
+
+    def test_noop_rebuild(self):
+        self.build()
+        stats, errors = self.build()
+        self.assertEqual(stats['unchanged'], len(VALID_SLUGS))
+        self.assertEqual(stats['listing_files'], 0)
+        self.assertEqual(stats['sitemap_files'], 0)
+        self.assertIsNone(stats['lint'])
+
+
+class CatalogTest(unittest.TestCase):
+
+    def test_array_and_lines(self):
+        products = [product for product in PRODUCTS if isinstance(product, dict)]
+        with tempfile.TemporaryDirectory() as tmp:
+            array_path = os.path.join(tmp, 'catalog.json')
+            with open(array_path, 'w', encoding='utf-8') as f:
+                json.dump(products, f, ensure_ascii=False, indent=2)
+            lines_path = os.path.join(tmp, 'catalog.jsonl')
+            write_jsonl(lines_path, products)
+            self.assertEqual(list(iter_products(array_path)), products)
+            self.assertEqual(list(iter_products(lines_path)), products)
+            # تحديد الصيغة من أول حرف عندما لا يدل الامتداد عليها
+            os.rename(lines_path, os.path.join(tmp, 'lines.json'))
+            self.assertEqual(list(iter_products(os.path.join(tmp, 'lines.json'))), products)
+
+
+class ArchiveTest(unittest.TestCase):
+
+    def write_archive(self, path, files):
+        archive = SiteArchive(path)
+        for name, data in files:
+            archive.add_bytes(name, data)
+        archive.close()
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_same_bytes_in_any_order(self):
+        files = [('index.html', 'الرئيسية'.encode('utf-8')), ('products/a.html', b'a'), ('data/listing.js', b'[]')]
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(os.environ, {'SOURCE_DATE_EPOCH': '1700000000'}):
+            for suffix in ('.tar', '.tar.gz', '.zip'):
+                with self.subTest(suffix=suffix):
+                    first = self.write_archive(os.path.join(tmp, f"one{suffix}"), files)
+                    second = self.write_archive(os.path.join(tmp, f"two{suffix}"), files[::-1])
+                    self.assertEqual(first, second)
+
+    def test_build_archive_repeatable(self):
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(os.environ, {'SOURCE_DATE_EPOCH': '1700000000'}):
+            catalog = os.path.join(tmp, 'catalog.jsonl')
+            write_jsonl(catalog, PRODUCTS)
+            archives = []
+            for run in ('one', 'two'):
+                site = os.path.join(tmp, run)
+                archive = os.path.join(tmp, f"{run}.tar.gz")
+                build(catalog, os.path.join(site, 'products'), os.path.join(tmp, f"{run}.json"), site_dir=site,
+                      verbose=False, image_mirror=os.path.join(tmp, 'img'),
+                      image_cache=os.path.join(tmp, f"{run}-images.json"),
+                      archive=archive, lint=False)
+                with open(archive, 'rb') as f:
+                    archives.append(f.read())
+            self.assertEqual(archives[0], archives[1])
+            names = [name for name, _ in iter_archive(os.path.join(tmp, 'one.tar.gz'))]
+            self.assertIn('products/شاحن.html', names)
+            self.assertFalse([name for name in names if 'escaped' in name or name.startswith('products/a/')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+حالات الحدود في فهارس الشبكة والبحث والفلاتر وفحص الكتالوج:
+أسعار float أو فارغة، خصم خارج حدود array('h')، عنوان null، و slug يخرج من products/
+
+python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog_lint import CatalogLinter, slug_problem  # noqa: E402
+from facet_index import INT16_RANGE, INT64_RANGE, FacetIndexBuilder, sort_value  # noqa: E402
+from listing_index import ListingIndexBuilder  # noqa: E402
+from product_schema import discount_percent  # noqa: E402
+from search_index import SearchIndexBuilder  # noqa: E402
+
+
+class FacetIndexTest(unittest.TestCase):
+
+    def test_float_sale_price(self):
+        facets = FacetIndexBuilder()
+        facets.add({'id': 1, 'price': 90000, 'sale_price': 70500.5})
+        self.assertEqual(facets.sale_prices[0], 70500)
+        self.assertEqual(facets.index()['rows'], 1)
+
+    def test_missing_and_invalid_prices(self):
+        facets = FacetIndexBuilder()
+        for product in ({'id': 1}, {'id': 2, 'price': None, 'sale_price': None}, {'id': 3, 'sale_price': 'غير معروف'}):
+            facets.add(product)
+        self.assertEqual(list(facets.sale_prices), [0, 0, 0])
+        self.assertEqual(list(facets.discounts), [0, 0, 0])
+
+    def test_discount_clamped_to_int16(self):
+        facets = FacetIndexBuilder()
+        # خصم سالب ضخم: السعر بعد الخصم أكبر بكثير من السعر الأصلي
+        facets.add({'id': 1, 'price': 1, 'sale_price': 500000})
+        facets.add({'id': 2, 'price': 1, 'sale_price': -500000})
+        self.assertEqual(list(facets.discounts), [INT16_RANGE[0], INT16_RANGE[1]])
+
+    def test_sort_value_bounds(self):
+        self.assertEqual(sort_value(10 ** 30), INT64_RANGE[1])
+        self.assertEqual(sort_value(float('inf')), 0)
+        self.assertEqual(sort_value(float('nan')), 0)
+        self.assertEqual(sort_value('12'), 12)
+
+
+class NullTitleTest(unittest.TestCase):
+    product = {'id': 7, 'title': None, 'description': None, 'price': 1000, 'sale_price': 900, 'slug': 'x'}
+
+    def test_search(self):
+        search = SearchIndexBuilder()
+        search.add(self.product)
+        self.assertEqual(search.rows, 1)
+        self.assertEqual(search.postings, {})
+
+    def test_listing(self):
+        listing = ListingIndexBuilder('/nonexistent')
+        row, details = listing.entry(self.product, 1)
+        self.assertEqual(row[1], '')
+        self.assertEqual(details, {'description': None})
+
+    def test_lint(self):
+        linter = CatalogLinter()
+        linter.add(self.product, 1)
+        report = linter.report()
+        self.assertEqual(report['errors'], [])
+        self.assertEqual(report['products'], 1)
+
+    def test_discount(self):
+        self.assertEqual(discount_percent({'price': None, 'sale_price': 900}), 0)
+        self.assertEqual(discount_percent({'price': 0, 'sale_price': 900}), 0)
+        # التقريب للأعلى عند النصف مثل Math.round
+        self.assertEqual(discount_percent({'price': 200, 'sale_price': 199}), 1)
+
+
+class SlugTest(unittest.TestCase):
+
+    def test_invalid(self):
+        for slug in ('../x', 'a/b', '.x', '.', '..', '', 'a\\b', ['list'], None):
+            with self.subTest(slug=slug):
+                self.assertEqual(slug_problem(slug), 'invalid')
+
+    def test_reserved(self):
+        self.assertEqual(slug_problem('index'), 'reserved')
+
+    def test_valid(self):
+        for slug in ('خلاط-كهربائي', 'product-12', 12, 'a.b'):
+            with self.subTest(slug=slug):
+                self.assertIsNone(slug_problem(slug))
+
+    def test_lint_reports_unhashable_slug(self):
+        linter = CatalogLinter()
+        linter.add({'id': 1, 'title': 'خلاط', 'slug': ['list']}, 1)
+        linter.add({'id': 2, 'title': 'مكواة', 'slug': '../x'}, 2)
+        report = linter.report()
+        self.assertEqual([error['id'] for error in report['errors']], [1])
+        self.assertEqual([(issue['kind'], issue['slug']) for issue in report['slug_issues']], [('invalid', '../x')])
+
+
+if __name__ == '__main__':
+    unittest.main()